@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Mode batch: analisis banyak laporan Word sekaligus di process pool.
+
+Masukan berupa folder (semua Laporan_*.docx di dalamnya), pola glob, atau
+file .docx. Tiap dokumen diolah di proses pekerja (tahap map): dokumen
+dimuat sekali lewat muat_dokumen, lalu paragrafnya -> statistik, data
+artikel, dan frekuensi kata kunci + jumlah per tema. Parsing memakai
+cache_dokumen, jadi dokumen yang belum berubah tidak di-parse ulang,
+dan dokumen yang berubah hanya diekstrak ulang di paragraf yang berubah
+(statistik diff masuk ke ringkasan). Hasil per
+dokumen lalu digabung (tahap reduce):
+- data artikel semua dokumen dalam satu CSV/JSON dengan kolom 'sumber'
+- frekuensi kata kunci dan tema dijumlahkan (Counter) ke ringkasan JSON
+
+Cara menjalankan:
+    python3 analisis_batch.py laporan/
+    python3 analisis_batch.py "laporan/Laporan_*_2025*.docx" --proses 4
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from analisis_dokumen import hitung_statistik, hitung_tema
+from cache_dokumen import muat_dokumen
+from diff_dokumen import ringkasan_diff
+
+POLA_DEFAULT = 'Laporan_*.docx'
+KOLOM_CSV = ['sumber', 'no', 'judul', 'tanggal', 'media', 'link', 'ringkasan', 'kutipan']
+
+
+def cari_dokumen(masukan, pola=POLA_DEFAULT):
+    """Daftar file .docx (terurut, tanpa duplikat) dari folder, pola glob, atau path file"""
+    hasil = []
+    for item in masukan:
+        if os.path.isdir(item):
+            hasil.extend(glob.glob(os.path.join(item, pola)))
+        elif glob.has_magic(item):
+            hasil.extend(glob.glob(item))
+        else:
+            hasil.append(item)
+    # File kunci Word (~$...) bukan dokumen
+    return sorted({os.path.normpath(p) for p in hasil if not os.path.basename(p).startswith('~$')})
+
+
+def olah_dokumen(file_path):
+    """Tahap map: analisis satu dokumen (dijalankan di proses pekerja)"""
+    try:
+        # Parse (atau muat dari cache) sekali; statistik, artikel dan kata kunci memakai data yang sama
+        data = muat_dokumen(file_path)
+        teks = [t for t, gaya in data.paragraf if t.strip()]
+        artikel = data.artikel
+        kata_freq = data.kata_freq
+    except Exception as e:
+        return {'sumber': file_path, 'success': False, 'error': str(e)}
+    return {
+        'sumber': file_path,
+        'success': True,
+        'statistik': {**hitung_statistik(teks), 'jumlah_kutipan': len(data.kutipan)},
+        'artikel': [{'sumber': file_path, **a} for a in artikel],
+        'kata_freq': kata_freq,
+        'tema': hitung_tema(kata_freq),
+        'diff': data.diff,
+    }
+
+
+def gabung_hasil(hasil_list):
+    """Tahap reduce: gabung artikel dan jumlahkan frekuensi kata kunci/tema semua dokumen"""
+    artikel, kata_freq, tema = [], Counter(), Counter()
+    for hasil in hasil_list:
+        if not hasil['success']:
+            continue
+        artikel.extend(hasil['artikel'])
+        kata_freq.update(hasil['kata_freq'])
+        tema.update(hasil['tema'])
+    return artikel, kata_freq, tema
+
+
+def jalankan_batch(file_list, jumlah_proses=None):
+    """olah_dokumen untuk semua file di process pool; hasil sesuai urutan file_list"""
+    if len(file_list) <= 1 or jumlah_proses == 1:
+        return [olah_dokumen(p) for p in file_list]
+    with ProcessPoolExecutor(max_workers=jumlah_proses) as executor:
+        return list(executor.map(olah_dokumen, file_list))
+
+
+def simpan_ke_csv(artikel_list, output_file):
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=KOLOM_CSV)
+        writer.writeheader()
+        for artikel in artikel_list:
+            writer.writerow(artikel)
+
+
+def simpan_ke_json(data, output_file):
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analisis batch banyak laporan Word di process pool')
+    parser.add_argument('masukan', nargs='*', default=['.'],
+                        help='folder, pola glob, atau file .docx (default: folder ini)')
+    parser.add_argument('--pola', default=POLA_DEFAULT, help='pola nama file untuk masukan berupa folder')
+    parser.add_argument('--proses', type=int, default=None, help='jumlah proses pekerja (default: jumlah CPU)')
+    parser.add_argument('--output', default='data_artikel_batch',
+                        help='awalan nama file output (.csv, .json, _ringkasan.json)')
+    args = parser.parse_args()
+
+    print("="*70)
+    print("ANALISIS BATCH DOKUMEN WORD")
+    print("="*70)
+
+    file_list = cari_dokumen(args.masukan, args.pola)
+    if not file_list:
+        print(f"\n❌ Tidak ada dokumen yang cocok: {' '.join(args.masukan)}")
+        return
+    print(f"\n📂 {len(file_list)} dokumen ditemukan\n")
+
+    hasil_list = jalankan_batch(file_list, args.proses)
+    for hasil in hasil_list:
+        if hasil['success']:
+            stats = hasil['statistik']
+            print(f"   ✓ {hasil['sumber']}: {len(hasil['artikel'])} artikel, "
+                  f"{stats['jumlah_kutipan']} kutipan, {stats['total_kata']:,} kata")
+            if hasil['diff'] is not None:
+                print(f"     🔁 {ringkasan_diff(hasil['diff'])}")
+        else:
+            print(f"   ✗ {hasil['sumber']}: {hasil['error']}")
+
+    artikel_list, kata_freq, tema = gabung_hasil(hasil_list)
+
+    csv_file = f'{args.output}.csv'
+    json_file = f'{args.output}.json'
+    ringkasan_file = f'{args.output}_ringkasan.json'
+    simpan_ke_csv(artikel_list, csv_file)
+    simpan_ke_json(artikel_list, json_file)
+    simpan_ke_json({
+        'dokumen': [{'sumber': h['sumber'],
+                     **({**h['statistik'], 'diff': h['diff']} if h['success'] else {'error': h['error']})}
+                    for h in hasil_list],
+        'kata_kunci': dict(kata_freq.most_common()),
+        'tema': dict(tema),
+    }, ringkasan_file)
+
+    print(f"\n🔑 KATA KUNCI PALING SERING MUNCUL ({len(artikel_list)} artikel):")
+    for i, (kata, freq) in enumerate(kata_freq.most_common(10), 1):
+        print(f"   {i:2d}. {kata:20s} : {freq:3d}x")
+
+    print("\n🎯 ANALISIS TEMA:")
+    for tema_nama, count in tema.items():
+        print(f"   {tema_nama:20s} : {count:3d} kemunculan")
+
+    print("\n" + "="*70)
+    print("✅ ANALISIS BATCH SELESAI!")
+    print("="*70)
+    print("\nFile yang dihasilkan:")
+    print(f"  1. {csv_file}")
+    print(f"  2. {json_file}")
+    print(f"  3. {ringkasan_file}")
+
+
+if __name__ == "__main__":
+    main()
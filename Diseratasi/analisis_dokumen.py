@@ -4,18 +4,20 @@ Script untuk menganalisis dokumen Word:
 Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx
 """
 
-from docx import Document
+from cache_dokumen import muat_dokumen
 from collections import Counter
+import argparse
 import re
 
+FILE_DEFAULT = 'Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx'
+
 def baca_dokumen(file_path):
-    """Membaca dokumen Word dan mengekstrak teks"""
-    doc = Document(file_path)
+    """Membaca dokumen Word dan mengekstrak teks (dari cache_dokumen jika dokumen belum berubah)"""
     teks_lengkap = []
     
-    for para in doc.paragraphs:
-        if para.text.strip():
-            teks_lengkap.append(para.text)
+    for teks, gaya in muat_dokumen(file_path).paragraf:
+        if teks.strip():
+            teks_lengkap.append(teks)
     
     return teks_lengkap
 
@@ -40,6 +42,17 @@ def analisis_kata_kunci(kutipan_list):
     
     return Counter(semua_kata)
 
+TEMA_KEYWORDS = {
+    'Meditasi': ['meditation', 'meditative', 'mindfulness'],
+    'Kesehatan Mental': ['mental', 'clarity', 'balance', 'resilience'],
+    'Spiritual': ['spiritual', 'healing', 'wellness'],
+    'Retreat': ['retreat', 'sessions', 'program']
+}
+
+def hitung_tema(kata_freq, tema_keywords=TEMA_KEYWORDS):
+    """Jumlah kemunculan kata kunci per tema dari hasil analisis_kata_kunci"""
+    return {tema: sum(kata_freq.get(kw, 0) for kw in keywords) for tema, keywords in tema_keywords.items()}
+
 def hitung_statistik(teks_list):
     """Menghitung statistik dokumen"""
     total_paragraf = len(teks_list)
@@ -54,8 +67,13 @@ def hitung_statistik(teks_list):
         'jumlah_artikel': jumlah_artikel
     }
 
-def main():
-    file_path = 'Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx'
+def main(argv=None, data=None):
+    """argv: argumen baris perintah (default sys.argv); data: DataDokumen yang sudah dimuat (run_all_analysis)"""
+    parser = argparse.ArgumentParser(description='Analisis dokumen Word')
+    parser.add_argument('file', nargs='?', default=FILE_DEFAULT)
+    parser.add_argument('--sebelumnya', help='revisi sebelumnya; hanya paragraf yang berubah diekstrak ulang')
+    args = parser.parse_args(argv)
+    file_path = args.file
     
     print("="*70)
     print("ANALISIS DOKUMEN WORD")
@@ -64,7 +82,9 @@ def main():
     
     # Baca dokumen
     print("📖 Membaca dokumen...")
-    teks = baca_dokumen(file_path)
+    if data is None:
+        data = muat_dokumen(file_path, sebelumnya=args.sebelumnya)
+    teks = [t for t, gaya in data.paragraf if t.strip()]
     
     # Statistik dasar
     print("\n📊 STATISTIK DOKUMEN:")
@@ -73,14 +93,23 @@ def main():
     print(f"   Total Kata: {stats['total_kata']:,}")
     print(f"   Jumlah Artikel: {stats['jumlah_artikel']}")
     
+    if data.diff is not None:
+        print(f"\n🔁 PERUBAHAN DARI REVISI SEBELUMNYA ({data.diff['sebelumnya']}):")
+        print(f"   Blok sama      : {data.diff['sama']}")
+        print(f"   Blok diubah    : {data.diff['diubah']}")
+        print(f"   Blok disisipkan: {data.diff['disisipkan']}")
+        print(f"   Blok dihapus   : {data.diff['dihapus']}")
+        print(f"   Diproses ulang : {data.diff['diproses_ulang']} paragraf, "
+              f"{data.diff['artikel_diproses_ulang']} segmen artikel")
+    
     # Ekstrak kutipan
     print("\n💬 MENGEKSTRAK KUTIPAN VERBATIM...")
-    kutipan = ekstrak_kutipan(teks)
+    kutipan = data.kutipan
     print(f"   Total Kutipan Ditemukan: {len(kutipan)}")
     
     # Analisis kata kunci
     print("\n🔑 KATA KUNCI PALING SERING MUNCUL:")
-    kata_freq = analisis_kata_kunci(kutipan)
+    kata_freq = data.kata_freq
     top_10 = kata_freq.most_common(10)
     
     for i, (kata, freq) in enumerate(top_10, 1):
@@ -93,15 +122,7 @@ def main():
     
     # Analisis tema
     print("\n🎯 ANALISIS TEMA:")
-    tema_keywords = {
-        'Meditasi': ['meditation', 'meditative', 'mindfulness'],
-        'Kesehatan Mental': ['mental', 'clarity', 'balance', 'resilience'],
-        'Spiritual': ['spiritual', 'healing', 'wellness'],
-        'Retreat': ['retreat', 'sessions', 'program']
-    }
-    
-    for tema, keywords in tema_keywords.items():
-        count = sum(kata_freq.get(kw, 0) for kw in keywords)
+    for tema, count in hitung_tema(kata_freq).items():
         print(f"   {tema:20s} : {count:3d} kemunculan")
     
     print("\n" + "="*70)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Pembaca DOCX streaming untuk ekstraksi read-only.
+
+python-docx (Document()) mem-parse seluruh word/document.xml menjadi
+pohon objek sebelum doc.paragraphs bisa dibaca, sehingga waktu dan
+memori naik sebanding ukuran dokumen. Modul ini membaca
+word/document.xml langsung dari zip dengan iterparse, menghasilkan
+paragraf (beserta nama style) dan baris tabel satu per satu, lalu
+membuang elemen yang sudah diproses; memori hanya sebesar satu
+paragraf/baris terbesar.
+
+Hasilnya sama dengan python-docx:
+- iter_paragraf(path)  == doc.paragraphs  (teks = para.text, gaya = para.style.name)
+- iter_baris_tabel(path) mengikuti doc.tables -> table.rows, satu teks
+  per <w:tc> (cell.text); dengan grid=True sama dengan row.cells:
+  sel gridSpan diulang per kolom grid dan sel lanjutan vMerge berisi
+  teks sel awal gabungannya
+- iter_isi(path) menggabungkan keduanya sesuai urutan di dokumen
+
+Untuk tabel, pembacaan langsung ini menghindari pembuatan objek _Row /
+_Cell dan pencarian sel di atas (vMerge) oleh python-docx di setiap baris.
+
+Contoh:
+    from baca_docx import iter_paragraf
+    for para in iter_paragraf('Laporan.docx'):
+        print(para.gaya, para.teks)
+"""
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+TIPE_DOKUMEN = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+TIPE_STYLE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+
+_BODY, _P, _R, _HYPERLINK, _TBL, _TR, _TC = (W + t for t in ('body', 'p', 'r', 'hyperlink', 'tbl', 'tr', 'tc'))
+_T, _TAB, _PTAB, _BR, _CR, _NBH = (W + t for t in ('t', 'tab', 'ptab', 'br', 'cr', 'noBreakHyphen'))
+_PPR, _PSTYLE, _VAL, _TYPE = W + 'pPr', W + 'pStyle', W + 'val', W + 'type'
+_TRPR, _GRID_BEFORE, _TCPR, _GRID_SPAN, _VMERGE = (W + t for t in ('trPr', 'gridBefore', 'tcPr', 'gridSpan', 'vMerge'))
+
+# Nama internal styles.xml -> nama UI (sama dengan BabelFish python-docx)
+NAMA_UI = {'caption': 'Caption', 'footer': 'Footer', 'header': 'Header',
+           **{f'heading {i}': f'Heading {i}' for i in range(1, 10)}}
+
+Paragraf = namedtuple('Paragraf', 'teks gaya')
+BarisTabel = namedtuple('BarisTabel', 'tabel baris sel')
+
+
+def _path_bagian(zf, sumber, tipe, default):
+    """Path bagian paket dari relationship `tipe` milik `sumber` ('' = paket)"""
+    folder, nama = posixpath.split(sumber)
+    path_rels = posixpath.join(folder, '_rels', nama + '.rels')
+    try:
+        rels = ET.fromstring(zf.read(path_rels))
+    except KeyError:
+        return default
+    for rel in rels.iter(REL + 'Relationship'):
+        if rel.get('Type') == tipe and rel.get('TargetMode') != 'External':
+            target = rel.get('Target')
+            return target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(folder, target))
+    return default
+
+
+def _gaya_paragraf(zf, path_styles):
+    """(styleId -> nama UI untuk style paragraf, nama style paragraf default)"""
+    try:
+        akar = ET.fromstring(zf.read(path_styles))
+    except KeyError:
+        return {}, None
+    nama, default = {}, None
+    for style in akar.iter(W + 'style'):
+        if style.get(_TYPE, 'paragraph') != 'paragraph':
+            continue
+        elemen_nama = style.find(W + 'name')
+        teks = elemen_nama.get(_VAL) if elemen_nama is not None else None
+        teks = NAMA_UI.get(teks, teks)
+        nama[style.get(W + 'styleId')] = teks
+        if style.get(W + 'default') in ('1', 'true', 'on') and default is None:
+            default = teks
+    return nama, default
+
+
+def _teks_run(r):
+    bagian = []
+    for c in r:
+        tag = c.tag
+        if tag == _T:
+            bagian.append(c.text or '')
+        elif tag == _TAB or tag == _PTAB:
+            bagian.append('\t')
+        elif tag == _BR:
+            if c.get(_TYPE, 'textWrapping') == 'textWrapping':
+                bagian.append('\n')
+        elif tag == _CR:
+            bagian.append('\n')
+        elif tag == _NBH:
+            bagian.append('-')
+    return ''.join(bagian)
+
+
+def teks_paragraf(p):
+    """Teks elemen <w:p>: run dan hyperlink langsung, seperti Paragraph.text"""
+    bagian = []
+    for c in p:
+        if c.tag == _R:
+            bagian.append(_teks_run(c))
+        elif c.tag == _HYPERLINK:
+            bagian.extend(_teks_run(r) for r in c if r.tag == _R)
+    return ''.join(bagian)
+
+
+def teks_sel(tc):
+    """Teks elemen <w:tc>: paragraf langsung dipisah baris baru, seperti _Cell.text"""
+    return '\n'.join(teks_paragraf(p) for p in tc if p.tag == _P)
+
+
+def _nilai_int(elem, anak, default):
+    if elem is None:
+        return default
+    c = elem.find(anak)
+    if c is None:
+        return default
+    try:
+        return int(c.get(_VAL))
+    except (TypeError, ValueError):
+        return default
+
+
+def sel_grid(tr, atas):
+    """
+    Teks sel baris seperti row.cells python-docx. `atas` memetakan offset
+    grid -> (teks, gridSpan) sel awal di baris sebelumnya dan diperbarui
+    untuk baris ini (dipakai sel vMerge="continue" di baris berikutnya).
+    """
+    sel = []
+    offset = _nilai_int(tr.find(_TRPR), _GRID_BEFORE, 0)
+    baru = {}
+    for tc in tr:
+        if tc.tag != _TC:
+            continue
+        tcpr = tc.find(_TCPR)
+        span = max(1, _nilai_int(tcpr, _GRID_SPAN, 1))
+        vmerge = tcpr.find(_VMERGE) if tcpr is not None else None
+        if vmerge is not None and vmerge.get(_VAL, 'continue') == 'continue' and offset in atas:
+            # Sel lanjutan gabungan vertikal: isi dan lebar diambil dari sel awal di atasnya
+            teks, span = atas[offset]
+        else:
+            teks = teks_sel(tc)
+        baru[offset] = (teks, span)
+        sel.extend([teks] * span)
+        offset += span
+    atas.clear()
+    atas.update(baru)
+    return sel
+
+
+def iter_isi(path, paragraf=True, tabel=True, grid=False):
+    """
+    Paragraf dan BarisTabel tingkat body sesuai urutan dokumen. Paragraf di
+    dalam tabel ikut teks sel, tidak dihasilkan sebagai Paragraf (sama
+    dengan doc.paragraphs); tabel bersarang ikut sel tabel luarnya.
+    paragraf / tabel: jenis isi yang dihasilkan (yang lain dilewati tanpa
+    menghitung teksnya). grid: sel baris tabel seperti row.cells.
+    """
+    with zipfile.ZipFile(path) as zf:
+        path_dokumen = _path_bagian(zf, '', TIPE_DOKUMEN, 'word/document.xml')
+        nama_gaya, gaya_default = _gaya_paragraf(
+            zf, _path_bagian(zf, path_dokumen, TIPE_STYLE, posixpath.join(posixpath.dirname(path_dokumen), 'styles.xml')))
+
+        with zf.open(path_dokumen) as f:
+            leluhur = []            # elemen yang sedang terbuka (dari event start)
+            nomor_tabel, nomor_baris = -1, 0
+            atas = {}               # sel awal per offset grid di baris sebelumnya (mode grid)
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    if elem.tag == _TBL and leluhur and leluhur[-1].tag == _BODY:
+                        nomor_tabel += 1
+                        nomor_baris = 0
+                        atas = {}
+                    leluhur.append(elem)
+                    continue
+
+                leluhur.pop()
+                if not leluhur:
+                    break
+                induk = leluhur[-1]
+                if induk.tag == _BODY:
+                    if elem.tag == _P and paragraf:
+                        ppr = elem.find(_PPR)
+                        gaya = ppr.find(_PSTYLE) if ppr is not None else None
+                        style_id = gaya.get(_VAL) if gaya is not None else None
+                        yield Paragraf(teks_paragraf(elem), nama_gaya.get(style_id, gaya_default))
+                    # Elemen tingkat body selesai diproses: lepaskan dari pohon
+                    induk.remove(elem)
+                elif elem.tag == _TR and induk.tag == _TBL and len(leluhur) >= 2 and leluhur[-2].tag == _BODY:
+                    if tabel:
+                        sel = sel_grid(elem, atas) if grid else [teks_sel(tc) for tc in elem if tc.tag == _TC]
+                        yield BarisTabel(nomor_tabel, nomor_baris, sel)
+                    nomor_baris += 1
+                    induk.remove(elem)
+
+
+def iter_paragraf(path):
+    """Paragraf tingkat body (doc.paragraphs) sebagai Paragraf(teks, gaya)"""
+    return iter_isi(path, tabel=False)
+
+
+def iter_baris_tabel(path, grid=False):
+    """
+    Baris tabel tingkat body (doc.tables -> table.rows) sebagai
+    BarisTabel(tabel, baris, sel); grid=True: sel sama dengan row.cells
+    (gridSpan diulang, vMerge lanjutan berisi teks sel awal).
+    """
+    return iter_isi(path, paragraf=False, grid=grid)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark pembacaan dokumen Word: python-docx vs baca_docx (streaming).
+
+Dokumen uji dibuat dari laporan REVISI dengan menyalin isi body-nya
+berkali-kali (--salin), jadi struktur paragraf, style, dan tabelnya
+sama dengan dokumen asli tetapi ukurannya bisa diperbesar. Untuk setiap
+ukuran diukur waktu dan puncak alokasi Python (tracemalloc) untuk
+membaca semua paragraf + baris tabel, dan hasil kedua cara dibandingkan.
+
+Cara menjalankan:
+    python3 benchmark_baca_docx.py
+    python3 benchmark_baca_docx.py --salin 1 10 50
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+from docx import Document
+
+from baca_docx import BarisTabel, iter_isi
+
+FILE_DEFAULT = 'Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx'
+
+
+def buat_dokumen_besar(sumber, salin, tujuan):
+    """Salin isi body dokumen `salin` kali (sectPr tetap satu di akhir)"""
+    with zipfile.ZipFile(sumber) as zf:
+        xml = zf.read('word/document.xml').decode('utf-8')
+        awal = xml.index('>', xml.index('<w:body')) + 1
+        akhir = xml.rindex('</w:body>')
+        body = xml[awal:akhir]
+        sect = re.search(r'<w:sectPr[ >].*</w:sectPr>\s*$', body, re.S)
+        isi, penutup = (body[:sect.start()], sect.group()) if sect else (body, '')
+        xml_baru = xml[:awal] + isi * salin + penutup + xml[akhir:]
+        with zipfile.ZipFile(tujuan, 'w', zipfile.ZIP_DEFLATED) as keluar:
+            for item in zf.infolist():
+                data = xml_baru.encode('utf-8') if item.filename == 'word/document.xml' else zf.read(item)
+                keluar.writestr(item, data)
+
+
+def baca_python_docx(path):
+    doc = Document(path)
+    paragraf = [(p.text, p.style.name if p.style is not None else None) for p in doc.paragraphs]
+    baris = [[c.text for c in dict.fromkeys(r.cells)] for t in doc.tables for r in t.rows]
+    return paragraf, baris
+
+
+def baca_streaming(path):
+    paragraf, baris = [], []
+    for isi in iter_isi(path):
+        if type(isi) is BarisTabel:
+            baris.append(isi.sel)
+        else:
+            paragraf.append(tuple(isi))
+    return paragraf, baris
+
+
+def ukur(fungsi, path):
+    """(hasil, durasi, puncak alokasi MB); waktu diukur tanpa tracemalloc karena tracemalloc memperlambat"""
+    mulai = time.perf_counter()
+    hasil = fungsi(path)
+    durasi = time.perf_counter() - mulai
+    tracemalloc.start()
+    fungsi(path)
+    puncak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return hasil, durasi, puncak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark python-docx vs pembaca DOCX streaming')
+    parser.add_argument('--file', default=FILE_DEFAULT)
+    parser.add_argument('--salin', type=int, nargs='+', default=[1, 10, 50])
+    args = parser.parse_args()
+
+    print("=" * 86)
+    print("BENCHMARK PEMBACAAN DOCX")
+    print("=" * 86)
+    print(f"{'Salinan':>7s} | {'Paragraf':>8s} | {'Baris':>6s} | {'docx (s)':>8s} | {'stream (s)':>10s} | "
+          f"{'Cepat':>6s} | {'docx MB':>7s} | {'stream MB':>9s} | Identik")
+    print("-" * 86)
+    with tempfile.TemporaryDirectory() as folder:
+        for salin in args.salin:
+            path = os.path.join(folder, f'dokumen_{salin}.docx')
+            buat_dokumen_besar(args.file, salin, path)
+            hasil_docx, waktu_docx, memori_docx = ukur(baca_python_docx, path)
+            hasil_stream, waktu_stream, memori_stream = ukur(baca_streaming, path)
+            print(f"{salin:>7d} | {len(hasil_stream[0]):>8d} | {len(hasil_stream[1]):>6d} | {waktu_docx:>8.2f} | "
+                  f"{waktu_stream:>10.2f} | {waktu_docx / waktu_stream:>5.1f}x | {memori_docx:>7.1f} | "
+                  f"{memori_stream:>9.1f} | {'ya' if hasil_docx == hasil_stream else 'TIDAK'}")
+    print("=" * 86)
+    print("Memori = puncak alokasi Python selama membaca (termasuk daftar hasil).")
+
+
+if __name__ == "__main__":
+    main()
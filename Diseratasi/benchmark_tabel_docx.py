@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark pembacaan tabel dokumen Word: python-docx vs baca_docx.
+
+Membuat dokumen berisi satu tabel besar (default 5.000 baris x 8 kolom)
+dengan sel gabungan: sebagian baris memakai gridSpan dan gridBefore, dan
+kolom pertama digabung vertikal (vMerge) per kelompok baris seperti
+tabel kutipan per artikel. Tabel dibaca dengan:
+- python-docx: doc.tables -> table.rows -> row.cells -> cell.text
+- baca_docx.iter_baris_tabel(grid=True): hasil harus sama persis
+- baca_docx.iter_baris_tabel(): satu teks per <w:tc>, tanpa perluasan grid
+
+Cara menjalankan:
+    python3 benchmark_tabel_docx.py
+    python3 benchmark_tabel_docx.py --baris 20000 --kolom 12
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+from docx import Document
+
+from baca_docx import iter_baris_tabel
+
+def _tc(teks, span=1, vmerge=None):
+    pr = ''
+    if span > 1:
+        pr += f'<w:gridSpan w:val="{span}"/>'
+    if vmerge == 'restart':
+        pr += '<w:vMerge w:val="restart"/>'
+    elif vmerge == 'continue':
+        pr += '<w:vMerge/>'
+    isi = ''.join(f'<w:p><w:r><w:t xml:space="preserve">{escape(t)}</w:t></w:r></w:p>' for t in teks.split('\n'))
+    return f'<w:tc>{"<w:tcPr>" + pr + "</w:tcPr>" if pr else ""}{isi}</w:tc>'
+
+
+def buat_dokumen_tabel(path, jumlah_baris, jumlah_kolom):
+    """Dokumen dengan satu tabel besar bersel gabungan (dibuat dari template python-docx)"""
+    baris_xml = []
+    for i in range(jumlah_baris):
+        sel = []
+        # Kolom 1: nomor artikel, digabung vertikal per 5 baris
+        # (dimulai ulang setelah baris gridBefore, yang tidak punya sel di kolom 1)
+        sel.append(_tc(str(i // 5 + 1), vmerge='restart' if i % 5 == 0 or i % 11 == 6 else 'continue'))
+        kolom = 1
+        if i % 7 == 3:
+            # Ringkasan melebar 3 kolom
+            sel.append(_tc(f'Ringkasan baris {i}\n"kutipan {i} tentang meditasi dan retreat"', span=3))
+            kolom += 3
+        while kolom < jumlah_kolom:
+            sel.append(_tc(f'Sel {i}.{kolom} "verbatim {i * 31 + kolom}"'))
+            kolom += 1
+        tr_pr = '<w:trPr><w:gridBefore w:val="1"/></w:trPr>' if i % 11 == 5 else ''
+        if tr_pr:
+            sel.pop()            # baris mulai di kolom grid kedua, jadi satu sel lebih sedikit
+            sel[0] = _tc(str(i // 5 + 1))
+        baris_xml.append(f'<w:tr>{tr_pr}{"".join(sel)}</w:tr>')
+    grid = ''.join('<w:gridCol w:w="1000"/>' for _ in range(jumlah_kolom))
+    tabel = f'<w:tbl><w:tblPr/><w:tblGrid>{grid}</w:tblGrid>{"".join(baris_xml)}</w:tbl>'
+
+    # Template paket dari python-docx agar styles/rels valid
+    template = os.path.join(tempfile.gettempdir(), 'template_benchmark.docx')
+    Document().save(template)
+    with zipfile.ZipFile(template) as zf, zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as keluar:
+        for item in zf.infolist():
+            data = zf.read(item)
+            if item.filename == 'word/document.xml':
+                xml = data.decode('utf-8')
+                awal = xml.index('>', xml.index('<w:body')) + 1
+                data = (xml[:awal] + tabel + '<w:p/>' + xml[awal:]).encode('utf-8')
+            keluar.writestr(item, data)
+    os.unlink(template)
+
+
+def baca_python_docx(path):
+    return [[c.text for c in row.cells] for table in Document(path).tables for row in table.rows]
+
+
+def ukur(fungsi):
+    mulai = time.perf_counter()
+    hasil = fungsi()
+    return hasil, time.perf_counter() - mulai
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pembacaan tabel python-docx vs baca_docx')
+    parser.add_argument('--baris', type=int, default=5000)
+    parser.add_argument('--kolom', type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'tabel.docx')
+        buat_dokumen_tabel(path, args.baris, args.kolom)
+
+        print("=" * 62)
+        print(f"BENCHMARK TABEL DOCX ({args.baris:,} baris x {args.kolom} kolom, sel gabungan)")
+        print("=" * 62)
+        hasil_docx, waktu_docx = ukur(lambda: baca_python_docx(path))
+        hasil_grid, waktu_grid = ukur(lambda: [b.sel for b in iter_baris_tabel(path, grid=True)])
+        hasil_tc, waktu_tc = ukur(lambda: [b.sel for b in iter_baris_tabel(path)])
+
+        print(f"{'Metode':<30s} | {'Waktu (s)':>9s} | {'Cepat':>6s} | Identik")
+        print("-" * 62)
+        print(f"{'python-docx row.cells':<30s} | {waktu_docx:>9.2f} | {'1.0x':>6s} | -")
+        print(f"{'baca_docx grid=True':<30s} | {waktu_grid:>9.2f} | {waktu_docx / waktu_grid:>5.1f}x | "
+              f"{'ya' if hasil_grid == hasil_docx else 'TIDAK'}")
+        print(f"{'baca_docx per <w:tc>':<30s} | {waktu_tc:>9.2f} | {waktu_docx / waktu_tc:>5.1f}x | "
+              f"(tanpa perluasan grid)")
+        print("=" * 62)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Cache hasil parsing dokumen Word, dipakai bersama semua tahap analisis.
+
+analisis_dokumen.py dan ekstrak_data.py masing-masing mem-parse laporan
+.docx dari awal, lalu visualisasi_data.py dan ekstrak_media_tanggal.py
+memuat ulang JSON. Di sini dokumen di-parse sekali: paragraf (teks +
+style), data artikel, dan kutipan verbatim disimpan dalam file biner
+ringkas (marshal + zlib) di .cache_dokumen/, dengan kunci hash SHA-256
+isi file .docx. Tahap berikutnya cukup memuat file cache (milidetik);
+parsing ulang hanya terjadi jika isi .docx berubah atau VERSI_CACHE
+dinaikkan (mis. aturan ekstraksi berubah).
+
+Jika isi .docx berubah (atau `sebelumnya` menunjuk revisi lama), cache
+revisi sebelumnya dipakai untuk ekstraksi inkremental lewat
+diff_dokumen: hanya paragraf yang berubah yang diekstrak ulang, dan
+statistik perubahannya tersedia di data.diff.
+
+Contoh:
+    from cache_dokumen import muat_dokumen
+    data = muat_dokumen('Laporan.docx')
+    data.paragraf   # [(teks, gaya), ...] sama dengan baca_docx.iter_paragraf
+    data.artikel    # [{'no': 1, 'judul': ..., ...}, ...]
+    data.kutipan    # ['...', ...]
+    data.kata_freq  # Counter kata kunci kutipan (analisis_kata_kunci)
+    data.diff       # statistik perubahan dari revisi sebelumnya, atau None
+"""
+
+import hashlib
+import marshal
+import os
+import tempfile
+import zlib
+from collections import Counter, namedtuple
+
+# Di samping modul ini (bukan relatif ke direktori kerja), supaya cache sama dari mana pun skrip dijalankan
+DIREKTORI_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_dokumen')
+VERSI_CACHE = 2
+MAGIC = b'DOKC'
+
+DataDokumen = namedtuple('DataDokumen', 'paragraf artikel kutipan kata_freq diff')
+
+
+def hash_file(path, ukuran_blok=1 << 20):
+    """SHA-256 isi file (hex)"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for blok in iter(lambda: f.read(ukuran_blok), b''):
+            h.update(blok)
+    return h.hexdigest()
+
+
+def parse_dokumen(path):
+    """Parse .docx menjadi DataDokumen tanpa cache"""
+    # Impor lokal: diff_dokumen (lewat analisis_dokumen dan ekstrak_data) juga mengimpor modul ini
+    from diff_dokumen import olah_blok
+    return olah_blok(path)[0]
+
+
+def _path_cache(path, direktori):
+    # Hash folder asal agar laporan bernama sama di folder berbeda (mode batch) tidak berbagi file cache
+    folder = hashlib.sha1(os.path.dirname(os.path.abspath(path)).encode('utf-8')).hexdigest()[:8]
+    return os.path.join(direktori, f'{os.path.basename(path)}.{folder}.bin')
+
+
+def _baca_cache(path_cache):
+    """(kunci, DataDokumen, blok) dari file cache, atau None jika tidak ada/tidak valid"""
+    try:
+        with open(path_cache, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    if data[:4] != MAGIC:
+        return None
+    try:
+        versi, kunci_cache, isi, blok = marshal.loads(zlib.decompress(data[4:]))
+    except (ValueError, EOFError, TypeError, zlib.error):
+        return None          # file cache rusak/terpotong/format lama: parse ulang
+    if versi != VERSI_CACHE:
+        return None
+    paragraf, artikel, kutipan, kata_freq, diff = isi
+    return kunci_cache, DataDokumen(paragraf, artikel, kutipan, Counter(kata_freq), diff), blok
+
+
+def _tulis_cache(path_cache, kunci, data, blok):
+    os.makedirs(os.path.dirname(path_cache) or '.', exist_ok=True)
+    # marshal hanya menerima tipe bawaan: Counter disimpan sebagai dict
+    isi = data._replace(kata_freq=dict(data.kata_freq))
+    isi = MAGIC + zlib.compress(marshal.dumps((VERSI_CACHE, kunci, tuple(isi), blok)), 6)
+    # Tulis ke file sementara lalu rename agar tahap yang berjalan paralel tidak membaca file setengah jadi
+    fd, path_sementara = tempfile.mkstemp(dir=os.path.dirname(path_cache) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(isi)
+        os.replace(path_sementara, path_cache)
+    except BaseException:
+        os.unlink(path_sementara)
+        raise
+
+
+def _muat_entri(path, direktori, sebelumnya=None):
+    kunci = hash_file(path)
+    path_cache = _path_cache(path, direktori)
+    entri = _baca_cache(path_cache)
+    if entri is not None and entri[0] == kunci:
+        return entri[1], entri[2]
+
+    # Cache kosong/usang: ekstraksi inkremental terhadap revisi sebelumnya jika ada
+    from diff_dokumen import olah_blok
+    if sebelumnya is not None:
+        blok_lama, sumber_lama = _muat_entri(sebelumnya, direktori)[1], sebelumnya
+    elif entri is not None:
+        blok_lama, sumber_lama = entri[2], path    # isi file yang sama sudah berubah
+    else:
+        blok_lama, sumber_lama = None, None
+    data, blok = olah_blok(path, blok_lama, sumber_lama)
+    _tulis_cache(path_cache, kunci, data, blok)
+    return data, blok
+
+
+def muat_dokumen(path, direktori=DIREKTORI_DEFAULT, sebelumnya=None):
+    """
+    DataDokumen untuk file .docx: dari cache jika isi file sama, selain itu
+    parse lalu simpan. sebelumnya: path revisi lama (mis. laporan REVISI
+    untuk REVISI2) sebagai dasar ekstraksi inkremental; tanpa itu dipakai
+    cache lama file yang sama jika ada.
+    """
+    return _muat_entri(path, direktori, sebelumnya)[0]
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Sidik (fingerprint) blok dokumen dan ekstraksi inkremental antar revisi.
+
+Revisi laporan (REVISI, REVISI2, ...) biasanya hanya berbeda beberapa
+paragraf. Setiap blok tingkat body (paragraf atau baris tabel) diberi
+sidik hash dari isinya, lalu urutan sidik revisi baru dibandingkan
+dengan revisi sebelumnya (diff Myers, O((N+M)·D) untuk D perubahan;
+di atas MAKS_EDIT perubahan bagian tengah dianggap diganti seluruhnya).
+Hanya blok yang disisipkan/diubah yang diekstrak ulang:
+- kutipan per paragraf diambil dari revisi sebelumnya jika sidiknya sama
+- data artikel per segmen (paragraf 'Artikel N: ...' sampai sebelum
+  artikel berikutnya) diambil ulang jika sidik segmennya sama
+- frekuensi kata kunci dihitung dari kutipan gabungan sesuai urutan
+  dokumen (murah dibanding ekstraksi kutipan), jadi urutan kata
+  berfrekuensi sama di most_common() tidak bergantung riwayat cache
+
+Hasilnya sama persis dengan ekstraksi penuh. Baris tabel ikut sidik dan
+statistik diff, tetapi tidak menghasilkan kutipan/artikel (sama dengan
+ekstraksi penuh yang hanya membaca doc.paragraphs).
+
+Dipakai oleh cache_dokumen.muat_dokumen; blok disimpan bersama cache.
+"""
+
+import hashlib
+import re
+
+from analisis_dokumen import analisis_kata_kunci, ekstrak_kutipan
+from baca_docx import BarisTabel, iter_isi
+from cache_dokumen import DataDokumen
+from ekstrak_data import ekstrak_artikel_dari_paragraf
+
+_AWAL_ARTIKEL = re.compile(r'Artikel (\d+): (.+)')
+
+# Batas jumlah sisip+hapus untuk diff Myers; di atasnya blok tengah dianggap diganti seluruhnya
+MAKS_EDIT = 500
+
+
+def sidik(*bagian):
+    """Hash 8 byte dari potongan teks (stabil antar proses, tidak seperti hash())"""
+    return hashlib.blake2b('\x1f'.join(bagian).encode('utf-8'), digest_size=8).digest()
+
+
+def _awal_segmen(teks):
+    # Sama dengan ekstrak_artikel_dari_paragraf: di sini state artikel dimulai ulang sepenuhnya
+    teks = teks.strip()
+    return teks.startswith('Artikel ') and _AWAL_ARTIKEL.match(teks) is not None
+
+
+def _kutipan_paragraf(teks):
+    return ekstrak_kutipan([teks]) if teks.strip() else []
+
+
+def _pasangan_myers(a, b, maks):
+    """Pasangan indeks (i, j) dengan a[i] == b[j] pada diff terpendek, atau None jika > maks edit"""
+    n, m = len(a), len(b)
+    v, jejak = {1: 0}, []
+    for d in range(maks + 1):
+        jejak.append(v.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                break
+        else:
+            continue
+        break
+    else:
+        return None
+
+    # Telusur balik jejak dari (n, m) ke (0, 0)
+    pasangan, x, y = [], n, m
+    for d in range(len(jejak) - 1, -1, -1):
+        v, k = jejak[d], x - y
+        k_lama = k + 1 if k == -d or (k != d and v[k - 1] < v[k + 1]) else k - 1
+        x_lama = v[k_lama]
+        y_lama = x_lama - k_lama
+        while x > x_lama and y > y_lama:
+            x -= 1
+            y -= 1
+            pasangan.append((x, y))
+        x, y = x_lama, y_lama
+    pasangan.reverse()
+    return pasangan
+
+
+def _opcodes(pasangan, n, m):
+    """Pasangan sama -> opcode gaya difflib (tag, i1, i2, j1, j2)"""
+    ops, i, j = [], 0, 0
+    for a, b in pasangan + [(n, m)]:
+        if a > i or b > j:
+            ops.append(('replace' if a > i and b > j else 'delete' if a > i else 'insert', i, a, j, b))
+        if a < n or b < m:
+            if ops and ops[-1][0] == 'equal':
+                ops[-1] = ('equal', ops[-1][1], a + 1, ops[-1][3], b + 1)
+            else:
+                ops.append(('equal', a, a + 1, b, b + 1))
+        i, j = a + 1, b + 1
+    return ops
+
+
+def diff_sidik(lama, baru, maks=MAKS_EDIT):
+    """Opcode gaya difflib (lama -> baru) untuk dua urutan sidik"""
+    # Awalan dan akhiran yang sama dilewati dulu; revisi biasanya hanya berubah di beberapa tempat
+    n, m = len(lama), len(baru)
+    awal = 0
+    while awal < n and awal < m and lama[awal] == baru[awal]:
+        awal += 1
+    akhir = 0
+    while akhir < n - awal and akhir < m - awal and lama[n - 1 - akhir] == baru[m - 1 - akhir]:
+        akhir += 1
+    tengah_lama, tengah_baru = lama[awal:n - akhir], baru[awal:m - akhir]
+    pasangan = _pasangan_myers(tengah_lama, tengah_baru, maks)
+    if pasangan is None:
+        pasangan = []
+    pasangan = ([(i, i) for i in range(awal)]
+                + [(awal + i, awal + j) for i, j in pasangan]
+                + [(n - akhir + i, m - akhir + i) for i in range(akhir)])
+    return _opcodes(pasangan, n, m)
+
+
+def statistik_diff(sidik_lama, sidik_baru):
+    """Jumlah blok sama/diubah/disisipkan/dihapus dan opcode diff (lama -> baru)"""
+    opcodes = diff_sidik(sidik_lama, sidik_baru)
+    stat = {'sama': 0, 'diubah': 0, 'disisipkan': 0, 'dihapus': 0}
+    for op, i1, i2, j1, j2 in opcodes:
+        lama, baru = i2 - i1, j2 - j1
+        if op == 'equal':
+            stat['sama'] += lama
+        else:
+            stat['diubah'] += min(lama, baru)
+            stat['disisipkan'] += max(0, baru - lama)
+            stat['dihapus'] += max(0, lama - baru)
+    return stat, opcodes
+
+
+def olah_blok(path, blok_lama=None, sumber_lama=None):
+    """
+    Parse .docx menjadi (DataDokumen, blok). blok_lama: blok hasil
+    olah_blok revisi sebelumnya (dari cache); tanpa blok_lama semua blok
+    diekstrak (ekstraksi penuh, diff None).
+    """
+    paragraf, sidik_baru, jenis = [], [], []
+    for isi in iter_isi(path):
+        if type(isi) is BarisTabel:
+            sidik_baru.append(sidik('tr', *isi.sel))
+            jenis.append(None)
+        else:
+            sidik_baru.append(sidik('p', isi.teks, isi.gaya or ''))
+            jenis.append(len(paragraf))
+            paragraf.append(tuple(isi))
+
+    kutipan_lama = dict(zip(blok_lama['sidik'], blok_lama['kutipan'])) if blok_lama else {}
+    segmen_lama = blok_lama['segmen'] if blok_lama else {}
+
+    # Kutipan per blok: dari revisi sebelumnya jika sidik sama, selain itu ekstrak ulang
+    kutipan_blok, diproses = [], 0
+    for s, j in zip(sidik_baru, jenis):
+        if j is None:
+            kutipan_blok.append([])
+        elif s in kutipan_lama:
+            kutipan_blok.append(kutipan_lama[s])
+        else:
+            kutipan_blok.append(_kutipan_paragraf(paragraf[j][0]))
+            diproses += 1
+
+    # Artikel per segmen 'Artikel N: ...'
+    segmen_baru, artikel, artikel_diproses = {}, [], 0
+    batas = [0] + [i for i, (t, _) in enumerate(paragraf) if i and _awal_segmen(t)] + [len(paragraf)]
+    sidik_paragraf = [s for s, j in zip(sidik_baru, jenis) if j is not None]
+    for a, b in zip(batas, batas[1:]):
+        s = sidik('seg', *(x.hex() for x in sidik_paragraf[a:b]))
+        if s in segmen_lama:
+            hasil = segmen_lama[s]
+        else:
+            hasil = ekstrak_artikel_dari_paragraf(t for t, _ in paragraf[a:b])
+            artikel_diproses += 1
+        segmen_baru[s] = hasil
+        artikel.extend(hasil)
+
+    kutipan = [k for ks in kutipan_blok for k in ks]
+    kata_freq, diff = analisis_kata_kunci(kutipan), None
+    if blok_lama is not None:
+        stat, _ = statistik_diff(blok_lama['sidik'], sidik_baru)
+        diff = {'sebelumnya': sumber_lama, 'blok': len(sidik_baru), **stat,
+                'diproses_ulang': diproses, 'artikel_diproses_ulang': artikel_diproses}
+
+    blok = {'sidik': sidik_baru, 'kutipan': kutipan_blok, 'segmen': segmen_baru}
+    return DataDokumen(paragraf, artikel, kutipan, kata_freq, diff), blok
+
+
+def ringkasan_diff(diff):
+    """Satu baris ringkasan diff untuk laporan eksekusi"""
+    if diff is None:
+        return 'ekstraksi penuh (tidak ada revisi sebelumnya di cache)'
+    return (f"{diff['sama']} blok sama, {diff['diubah']} diubah, {diff['disisipkan']} disisipkan, "
+            f"{diff['dihapus']} dihapus; {diff['diproses_ulang']} paragraf dan "
+            f"{diff['artikel_diproses_ulang']} segmen artikel diproses ulang")
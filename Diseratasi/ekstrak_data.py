@@ -3,21 +3,24 @@
 Script untuk mengekstrak data dari dokumen Word ke format CSV dan JSON
 """
 
-from docx import Document
+from cache_dokumen import muat_dokumen
 import csv
 import json
 import re
 
 def ekstrak_artikel_dari_dokumen(file_path):
-    """Ekstrak data artikel dari dokumen Word"""
-    doc = Document(file_path)
+    """Ekstrak data artikel dari dokumen Word (dari cache_dokumen jika dokumen belum berubah)"""
+    return muat_dokumen(file_path).artikel
+
+def ekstrak_artikel_dari_paragraf(paragraf_list):
+    """Ekstrak data artikel dari teks paragraf dokumen secara berurutan"""
     artikel_list = []
     
     current_artikel = {}
     mode = None
     
-    for para in doc.paragraphs:
-        text = para.text.strip()
+    for para in paragraf_list:
+        text = para.strip()
         
         if text.startswith('Artikel '):
             # Simpan artikel sebelumnya jika ada
@@ -80,7 +83,8 @@ def simpan_ke_json(artikel_list, output_file):
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(artikel_list, f, ensure_ascii=False, indent=2)
 
-def main():
+def main(artikel_list=None):
+    """artikel_list: data artikel yang sudah diekstrak (run_all_analysis); jika None dibaca dari dokumen"""
     file_path = 'Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx'
     
     print("="*70)
@@ -90,7 +94,8 @@ def main():
     
     # Ekstrak data
     print("📖 Mengekstrak data artikel...")
-    artikel_list = ekstrak_artikel_dari_dokumen(file_path)
+    if artikel_list is None:
+        artikel_list = ekstrak_artikel_dari_dokumen(file_path)
     print(f"   ✓ Berhasil mengekstrak {len(artikel_list)} artikel")
     
     # Simpan ke CSV
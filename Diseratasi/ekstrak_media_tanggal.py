@@ -1,9 +1,17 @@
 import json
+import os
 from docx import Document
 from collections import Counter
+from cache_dokumen import muat_dokumen
 
-with open('data_artikel_meditasi_yogyakarta.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+FILE_DOKUMEN = 'Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx'
+
+# Data artikel dari cache dokumen; file JSON hanya dipakai jika dokumen Word tidak ada
+if os.path.exists(FILE_DOKUMEN):
+    data = muat_dokumen(FILE_DOKUMEN).artikel
+else:
+    with open('data_artikel_meditasi_yogyakarta.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
 
 media_count = Counter([item['media'] for item in data])
 
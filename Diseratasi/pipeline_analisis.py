@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Runner tahap analisis dalam satu proses (DAG).
+
+Setiap Tahap menyebut nama data masukan dan keluarannya. Tahap dijalankan
+di thread pool segera setelah semua masukannya tersedia, jadi tahap yang
+tidak saling bergantung (mis. statistik, ekspor CSV/JSON, grafik) berjalan
+paralel. Data dioper di memori (dict nama -> nilai), tanpa subprocess dan
+tanpa impor ulang pandas/matplotlib/python-docx per tahap.
+
+Output print setiap tahap ditampung per thread lalu dicetak utuh saat
+tahap selesai, supaya output tahap paralel tidak bercampur. Tahap yang
+gagal tidak menghentikan tahap lain; tahap yang membutuhkan keluarannya
+dilewati.
+
+Contoh:
+    tahap = [
+        Tahap('dokumen', 'Membaca dokumen', baca, (), ('data',)),
+        Tahap('statistik', 'Statistik', hitung, ('data',), ()),
+    ]
+    data, hasil = jalankan_tahap(tahap)
+"""
+
+import io
+import sys
+import threading
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# fungsi(**{nama: data[nama] for nama in masukan}) -> dict berisi semua nama di keluaran (atau None)
+Tahap = namedtuple('Tahap', 'nama deskripsi fungsi masukan keluaran')
+HasilTahap = namedtuple('HasilTahap', 'tahap status durasi stdout stderr')
+
+BERHASIL, GAGAL, DILEWATI = 'BERHASIL', 'GAGAL', 'DILEWATI'
+
+
+class _KeluaranPerThread:
+    """Pengganti sys.stdout/sys.stderr: tulisan dari thread tahap masuk ke buffer tahap itu"""
+
+    def __init__(self, asli):
+        self.asli = asli
+        self.lokal = threading.local()
+
+    def write(self, teks):
+        return (getattr(self.lokal, 'buffer', None) or self.asli).write(teks)
+
+    def flush(self):
+        (getattr(self.lokal, 'buffer', None) or self.asli).flush()
+
+    def __getattr__(self, nama):
+        return getattr(self.asli, nama)
+
+
+def periksa_tahap(tahap_list, tersedia=()):
+    """Produsen tiap data (nama data -> nama tahap); ValueError jika DAG tidak valid"""
+    produsen = {nama: None for nama in tersedia}
+    for t in tahap_list:
+        for nama in t.keluaran:
+            if nama in produsen:
+                raise ValueError(f"Data '{nama}' dihasilkan lebih dari satu kali (tahap '{t.nama}')")
+            produsen[nama] = t.nama
+    for t in tahap_list:
+        for nama in t.masukan:
+            if nama not in produsen:
+                raise ValueError(f"Masukan '{nama}' tahap '{t.nama}' tidak dihasilkan tahap mana pun")
+
+    # Siklus: urutan topologis harus mencakup semua tahap
+    siap, selesai = set(tersedia), set()
+    while len(selesai) < len(tahap_list):
+        bisa = [t for t in tahap_list if t.nama not in selesai and all(m in siap for m in t.masukan)]
+        if not bisa:
+            sisa = ', '.join(t.nama for t in tahap_list if t.nama not in selesai)
+            raise ValueError(f"Ketergantungan melingkar antar tahap: {sisa}")
+        for t in bisa:
+            selesai.add(t.nama)
+            siap.update(t.keluaran)
+    return produsen
+
+
+def _jalankan_satu(tahap, argumen, stdout, stderr):
+    buffer_out, buffer_err = io.StringIO(), io.StringIO()
+    stdout.lokal.buffer, stderr.lokal.buffer = buffer_out, buffer_err
+    mulai = time.perf_counter()
+    try:
+        keluaran = tahap.fungsi(**argumen) or {}
+        hilang = [nama for nama in tahap.keluaran if nama not in keluaran]
+        if hilang:
+            raise ValueError(f"Tahap '{tahap.nama}' tidak menghasilkan: {', '.join(hilang)}")
+        status = BERHASIL
+    except Exception:
+        keluaran, status = {}, GAGAL
+        buffer_err.write(traceback.format_exc())
+    finally:
+        stdout.lokal.buffer = stderr.lokal.buffer = None
+    hasil = HasilTahap(tahap, status, time.perf_counter() - mulai, buffer_out.getvalue(), buffer_err.getvalue())
+    return hasil, keluaran
+
+
+def jalankan_tahap(tahap_list, data=None, jumlah_thread=None, selesai=None):
+    """
+    Menjalankan semua tahap sesuai ketergantungan datanya.
+
+    data: data awal (nama -> nilai). jumlah_thread: default jumlah tahap.
+    selesai(hasil_tahap): dipanggil di thread utama setiap tahap selesai
+    atau dilewati (mis. untuk mencetak outputnya). Nilai kembali
+    (data akhir, [HasilTahap] sesuai urutan tahap_list).
+    """
+    data = dict(data or {})
+    produsen = periksa_tahap(tahap_list, data)
+    hasil, sisa, berjalan = {}, list(tahap_list), {}
+
+    def catat(h):
+        hasil[h.tahap.nama] = h
+        if selesai:
+            selesai(h)
+
+    stdout, stderr = _KeluaranPerThread(sys.stdout), _KeluaranPerThread(sys.stderr)
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        with ThreadPoolExecutor(max_workers=jumlah_thread or max(1, len(tahap_list))) as executor:
+            while sisa or berjalan:
+                for t in list(sisa):
+                    gagal = [m for m in t.masukan
+                             if produsen[m] is not None and produsen[m] in hasil and hasil[produsen[m]].status != BERHASIL]
+                    if gagal:
+                        sisa.remove(t)
+                        catat(HasilTahap(t, DILEWATI, 0.0, '', f"Masukan tidak tersedia: {', '.join(gagal)}\n"))
+                    elif all(m in data for m in t.masukan):
+                        sisa.remove(t)
+                        berjalan[executor.submit(_jalankan_satu, t, {m: data[m] for m in t.masukan},
+                                                 stdout, stderr)] = t
+                if not berjalan:
+                    continue
+                beres, _ = wait(berjalan, return_when=FIRST_COMPLETED)
+                for future in beres:
+                    del berjalan[future]
+                    h, keluaran = future.result()
+                    data.update((nama, keluaran[nama]) for nama in h.tahap.keluaran if nama in keluaran)
+                    catat(h)
+    finally:
+        sys.stdout, sys.stderr = stdout.asli, stderr.asli
+
+    return data, [hasil[t.nama] for t in tahap_list]
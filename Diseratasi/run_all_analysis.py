@@ -3,70 +3,93 @@
 SCRIPT MASTER - Analisis Lengkap Dokumen Word
 Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx
 
-Menjalankan semua analisis:
+Menjalankan semua analisis dalam satu proses (pipeline_analisis):
+0. Membaca dokumen (cache_dokumen)
 1. Analisis dokumen
 2. Ekstrak data ke CSV dan JSON
 3. Visualisasi data
+Tahap 1-3 hanya membutuhkan hasil tahap 0 sehingga berjalan paralel.
 """
 
-import subprocess
 import os
+import time
 
-def run_script(script_name, description):
-    """Menjalankan script Python"""
+import matplotlib
+matplotlib.use('Agg')        # grafik hanya disimpan ke file; aman dipakai dari thread tahap
+
+import analisis_dokumen
+import ekstrak_data
+import visualisasi_data
+from cache_dokumen import muat_dokumen
+from pipeline_analisis import BERHASIL, DILEWATI, Tahap, jalankan_tahap
+
+FILE_DOKUMEN = 'Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx'
+
+
+def baca_dokumen():
+    data = muat_dokumen(FILE_DOKUMEN)
+    print(f"   ✓ {len(data.paragraf)} paragraf, {len(data.artikel)} artikel, {len(data.kutipan)} kutipan")
+    return {'dokumen': data, 'artikel': data.artikel}
+
+
+TAHAP = [
+    Tahap('dokumen', 'Membaca Dokumen Word', baca_dokumen, (), ('dokumen', 'artikel')),
+    Tahap('analisis', 'Analisis Dokumen Word',
+          lambda dokumen: analisis_dokumen.main([FILE_DOKUMEN], data=dokumen), ('dokumen',), ()),
+    Tahap('ekstrak', 'Ekstrak Data ke CSV dan JSON', lambda artikel: ekstrak_data.main(artikel), ('artikel',), ()),
+    Tahap('visualisasi', 'Visualisasi Data', lambda artikel: visualisasi_data.main(artikel), ('artikel',), ()),
+]
+
+
+def tampilkan_tahap(hasil):
+    """Output satu tahap setelah selesai"""
     print(f"\n{'='*70}")
-    print(f"🚀 {description}")
+    print(f"🚀 {hasil.tahap.deskripsi} ({hasil.durasi:.2f} s)")
     print(f"{'='*70}")
-    
-    result = subprocess.run(['python3', script_name], capture_output=True, text=True)
-    print(result.stdout)
-    if result.stderr:
+    print(hasil.stdout)
+    if hasil.stderr:
         print("⚠️  Warnings/Errors:")
-        print(result.stderr)
-    
-    return result.returncode == 0
+        print(hasil.stderr)
+
 
 def main():
-    print("""
+    print(f"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║           ANALISIS LENGKAP DOKUMEN WORD - MASTER SCRIPT          ║
 ╚══════════════════════════════════════════════════════════════════╝
 
-File Input: Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx
+File Input: {FILE_DOKUMEN}
 
 Proses yang akan dijalankan:
   1. Analisis Dokumen (statistik, kutipan, kata kunci)
   2. Ekstrak Data (CSV dan JSON)
   3. Visualisasi Data (grafik dan laporan)
 """)
-    
-    input("Tekan ENTER untuk memulai...")
-    
-    scripts = [
-        ('analisis_dokumen.py', 'Analisis Dokumen Word'),
-        ('ekstrak_data.py', 'Ekstrak Data ke CSV dan JSON'),
-        ('visualisasi_data.py', 'Visualisasi Data')
-    ]
-    
-    hasil = []
-    for script, desc in scripts:
-        success = run_script(script, desc)
-        hasil.append((desc, success))
-    
+
+    mulai = time.perf_counter()
+    _, hasil = jalankan_tahap(TAHAP, selesai=tampilkan_tahap)
+    total = time.perf_counter() - mulai
+
     # Ringkasan
     print(f"\n{'='*70}")
     print("📋 RINGKASAN EKSEKUSI")
     print(f"{'='*70}")
-    
-    for desc, success in hasil:
-        status = "✅ BERHASIL" if success else "❌ GAGAL"
-        print(f"  {status} - {desc}")
-    
+
+    for h in hasil:
+        if h.status == BERHASIL:
+            status = "✅ BERHASIL"
+        elif h.status == DILEWATI:
+            status = "⏭️  DILEWATI"
+        else:
+            status = "❌ GAGAL"
+        print(f"  {status} - {h.tahap.deskripsi:35s} ({h.durasi:.2f} s)")
+    print(f"\n  Total waktu: {total:.2f} s")
+
     # Daftar file yang dihasilkan
     print(f"\n{'='*70}")
     print("📁 FILE YANG DIHASILKAN")
     print(f"{'='*70}")
-    
+
     files = [
         'data_artikel_meditasi_yogyakarta.csv',
         'data_artikel_meditasi_yogyakarta.json',
@@ -75,14 +98,14 @@ Proses yang akan dijalankan:
         'kata_kunci_python.png',
         'laporan_statistik.txt'
     ]
-    
+
     for i, file in enumerate(files, 1):
         if os.path.exists(file):
             size = os.path.getsize(file)
             print(f"  {i}. {file:45s} ({size:,} bytes)")
         else:
             print(f"  {i}. {file:45s} (tidak ditemukan)")
-    
+
     print(f"\n{'='*70}")
     print("✅ SEMUA PROSES SELESAI!")
     print(f"{'='*70}\n")
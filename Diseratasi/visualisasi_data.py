@@ -8,9 +8,15 @@ import matplotlib.pyplot as plt
 from collections import Counter
 from datetime import datetime
 import pandas as pd
+import os
+from cache_dokumen import muat_dokumen
+
+FILE_DOKUMEN = 'Laporan_30_Artikel_Meditasi_Yogyakarta_2025_REVISI.docx'
 
 def load_data():
-    """Load data dari file JSON"""
+    """Load data artikel dari cache dokumen (atau file JSON jika dokumen Word tidak ada)"""
+    if os.path.exists(FILE_DOKUMEN):
+        return muat_dokumen(FILE_DOKUMEN).artikel
     with open('data_artikel_meditasi_yogyakarta.json', 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -122,14 +128,16 @@ def buat_laporan_statistik(data):
     
     return laporan
 
-def main():
+def main(data=None):
+    """data: data artikel yang sudah dimuat (run_all_analysis); jika None dimuat dengan load_data"""
     print("="*70)
     print("VISUALISASI DATA ARTIKEL")
     print("="*70)
     
     # Load data
-    print("\n📖 Memuat data dari JSON...")
-    data = load_data()
+    if data is None:
+        print("\n📖 Memuat data dari JSON...")
+        data = load_data()
     print(f"   ✓ {len(data)} artikel berhasil dimuat")
     
     # Buat visualisasi
@@ -6,36 +6,34 @@ from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 from collections import Counter
 import re
+import os
+import sys
+
+# Skor kutipan dipakai bersama dengan scraper di source_data/Olivia Rodrigo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'source_data', 'Olivia Rodrigo'))
+from skor_kutipan import frasa_teratas
 
 # Baca file Excel
 df = pd.read_excel('Kutipan Relavan.xlsx')
 
 print(f"Total baris di Excel: {len(df)}")
 
+KATA_KUNCI_FRASA = ['nostalgic', 'vintage', 'retro', 'revival', 'y2k', '2000s', 'trend', 'fashion',
+                    'gen z', 'generation', 'olivia rodrigo']
+
 # Fungsi untuk ekstrak frasa 2-4 kata yang presisi
 def extract_precise_phrases(text):
-    """Ekstrak frasa 2-4 kata yang presisi dan relevan"""
+    """Ekstrak frasa 2-4 kata yang presisi dan relevan (skor tertinggi lewat skor_kutipan)"""
     if pd.isna(text) or str(text).strip() == '':
         return []
     
     text = str(text).strip()
     words = text.split()
-    phrases = []
-    
-    # Ekstrak frasa 2-4 kata
-    for length in [4, 3, 2]:  # Prioritas 4 kata, lalu 3, lalu 2
-        for i in range(len(words) - length + 1):
-            phrase = ' '.join(words[i:i+length])
-            # Filter frasa yang mengandung kata kunci penting
-            phrase_lower = phrase.lower()
-            if any(kw in phrase_lower for kw in ['nostalgic', 'vintage', 'retro', 'revival', 
-                                                   'y2k', '2000s', 'trend', 'fashion', 
-                                                   'gen z', 'generation', 'olivia rodrigo']):
-                phrases.append(phrase)
     
-    # Ambil frasa terbaik (yang paling pendek dan relevan)
+    # Frasa terbaik: padat kata kunci, memuat beberapa kata kunci, posisi awal
+    phrases = frasa_teratas(text, KATA_KUNCI_FRASA, panjang=(4, 3, 2), k=1)
     if phrases:
-        return [min(phrases, key=len)]
+        return phrases
     
     # Jika tidak ada frasa dengan kata kunci, ambil 3 kata pertama
     if len(words) >= 3:
@@ -4,20 +4,30 @@ from docx.shared import Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
+import os
 import re
+import sys
+
+# Indeks kalimat dipakai bersama dengan scraper di source_data/Olivia Rodrigo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'source_data', 'Olivia Rodrigo'))
+from indeks_kalimat import IndeksKalimat
 
 # Read Excel
 df = pd.read_excel('Kutipan Relavan1.xlsx')
 df.columns = ['Media Name', 'Date', 'Nostalgic', 'Vintage', 'Retro', 'Revival', 'Gen Z']
 
+# Tanda baca akhir kalimat (tanda kutip/kurung tutup sesudahnya tetap dipertahankan)
+_TANDA_AKHIR = re.compile(r'[.!?]+(?=["\'”’)\]]*$)')
+
 def extract_precise_quote(text):
-    """Extract most precise sentence from quote"""
+    """Extract most precise sentence from quote (first sentence, without its final punctuation)"""
     if pd.isna(text):
         return None
     text = str(text).strip()
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    return sentences[0] if sentences else text
+    indeks = IndeksKalimat(text)
+    if not len(indeks):
+        return text
+    return _TANDA_AKHIR.sub('', indeks.kalimat(0)).strip() or text
 
 # Create document
 doc = Document()
@@ -8,6 +8,12 @@ import seaborn as sns
 from collections import Counter
 import re
 import numpy as np
+import os
+import sys
+
+# Registri leksikon dipakai bersama dengan skrip di source_data/Olivia Rodrigo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'source_data', 'Olivia Rodrigo'))
+from leksikon import leksikon
 
 class AnalisisTipologi:
     def __init__(self, file_path):
@@ -28,14 +34,14 @@ class AnalisisTipologi:
             self.df['Precise Quote'].fillna('')
         )
         
-        # Define themes
-        self.themes = {
-            'Fashion & Style': ['fashion', 'style', 'outfit', 'look', 'wear', 'dress', 'clothes', 'aesthetic', 'chainmail', 'leather', 'boots', 'jeans'],
-            'Nostalgia & Memory': ['nostalgia', 'nostalgic', 'throwback', 'retro', 'vintage', 'y2k', '2000s', 'memories', 'past', 'remember'],
-            'Identity & Generation': ['generation', 'gen z', 'youth', 'young', 'identity', 'culture', 'millennial', 'teen', 'influence'],
-            'Media & Performance': ['performance', 'stage', 'concert', 'festival', 'music', 'singer', 'artist', 'show', 'event'],
-            'Social & Cultural': ['social', 'cultural', 'trend', 'popular', 'iconic', 'symbol', 'represent', 'influence', 'impact']
-        }
+        # Define themes (registri leksikon.json)
+        self.leksikon = leksikon('tipologi')
+        self.themes = self.leksikon.kategori
+        
+        # Hitung kata kunci semua tema per artikel sekali saja; skor per artikel,
+        # per media, dan per periode dijumlahkan dari hitungan ini
+        self.df['hitungan_tema'] = [self.leksikon.hitung(self.preprocessing_text(content))
+                                    for content in self.df['full_content']]
     
     def preprocessing_text(self, text):
         """Clean text"""
@@ -68,13 +74,8 @@ class AnalisisTipologi:
         """Klasifikasi artikel berdasarkan tema dominan"""
         artikel_tema = []
         
-        for idx, content in enumerate(self.df['full_content']):
-            text = self.preprocessing_text(content)
-            tema_scores = {}
-            
-            for tema, keywords in self.themes.items():
-                score = sum(text.count(keyword) for keyword in keywords)
-                tema_scores[tema] = score
+        for idx, hitungan in enumerate(self.df['hitungan_tema']):
+            tema_scores = self.leksikon.per_kategori(hitungan)
             
             # Tentukan tema dominan
             tema_dominan = max(tema_scores.items(), key=lambda x: x[1])
@@ -95,14 +96,8 @@ class AnalisisTipologi:
         media_tipologi = {}
         
         for media in self.df['Media Name'].unique():
-            media_articles = self.df[self.df['Media Name'] == media]['full_content']
-            all_text = ' '.join(media_articles.astype(str))
-            clean_text = self.preprocessing_text(all_text)
-            
-            tema_scores = {}
-            for tema, keywords in self.themes.items():
-                score = sum(clean_text.count(keyword) for keyword in keywords)
-                tema_scores[tema] = score
+            media_articles = self.df[self.df['Media Name'] == media]['hitungan_tema']
+            tema_scores = self.leksikon.per_kategori(sum(media_articles, Counter()))
             
             # Normalisasi berdasarkan jumlah artikel
             total_articles = len(media_articles)
@@ -165,13 +160,7 @@ class AnalisisTipologi:
                 monthly_themes = {}
                 for month in self.df['Date_parsed'].dt.to_period('M').unique():
                     month_articles = self.df[self.df['Date_parsed'].dt.to_period('M') == month]
-                    month_text = ' '.join(month_articles['full_content'].astype(str))
-                    clean_text = self.preprocessing_text(month_text)
-                    
-                    tema_scores = {}
-                    for tema, keywords in self.themes.items():
-                        score = sum(clean_text.count(keyword) for keyword in keywords)
-                        tema_scores[tema] = score
+                    tema_scores = self.leksikon.per_kategori(sum(month_articles['hitungan_tema'], Counter()))
                     
                     monthly_themes[str(month)] = tema_scores
                 
@@ -8,6 +8,7 @@ Library yang digunakan:
 - wordcloud: Visualisasi word cloud
 - matplotlib: Plotting
 - re: Regular expression untuk text cleaning
+- leksikon: Registri kata kunci (source_data/Olivia Rodrigo/leksikon.json)
 """
 
 # [EKSEKUSI-1] Import semua library yang dibutuhkan
@@ -21,6 +22,12 @@ import seaborn as sns
 from sklearn.feature_extraction.text import TfidfVectorizer
 from collections import Counter
 import re
+import os
+import sys
+
+# Registri leksikon dipakai bersama dengan skrip di source_data/Olivia Rodrigo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'source_data', 'Olivia Rodrigo'))
+from leksikon import leksikon
 
 # [EKSEKUSI-2] Python membaca definisi class (belum dieksekusi)
 class AnalisisWacanaNostalgia:
@@ -36,7 +43,8 @@ class AnalisisWacanaNostalgia:
         1. Baca CSV dengan separator ';' dan encoding latin-1/cp1252
         2. Hapus baris dengan Media Name atau Article Tittle kosong
         3. Gabungkan Article Tittle + Article Media + Precise Quote menjadi full_content
-        4. Definisikan 3 set keywords untuk analisis
+        4. Ambil 3 set keywords dari registri leksikon
+        5. Hitung semua keywords per artikel dalam satu kali pindai (kolom hitungan_kata)
         
         Sintaks: pd.read_csv(), try/except, dropna(), str.strip(), fillna()
         """
@@ -60,23 +68,15 @@ class AnalisisWacanaNostalgia:
             self.df['Precise Quote'].fillna('')
         )
         
-        # [EKSEKUSI-4.5] Definisikan keywords untuk 3 kategori analisis
-        self.nostalgia_keywords = [
-            'nostalgia', 'nostalgic', 'throwback', 'retro', 'vintage', 
-            'early 2000s', '2000s', 'y2k', 'memories', 'childhood',
-            'past', 'remember', 'reminiscent', 'flashback'
-        ]
-        
-        self.genz_identity_keywords = [
-            'generation z', 'gen z', 'genz', 'young', 'youth', 'teen',
-            'millennial', 'generation', 'identity', 'culture', 'trend',
-            'influence', 'social media', 'tiktok', 'instagram'
-        ]
-        
-        self.fashion_memory_keywords = [
-            'fashion', 'style', 'outfit', 'look', 'aesthetic', 'vibe',
-            'chainmail', 'leather', 'boots', 'jeans', 'accessories'
-        ]
+        # [EKSEKUSI-4.5] Ambil keywords untuk 3 kategori analisis dari registri leksikon.json
+        self.leksikon = leksikon('wacana_nostalgia')
+        self.nostalgia_keywords = self.leksikon['nostalgia']
+        self.genz_identity_keywords = self.leksikon['genz_identity']
+        self.fashion_memory_keywords = self.leksikon['fashion_memory']
+        
+        # [EKSEKUSI-4.6] Satu kali pindai per artikel untuk semua keywords (Counter keyword -> jumlah)
+        # Analisis per keyword, per media, dan filter artikel memakai hitungan ini tanpa memindai ulang
+        self.df['hitungan_kata'] = [self.leksikon.hitung(content) for content in self.df['full_content']]
     
     # [EKSEKUSI-13] Method ini dipanggil dari visualisasi_nostalgia_wordcloud()
     def preprocessing_text(self, text):
@@ -111,22 +111,20 @@ class AnalisisWacanaNostalgia:
         Output: List tuple (keyword, count) diurutkan descending
         
         Perubahan data:
-        1. Gabungkan semua teks menjadi satu string
-        2. Konversi ke lowercase
-        3. Hitung kemunculan setiap keyword
-        4. Urutkan berdasarkan frekuensi tertinggi
+        1. Jumlahkan hitungan keyword semua artikel
+        2. Ambil kemunculan setiap keyword nostalgia
+        3. Urutkan berdasarkan frekuensi tertinggi
         
-        Sintaks: .join(), .astype(str), .count(), dict, sorted(), lambda, .items()
+        Sintaks: sum() dengan Counter, dict, sorted(), lambda, .items()
         """
-        # [EKSEKUSI-6.1] Gabungkan semua konten artikel menjadi satu string
-        # Sintaks: ' '.join() untuk gabung list string dengan separator spasi
-        all_text = ' '.join(self.df['full_content'].astype(str)).lower()
+        # [EKSEKUSI-6.1] Jumlahkan hitungan semua artikel
+        # Sintaks: sum(..., Counter()) untuk menjumlahkan Counter
+        total = sum(self.df['hitungan_kata'], Counter())
         
-        # [EKSEKUSI-6.2] Hitung frekuensi setiap keyword nostalgia
+        # [EKSEKUSI-6.2] Ambil frekuensi setiap keyword nostalgia
         nostalgia_analysis = {}
         for keyword in self.nostalgia_keywords:
-            count = all_text.count(keyword)  # .count() menghitung substring
-            nostalgia_analysis[keyword] = count
+            nostalgia_analysis[keyword] = total[keyword]  # Counter mengembalikan 0 jika tidak ada
         
         # [EKSEKUSI-6.3] Urutkan berdasarkan count (descending)
         # Sintaks: sorted() dengan key=lambda untuk custom sorting
@@ -142,14 +140,13 @@ class AnalisisWacanaNostalgia:
         Output: List tuple (keyword, count) diurutkan descending
         
         Proses sama dengan analisis_wacana_nostalgia() tapi untuk Gen Z keywords
-        Sintaks: .join(), .count(), sorted(), lambda
+        Sintaks: sum() dengan Counter, sorted(), lambda
         """
-        all_text = ' '.join(self.df['full_content'].astype(str)).lower()
+        total = sum(self.df['hitungan_kata'], Counter())
         
         genz_analysis = {}
         for keyword in self.genz_identity_keywords:
-            count = all_text.count(keyword)
-            genz_analysis[keyword] = count
+            genz_analysis[keyword] = total[keyword]
         
         return sorted(genz_analysis.items(), key=lambda x: x[1], reverse=True)
     
@@ -162,14 +159,13 @@ class AnalisisWacanaNostalgia:
         Output: List tuple (keyword, count) diurutkan descending
         
         Proses sama dengan analisis sebelumnya tapi untuk fashion keywords
-        Sintaks: .join(), .count(), sorted(), lambda
+        Sintaks: sum() dengan Counter, sorted(), lambda
         """
-        all_text = ' '.join(self.df['full_content'].astype(str)).lower()
+        total = sum(self.df['hitungan_kata'], Counter())
         
         fashion_analysis = {}
         for keyword in self.fashion_memory_keywords:
-            count = all_text.count(keyword)
-            fashion_analysis[keyword] = count
+            fashion_analysis[keyword] = total[keyword]
         
         return sorted(fashion_analysis.items(), key=lambda x: x[1], reverse=True)
     
@@ -235,10 +231,9 @@ class AnalisisWacanaNostalgia:
         nostalgia_articles = []
         
         # [EKSEKUSI-10.1] enumerate() untuk iterasi dengan index
-        for idx, content in enumerate(self.df['full_content']):
-            text = str(content).lower()
-            # [EKSEKUSI-10.2] any() cek apakah ada keyword yang cocok
-            if any(keyword in text for keyword in self.nostalgia_keywords[:5]):
+        for idx, (content, hitungan) in enumerate(zip(self.df['full_content'], self.df['hitungan_kata'])):
+            # [EKSEKUSI-10.2] any() cek apakah ada keyword yang muncul (dari hitungan per artikel)
+            if any(hitungan[keyword] for keyword in self.nostalgia_keywords[:5]):
                 # [EKSEKUSI-10.3] TextBlob untuk sentiment analysis
                 blob = TextBlob(str(content))
                 nostalgia_articles.append({
@@ -266,7 +261,7 @@ class AnalisisWacanaNostalgia:
         Perubahan data:
         1. Untuk setiap media unik:
            - Filter artikel dari media tersebut
-           - Gabungkan semua teks artikel
+           - Jumlahkan hitungan keyword semua artikelnya
            - Hitung total sebutan nostalgia keywords
            - Hitung total sebutan Gen Z keywords
            - Hitung densitas nostalgia (sebutan per artikel)
@@ -281,12 +276,13 @@ class AnalisisWacanaNostalgia:
         # [EKSEKUSI-11.1] .unique() untuk mendapatkan nilai unik dari kolom
         for media in self.df['Media Name'].unique():
             # [EKSEKUSI-11.2] Boolean indexing untuk filter artikel dari media tertentu
-            media_articles = self.df[self.df['Media Name'] == media]['full_content']
-            all_media_text = ' '.join(media_articles.astype(str)).lower()
+            media_articles = self.df[self.df['Media Name'] == media]['hitungan_kata']
+            hitungan_media = sum(media_articles, Counter())
             
-            # [EKSEKUSI-11.3] sum() dengan generator expression untuk hitung total kemunculan
-            nostalgia_count = sum(all_media_text.count(kw) for kw in self.nostalgia_keywords)
-            genz_count = sum(all_media_text.count(kw) for kw in self.genz_identity_keywords)
+            # [EKSEKUSI-11.3] per_kategori() menjumlahkan kemunculan keyword per kategori
+            per_kategori = self.leksikon.per_kategori(hitungan_media)
+            nostalgia_count = per_kategori['nostalgia']
+            genz_count = per_kategori['genz_identity']
             
             # [EKSEKUSI-11.4] Nested dictionary untuk simpan statistik per media
             media_representation[media] = {
@@ -324,11 +320,10 @@ class AnalisisWacanaNostalgia:
         """
         # [EKSEKUSI-12.1] List comprehension dengan conditional untuk filter artikel
         nostalgia_texts = []
-        for content in self.df['full_content']:
-            text = str(content).lower()
-            # any() untuk cek apakah ada keyword yang cocok
-            if any(keyword in text for keyword in self.nostalgia_keywords):
-                nostalgia_texts.append(text)
+        for content, hitungan in zip(self.df['full_content'], self.df['hitungan_kata']):
+            # any() untuk cek apakah ada keyword nostalgia yang muncul
+            if any(hitungan[keyword] for keyword in self.nostalgia_keywords):
+                nostalgia_texts.append(str(content).lower())
         
         if nostalgia_texts:
             # [EKSEKUSI-12.2] Gabungkan semua teks
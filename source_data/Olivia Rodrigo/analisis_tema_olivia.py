@@ -1,27 +1,25 @@
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-import re
 from collections import Counter
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 import numpy as np
 from datetime import datetime
+import argparse
+from mesin_fetch import aktifkan_arsip, aktifkan_cache, ambil_konten, jalankan_fetch
+from ekstraktor_artikel import TANGGAL_KOSONG, ekstrak_artikel, ekstrak_nama_media
+import olah_artikel
+from leksikon import leksikon
 
 # Tema yang dicari
 TEMA_1 = "Revival Memory: Reproduksi gaya Y2K dalam Media Online"
 TEMA_2 = "Identitas Generasional: Figur Selebriti Olivia Rodrigo sebagai Cultural Intermediary Y2K"
 
-# Keywords untuk tema 1
-keywords_tema1 = ['y2k', 'nostalgia', '2000', 'retro', 'vintage', 'throwback', 'revival', 'aesthetic', 
-                  'fashion', 'style', 'trend', 'era', 'millennium', 'noughties', 'early 2000s']
-
-# Keywords untuk tema 2
-keywords_tema2 = ['olivia rodrigo', 'generation', 'gen z', 'identity', 'cultural', 'influence', 
-                  'celebrity', 'icon', 'represent', 'youth', 'generational', 'intermediary']
+# Keywords untuk tema 1 dan tema 2 (registri leksikon.json)
+keywords_tema1 = leksikon('tema')['tema1']
+keywords_tema2 = leksikon('tema')['tema2']
 
 def baca_excel(file_path):
     """Membaca file Excel dan mengambil URL"""
@@ -29,80 +27,16 @@ def baca_excel(file_path):
     return df
 
 def scrape_artikel(url, timeout=10):
-    """Scraping artikel dari URL"""
+    """Scraping artikel dari URL (satu kali parsing lewat ArticleExtractor)"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Hapus script dan style
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Ambil teks
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        # Coba ambil judul
-        title = soup.find('title')
-        title = title.get_text() if title else "No Title"
-        
-        return {'success': True, 'text': text, 'title': title}
+        artikel = ekstrak_artikel(ambil_konten(url, timeout=timeout), url)
+        return dict(artikel, success=True, text=artikel['teks_utama'], title=artikel['judul'])
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
 def cari_kutipan_relevan(text, keywords, context_length=200):
-    """Mencari kutipan relevan berdasarkan keywords"""
-    text_lower = text.lower()
-    kutipan = []
-    
-    for keyword in keywords:
-        pattern = re.compile(r'.{0,' + str(context_length) + r'}' + re.escape(keyword.lower()) + 
-                           r'.{0,' + str(context_length) + r'}', re.IGNORECASE)
-        matches = pattern.findall(text)
-        
-        for match in matches[:2]:  # Ambil max 2 kutipan per keyword
-            match_clean = match.strip()
-            if len(match_clean) > 50 and match_clean not in kutipan:
-                kutipan.append(match_clean)
-    
-    return kutipan[:3]  # Max 3 kutipan per tema
-
-def ekstrak_nama_media(url):
-    """Ekstrak nama media dari URL"""
-    try:
-        domain = url.split('/')[2]
-        domain = domain.replace('www.', '')
-        return domain.split('.')[0].upper()
-    except:
-        return "Unknown"
-
-def ekstrak_tanggal(text, url):
-    """Mencoba ekstrak tanggal dari teks atau URL"""
-    # Pattern tanggal umum
-    patterns = [
-        r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',
-        r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text[:2000])
-        if match:
-            return match.group()
-    
-    # Coba dari URL
-    url_date = re.search(r'(\d{4})/(\d{2})/(\d{2})', url)
-    if url_date:
-        return f"{url_date.group(1)}-{url_date.group(2)}-{url_date.group(3)}"
-    
-    return "N/A"
+    """Mencari kutipan relevan berdasarkan keywords (max 3 per tema, urut skor relevansi)"""
+    return olah_artikel.cari_kutipan_relevan(text, keywords, context_length, rapikan=False)
 
 def buat_wordcloud(all_text, output_path):
     """Membuat word cloud dari semua teks"""
@@ -120,22 +54,10 @@ def buat_wordcloud(all_text, output_path):
 def buat_diagram_batang(all_kutipan, output_path):
     """Membuat diagram batang pembahasan yang sering muncul"""
     # Gabungkan semua kutipan
-    all_text = ' '.join(all_kutipan).lower()
-    
-    # Kategori pembahasan
-    kategori = {
-        'Fashion & Style': ['fashion', 'style', 'outfit', 'dress', 'clothes', 'aesthetic'],
-        'Music & Performance': ['music', 'song', 'album', 'concert', 'performance', 'tour'],
-        'Y2K & Nostalgia': ['y2k', 'nostalgia', '2000s', 'retro', 'throwback', 'vintage'],
-        'Generation Z': ['gen z', 'generation', 'youth', 'young', 'teenager', 'millennial'],
-        'Cultural Impact': ['culture', 'influence', 'icon', 'trend', 'phenomenon', 'impact'],
-        'Social Media': ['instagram', 'tiktok', 'social media', 'viral', 'online', 'internet']
-    }
+    all_text = ' '.join(all_kutipan)
     
-    counts = {}
-    for kat, keywords in kategori.items():
-        count = sum(all_text.count(kw) for kw in keywords)
-        counts[kat] = count
+    # Kategori pembahasan (registri leksikon.json), dihitung dalam satu kali pindai
+    counts = leksikon('pembahasan').vektor(all_text)
     
     # Sort dan ambil top 8
     sorted_counts = dict(sorted(counts.items(), key=lambda x: x[1], reverse=True)[:8])
@@ -246,6 +168,11 @@ def buat_dokumen_word(data_hasil, ringkasan_url, ringkasan_media, output_path):
 # Main execution
 import os
 
+parser = argparse.ArgumentParser(description='Analisis tema artikel Olivia Rodrigo')
+parser.add_argument('--arsip', action='store_true', help='rekam HTML mentah ke arsip (butuh zstandard) agar bisa diproses ulang dengan --from-archive')
+parser.add_argument('--from-archive', action='store_true', help='proses ulang dari arsip HTML mentah tanpa jaringan')
+args = parser.parse_args()
+
 print("Memulai analisis artikel Olivia Rodrigo...")
 
 # Baca file Excel
@@ -273,19 +200,25 @@ ringkasan_url = []
 all_text = []
 all_kutipan = []
 
-for idx, row in df.iterrows():
+# Scrape semua artikel secara paralel (hasil tetap urut sesuai baris Excel)
+aktifkan_cache()  # rerun hanya merevalidasi halaman, tidak mengunduh ulang
+if args.arsip or args.from_archive:
+    aktifkan_arsip(putar=args.from_archive)
+hasil_scrape = jalankan_fetch(df[url_column].tolist(), worker=scrape_artikel)
+
+for idx, (_, row) in enumerate(df.iterrows()):
     url = row[url_column]
     no = idx + 1
     
     print(f"\n[{no}/{len(df)}] Memproses: {url}")
     
-    # Scrape artikel
-    result = scrape_artikel(url)
+    result = hasil_scrape[idx]
     
     if result['success']:
         text = result['text']
         nama_media = ekstrak_nama_media(url)
-        tanggal = ekstrak_tanggal(text, url)
+        # Skrip ini sejak awal menulis 'N/A' untuk tanggal yang tidak ditemukan
+        tanggal = result['tanggal'] if result['tanggal'] != TANGGAL_KOSONG else 'N/A'
         
         # Cari kutipan untuk tema 1
         kutipan_tema1 = cari_kutipan_relevan(text, keywords_tema1)
@@ -1,142 +1,33 @@
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-import re
 from collections import Counter
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 from datetime import datetime
 import os
+import argparse
+from mesin_fetch import aktifkan_arsip, aktifkan_cache, aktifkan_performa, ambil_konten
+from ekstraktor_artikel import ekstrak_nama_media
+from olah_artikel import KALIMAT_PER_KUTIPAN, parse_artikel_lengkap, olah_halaman
+from skor_kutipan import BOBOT
+from pipeline_scrape import jalankan_pipeline
+from ledger_scrape import LedgerScrape, jalankan_inkremental
+from leksikon import leksikon
+from duplikat_artikel import JUMLAH_PERMUTASI, UKURAN_SHINGLE, kelompokkan_duplikat, peta_kanonik
 
 TEMA_1 = "Revival Memory: Reproduksi gaya Y2K dalam Media Online"
 TEMA_2 = "Identitas Generasional: Figur Selebriti Olivia Rodrigo sebagai Cultural Intermediary Y2K"
 
-keywords_tema1 = ['y2k', 'nostalgia', '2000', 'retro', 'vintage', 'throwback', 'revival', 'aesthetic', 
-                  'fashion', 'style', 'trend', 'era', 'millennium', 'noughties', 'early 2000s', '2000s']
-
-keywords_tema2 = ['olivia rodrigo', 'generation', 'gen z', 'identity', 'cultural', 'influence', 
-                  'celebrity', 'icon', 'represent', 'youth', 'generational', 'intermediary', 'young']
-
-def scrape_artikel(url, timeout=10):
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        title = soup.find('title')
-        title = title.get_text() if title else "No Title"
-        
-        return {'success': True, 'text': text, 'title': title}
-    except Exception as e:
-        return {'success': False, 'error': str(e)}
-
-def cari_kutipan_relevan(text, keywords, context_length=150):
-    text_lower = text.lower()
-    kutipan = []
-    
-    for keyword in keywords:
-        pattern = re.compile(r'.{0,' + str(context_length) + r'}' + re.escape(keyword.lower()) + 
-                           r'.{0,' + str(context_length) + r'}', re.IGNORECASE)
-        matches = pattern.findall(text)
-        
-        for match in matches[:2]:
-            match_clean = ' '.join(match.strip().split())
-            if len(match_clean) > 50 and match_clean not in kutipan:
-                kutipan.append(match_clean)
-    
-    return kutipan[:3]
-
-def ekstrak_nama_media(url):
-    try:
-        domain = url.split('/')[2].replace('www.', '')
-        return domain.split('.')[0].upper()
-    except:
-        return "Unknown"
-
-def ekstrak_tanggal_advanced(text, url, soup=None):
-    """Ekstrak tanggal dengan berbagai metode"""
-    # 1. Coba dari meta tags jika soup tersedia
-    if soup:
-        meta_tags = ['article:published_time', 'datePublished', 'publishdate', 'date']
-        for tag in meta_tags:
-            meta = soup.find('meta', property=tag) or soup.find('meta', {'name': tag})
-            if meta and meta.get('content'):
-                date_str = meta.get('content')
-                try:
-                    date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    return date_obj.strftime('%Y-%m-%d')
-                except:
-                    pass
-    
-    # 2. Pattern tanggal dari teks
-    patterns = [
-        (r'(\d{4})-(\d{2})-(\d{2})', lambda m: f"{m.group(1)}-{m.group(2)}-{m.group(3)}"),
-        (r'(\d{1,2})/(\d{1,2})/(\d{4})', lambda m: f"{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-        (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', 
-         lambda m: convert_month_to_date(m.group(1), m.group(2), m.group(3))),
-    ]
-    
-    for pattern, formatter in patterns:
-        match = re.search(pattern, text[:3000])
-        if match:
-            try:
-                return formatter(match)
-            except:
-                pass
-    
-    # 3. Dari URL
-    url_patterns = [
-        r'/(\d{4})/(\d{2})/(\d{2})/',
-        r'/(\d{4})-(\d{2})-(\d{2})',
-    ]
-    
-    for pattern in url_patterns:
-        match = re.search(pattern, url)
-        if match:
-            return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-    
-    return "Tidak tersedia"
-
-def convert_month_to_date(month, day, year):
-    months = {'January': '01', 'February': '02', 'March': '03', 'April': '04', 
-              'May': '05', 'June': '06', 'July': '07', 'August': '08',
-              'September': '09', 'October': '10', 'November': '11', 'December': '12'}
-    return f"{year}-{months[month]}-{day.zfill(2)}"
+# Keywords tema dan kategori pembahasan ada di registri leksikon.json
+keywords_tema1 = leksikon('tema_revisi')['tema1']
+keywords_tema2 = leksikon('tema_revisi')['tema2']
 
 def scrape_artikel_lengkap(url, timeout=10):
     """Scraping dengan ekstraksi tanggal yang lebih baik"""
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=timeout)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        title = soup.find('title')
-        title = title.get_text() if title else "No Title"
-        
-        tanggal = ekstrak_tanggal_advanced(text, url, soup)
-        
-        return {'success': True, 'text': text, 'title': title, 'tanggal': tanggal}
+        return parse_artikel_lengkap(url, ambil_konten(url, timeout=timeout))
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
@@ -153,20 +44,10 @@ def buat_wordcloud(text, title, output_path):
     plt.close()
 
 def buat_diagram_batang(all_kutipan, output_path):
-    all_text = ' '.join(all_kutipan).lower()
+    all_text = ' '.join(all_kutipan)
     
-    kategori = {
-        'Fashion & Style': ['fashion', 'style', 'outfit', 'dress', 'clothes', 'aesthetic', 'wear'],
-        'Music & Performance': ['music', 'song', 'album', 'concert', 'performance', 'tour', 'sing'],
-        'Y2K & Nostalgia': ['y2k', 'nostalgia', '2000s', 'retro', 'throwback', 'vintage', 'early 2000'],
-        'Generation Z': ['gen z', 'generation', 'youth', 'young', 'teenager', 'millennial'],
-        'Cultural Impact': ['culture', 'influence', 'icon', 'trend', 'phenomenon', 'impact'],
-        'Social Media': ['instagram', 'tiktok', 'social media', 'viral', 'online', 'internet'],
-        'Celebrity & Fame': ['celebrity', 'star', 'famous', 'olivia rodrigo', 'artist', 'singer'],
-        'Beauty & Makeup': ['beauty', 'makeup', 'hair', 'look', 'glam', 'cosmetic']
-    }
-    
-    counts = {kat: sum(all_text.count(kw) for kw in keywords) for kat, keywords in kategori.items()}
+    # Semua kategori dihitung dalam satu kali pindai
+    counts = leksikon('pembahasan_revisi').vektor(all_text)
     sorted_counts = dict(sorted(counts.items(), key=lambda x: x[1], reverse=True)[:8])
     
     plt.figure(figsize=(14, 7))
@@ -187,7 +68,7 @@ def buat_diagram_batang(all_kutipan, output_path):
     plt.savefig(output_path, dpi=300, bbox_inches='tight')
     plt.close()
 
-def buat_dokumen_word(data_hasil, ringkasan_url, ringkasan_media, output_path):
+def buat_dokumen_word(data_hasil, ringkasan_url, ringkasan_media, output_path, sindikasi=None, performa=None):
     doc = Document()
     
     # Judul
@@ -241,6 +122,80 @@ def buat_dokumen_word(data_hasil, ringkasan_url, ringkasan_media, output_path):
                 for run in paragraph.runs:
                     run.font.size = Pt(9)
     
+    # Tabel Sindikasi (artikel yang sama dimuat ulang di beberapa media)
+    if sindikasi:
+        doc.add_heading('Sindikasi Artikel (Hampir Duplikat)', level=1)
+        table_sindikasi = doc.add_table(rows=1, cols=4)
+        table_sindikasi.style = 'Light Grid Accent 1'
+        header_cells = table_sindikasi.rows[0].cells
+        for i, header in enumerate(['Grup', 'Artikel Kanonik', 'Jumlah Salinan', 'Salinan di Media']):
+            header_cells[i].text = header
+            for paragraph in header_cells[i].paragraphs:
+                for run in paragraph.runs:
+                    run.font.bold = True
+                    run.font.size = Pt(11)
+        for item in sindikasi:
+            row_cells = table_sindikasi.add_row().cells
+            row_cells[0].text = str(item['grup'])
+            row_cells[1].text = f"No. {item['no']} - {item['media']} ({item['tanggal']})"
+            row_cells[2].text = str(len(item['salinan']))
+            row_cells[3].text = '\n'.join(f"No. {s['no']} - {s['media']}" for s in item['salinan'])
+            for cell in row_cells:
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(9)
+
+    if performa is not None and len(performa):
+        doc.add_heading('Performa Scraping', level=1)
+        doc.add_paragraph(f"Waktu per URL (ms) untuk {len(performa)} URL yang diambil pada run ini. "
+                          "TTFB dihitung dari request dikirim sampai header diterima, termasuk retry.")
+
+        doc.add_heading('Per Domain (p50 / p95)', level=2)
+        table_domain = doc.add_table(rows=1, cols=6)
+        table_domain.style = 'Light Grid Accent 1'
+        header_cells = table_domain.rows[0].cells
+        for i, header in enumerate(['Domain', 'URL', 'Total', 'TTFB', 'Unduh', 'Parse + Ekstraksi']):
+            header_cells[i].text = header
+            for paragraph in header_cells[i].paragraphs:
+                for run in paragraph.runs:
+                    run.font.bold = True
+                    run.font.size = Pt(10)
+        for item in performa.ringkasan_domain():
+            row_cells = table_domain.add_row().cells
+            row_cells[0].text = item['domain']
+            row_cells[1].text = str(item['jumlah'])
+            row_cells[2].text = f"{item['total_p50']:.0f} / {item['total_p95']:.0f}"
+            row_cells[3].text = f"{item['ttfb_p50']:.0f} / {item['ttfb_p95']:.0f}"
+            row_cells[4].text = f"{item['unduh_p50']:.0f} / {item['unduh_p95']:.0f}"
+            row_cells[5].text = (f"{item['parse_p50'] + item['ekstraksi_p50']:.0f} / "
+                                 f"{item['parse_p95'] + item['ekstraksi_p95']:.0f}")
+            for cell in row_cells:
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(9)
+
+        doc.add_heading('URL Paling Lambat', level=2)
+        table_lambat = doc.add_table(rows=1, cols=5)
+        table_lambat.style = 'Light Grid Accent 1'
+        header_cells = table_lambat.rows[0].cells
+        for i, header in enumerate(['URL', 'Sumber', 'Total (ms)', 'Fase Terlama', 'Ukuran (KB)']):
+            header_cells[i].text = header
+            for paragraph in header_cells[i].paragraphs:
+                for run in paragraph.runs:
+                    run.font.bold = True
+                    run.font.size = Pt(10)
+        for item in performa.paling_lambat(10):
+            row_cells = table_lambat.add_row().cells
+            row_cells[0].text = item['url'][:80]
+            row_cells[1].text = item['sumber'] or '-'
+            row_cells[2].text = f"{item['total_ms']:.0f}"
+            row_cells[3].text = f"{item['fase_dominan']} ({item[item['fase_dominan'] + '_ms']:.0f} ms)"
+            row_cells[4].text = f"{item['byte'] / 1024:.1f}"
+            for cell in row_cells:
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(9)
+
     doc.add_page_break()
     
     # Tabel Kutipan
@@ -306,141 +261,206 @@ def buat_dokumen_word(data_hasil, ringkasan_url, ringkasan_media, output_path):
     
     doc.save(output_path)
 
-# Main execution
-print("="*70)
-print("MEMULAI ANALISIS ARTIKEL OLIVIA RODRIGO (REVISI)")
-print("="*70)
+def main():
+    parser = argparse.ArgumentParser(description='Analisis tema artikel Olivia Rodrigo (revisi)')
+    parser.add_argument('--full-refresh', action='store_true',
+                        help='abaikan ledger dan scraping ulang semua URL')
+    parser.add_argument('--arsip', action='store_true',
+                        help='rekam HTML mentah ke arsip (butuh zstandard) agar bisa diproses ulang dengan --from-archive')
+    parser.add_argument('--from-archive', action='store_true',
+                        help='proses ulang dari arsip HTML mentah tanpa akses jaringan')
+    parser.add_argument('--satu-per-grup', action='store_true',
+                        help='analisis hanya satu salinan kanonik per grup artikel sindikasi')
+    parser.add_argument('--performa', action='store_true',
+                        help='rekam waktu per URL (DNS/connect/TTFB/unduh/parse), ekspor CSV/JSON '
+                             'dan tambahkan bagian Performa Scraping ke dokumen Word')
+    args = parser.parse_args()
+
+    print("="*70)
+    print("MEMULAI ANALISIS ARTIKEL OLIVIA RODRIGO (REVISI)")
+    print("="*70)
+
+    excel_path = 'Bank Link.xlsx'
+    df = pd.read_excel(excel_path)
+
+    print(f"\nDitemukan {len(df)} URL dalam file Excel")
 
-excel_path = 'Bank Link.xlsx'
-df = pd.read_excel(excel_path)
+    url_column = None
+    date_column = None
 
-print(f"\nDitemukan {len(df)} URL dalam file Excel")
+    for col in df.columns:
+        if 'url' in col.lower() or 'link' in col.lower():
+            url_column = col
+        if 'date' in col.lower() or 'tanggal' in col.lower():
+            date_column = col
 
-url_column = None
-date_column = None
+    if url_column is None:
+        url_column = df.columns[0]
 
-for col in df.columns:
-    if 'url' in col.lower() or 'link' in col.lower():
-        url_column = col
-    if 'date' in col.lower() or 'tanggal' in col.lower():
-        date_column = col
+    print(f"Kolom URL: {url_column}")
+    print(f"Kolom Tanggal: {date_column if date_column else 'Tidak ada (akan diekstrak dari artikel)'}")
 
-if url_column is None:
-    url_column = df.columns[0]
+    data_hasil = []
+    ringkasan_url = []
+    all_text_tema1 = []
+    all_text_tema2 = []
+    all_kutipan = []
 
-print(f"Kolom URL: {url_column}")
-print(f"Kolom Tanggal: {date_column if date_column else 'Tidak ada (akan diekstrak dari artikel)'}")
+    # Unduh paralel + parsing/kutipan di process pool, hasil tetap sesuai urutan baris Excel.
+    # Ledger: hanya URL baru / gagal yang layak diulang yang diambil, sisanya dari run sebelumnya
+    aktifkan_cache()  # rerun hanya merevalidasi halaman, tidak mengunduh ulang
+    if args.arsip or args.from_archive:
+        aktifkan_arsip(putar=args.from_archive)
+    performa = aktifkan_performa() if args.performa else None
+    ledger = LedgerScrape(tugas='analisis_tema_olivia_revisi',
+                          versi=[keywords_tema1, keywords_tema2, JUMLAH_PERMUTASI, UKURAN_SHINGLE,
+                                 KALIMAT_PER_KUTIPAN, BOBOT])
+    hasil_scrape, ringkasan_ledger = jalankan_inkremental(
+        ledger, df[url_column].tolist(),
+        lambda urls: jalankan_pipeline(urls, olah_halaman, argumen=(keywords_tema1, keywords_tema2)),
+        # Replay dari arsip selalu mengekstrak ulang semua URL
+        full_refresh=args.full_refresh or args.from_archive,
+        kolom=('tanggal', 'judul', 'kutipan_tema1', 'kutipan_tema2', 'minhash'))
+    print(f"\nMengambil {ringkasan_ledger['diambil']} URL secara paralel "
+          f"({ringkasan_ledger['dari_ledger']} URL dari ledger)...")
+    if performa is not None:
+        performa.ekspor_csv('performa_scraping.csv')
+        performa.ekspor_json('performa_scraping.json')
+        print(f"Performa {len(performa)} URL disimpan ke performa_scraping.csv / performa_scraping.json")
+        for item in performa.ringkasan_domain()[:5]:
+            print(f"  {item['domain']}: p50 {item['total_p50']:.0f} ms | p95 {item['total_p95']:.0f} ms "
+                  f"({item['jumlah']} URL)")
 
-data_hasil = []
-ringkasan_url = []
-all_text_tema1 = []
-all_text_tema2 = []
-all_kutipan = []
+    # Grup artikel sindikasi; kanonik = tanggal terbit paling awal, lalu baris paling atas
+    grup_duplikat = kelompokkan_duplikat([r.get('minhash') if r['success'] else None for r in hasil_scrape])
+    kanonik = peta_kanonik(len(hasil_scrape), grup_duplikat,
+                           kunci=lambda i: (hasil_scrape[i].get('tanggal') or '9999', i))
+    if grup_duplikat:
+        print(f"Ditemukan {len(grup_duplikat)} grup artikel sindikasi "
+              f"({sum(len(g) - 1 for g in grup_duplikat)} salinan)")
 
-for idx, row in df.iterrows():
-    url = row[url_column]
-    no = idx + 1
+    for idx, (_, row) in enumerate(df.iterrows()):
+        url = row[url_column]
+        no = idx + 1
     
-    print(f"\n[{no}/{len(df)}] {url[:70]}...")
+        print(f"\n[{no}/{len(df)}] {url[:70]}...")
     
-    result = scrape_artikel_lengkap(url)
+        result = hasil_scrape[idx]
     
-    if result['success']:
-        text = result['text']
-        nama_media = ekstrak_nama_media(url)
+        if result['success']:
+            nama_media = ekstrak_nama_media(url)
         
-        # Gunakan tanggal dari Excel jika ada, jika tidak ekstrak dari artikel
-        if date_column and pd.notna(row[date_column]):
-            tanggal = str(row[date_column])
-            if 'Timestamp' in str(type(row[date_column])):
-                tanggal = row[date_column].strftime('%Y-%m-%d')
-        else:
-            tanggal = result.get('tanggal', 'Tidak tersedia')
+            # Gunakan tanggal dari Excel jika ada, jika tidak ekstrak dari artikel
+            if date_column and pd.notna(row[date_column]):
+                tanggal = str(row[date_column])
+                if 'Timestamp' in str(type(row[date_column])):
+                    tanggal = row[date_column].strftime('%Y-%m-%d')
+            else:
+                tanggal = result.get('tanggal', 'Tidak tersedia')
         
-        kutipan_tema1 = cari_kutipan_relevan(text, keywords_tema1)
-        kutipan_tema2 = cari_kutipan_relevan(text, keywords_tema2)
+            kutipan_tema1 = result['kutipan_tema1']
+            kutipan_tema2 = result['kutipan_tema2']
+
+            if args.satu_per_grup and kanonik[idx] != idx:
+                print(f"  ✓ Sukses | Salinan dari artikel no. {kanonik[idx] + 1}, dilewati dari analisis")
+            elif kutipan_tema1 or kutipan_tema2:
+                data_hasil.append({
+                    'no': no,
+                    'media': nama_media,
+                    'tanggal': tanggal,
+                    'kutipan_tema1': kutipan_tema1,
+                    'kutipan_tema2': kutipan_tema2
+                })
+            
+                if kutipan_tema1:
+                    all_text_tema1.append(' '.join(kutipan_tema1))
+                if kutipan_tema2:
+                    all_text_tema2.append(' '.join(kutipan_tema2))
+            
+                all_kutipan.extend(kutipan_tema1 + kutipan_tema2)
+            
+                print(f"  ✓ Sukses | Tema 1: {len(kutipan_tema1)} kutipan | Tema 2: {len(kutipan_tema2)} kutipan | Tanggal: {tanggal}")
+            else:
+                print(f"  ✓ Sukses diakses, tidak ada kutipan relevan")
         
-        if kutipan_tema1 or kutipan_tema2:
-            data_hasil.append({
+            ringkasan_url.append({
                 'no': no,
+                'url': url,
                 'media': nama_media,
                 'tanggal': tanggal,
-                'kutipan_tema1': kutipan_tema1,
-                'kutipan_tema2': kutipan_tema2
+                'status': 'Sukses'
             })
-            
-            if kutipan_tema1:
-                all_text_tema1.append(' '.join(kutipan_tema1))
-            if kutipan_tema2:
-                all_text_tema2.append(' '.join(kutipan_tema2))
-            
-            all_kutipan.extend(kutipan_tema1 + kutipan_tema2)
-            
-            print(f"  ✓ Sukses | Tema 1: {len(kutipan_tema1)} kutipan | Tema 2: {len(kutipan_tema2)} kutipan | Tanggal: {tanggal}")
         else:
-            print(f"  ✓ Sukses diakses, tidak ada kutipan relevan")
-        
-        ringkasan_url.append({
-            'no': no,
-            'url': url,
-            'media': nama_media,
-            'tanggal': tanggal,
-            'status': 'Sukses'
-        })
-    else:
-        print(f"  ✗ Gagal: {result['error'][:60]}")
-        ringkasan_url.append({
-            'no': no,
-            'url': url,
-            'media': 'N/A',
-            'tanggal': 'N/A',
-            'status': f"Gagal"
+            print(f"  ✗ Gagal: {result['error'][:60]}")
+            ringkasan_url.append({
+                'no': no,
+                'url': url,
+                'media': 'N/A',
+                'tanggal': 'N/A',
+                'status': f"Gagal"
+            })
+
+    sukses_urls = [r for r in ringkasan_url if r['status'] == 'Sukses']
+    media_list = list(set([r['media'] for r in sukses_urls]))
+
+    ringkasan_media = {
+        'total_url': len(df),
+        'sukses': len(sukses_urls),
+        'gagal': len(df) - len(sukses_urls),
+        'jumlah_media': len(media_list),
+        'daftar_media': sorted(media_list)
+    }
+
+    print("\n" + "="*70)
+    print("RINGKASAN AKHIR:")
+    print("="*70)
+    print(f"Total URL: {ringkasan_media['total_url']}")
+    print(f"Berhasil: {ringkasan_media['sukses']}")
+    print(f"Gagal: {ringkasan_media['gagal']}")
+    print(f"Jumlah media: {ringkasan_media['jumlah_media']}")
+    print(f"Artikel dengan kutipan relevan: {len(data_hasil)}")
+
+    # Fan-out sindikasi: satu artikel kanonik dan media lain yang memuat ulang
+    urls = df[url_column].tolist()
+    sindikasi = []
+    for nomor_grup, grup in enumerate(grup_duplikat, 1):
+        utama = kanonik[grup[0]]
+        sindikasi.append({
+            'grup': nomor_grup,
+            'no': utama + 1,
+            'media': ekstrak_nama_media(urls[utama]),
+            'tanggal': hasil_scrape[utama].get('tanggal', 'Tidak tersedia'),
+            'salinan': [{'no': i + 1, 'media': ekstrak_nama_media(urls[i])} for i in grup if i != utama],
         })
+        print(f"Sindikasi grup {nomor_grup}: artikel no. {utama + 1} dimuat ulang {len(grup) - 1} kali")
+    print("="*70)
+
+    # Buat visualisasi
+    if all_text_tema1:
+        print("\n[1/4] Membuat word cloud tema 1...")
+        combined_text_tema1 = ' '.join(all_text_tema1)
+        buat_wordcloud(combined_text_tema1, 'Word Cloud - Tema 1: Revival Memory Y2K', 'wordcloud_tema1_revisi.png')
+        print("      ✓ Selesai")
+
+    if all_text_tema2:
+        print("[2/4] Membuat word cloud tema 2...")
+        combined_text_tema2 = ' '.join(all_text_tema2)
+        buat_wordcloud(combined_text_tema2, 'Word Cloud - Tema 2: Identitas Generasional', 'wordcloud_tema2_revisi.png')
+        print("      ✓ Selesai")
+
+    if all_kutipan:
+        print("[3/4] Membuat diagram batang...")
+        buat_diagram_batang(all_kutipan, 'diagram_pembahasan_revisi.png')
+        print("      ✓ Selesai")
+
+    print("[4/4] Membuat dokumen Word...")
+    output_path = 'Analisis_Tema_Olivia_Rodrigo_Revisi.docx'
+    buat_dokumen_word(data_hasil, ringkasan_url, ringkasan_media, output_path, sindikasi, performa)
+    print(f"      ✓ Selesai: {output_path}")
+
+    print("\n" + "="*70)
+    print("✓ PROSES SELESAI! Semua file revisi telah dibuat.")
+    print("="*70)
 
-sukses_urls = [r for r in ringkasan_url if r['status'] == 'Sukses']
-media_list = list(set([r['media'] for r in sukses_urls]))
-
-ringkasan_media = {
-    'total_url': len(df),
-    'sukses': len(sukses_urls),
-    'gagal': len(df) - len(sukses_urls),
-    'jumlah_media': len(media_list),
-    'daftar_media': sorted(media_list)
-}
-
-print("\n" + "="*70)
-print("RINGKASAN AKHIR:")
-print("="*70)
-print(f"Total URL: {ringkasan_media['total_url']}")
-print(f"Berhasil: {ringkasan_media['sukses']}")
-print(f"Gagal: {ringkasan_media['gagal']}")
-print(f"Jumlah media: {ringkasan_media['jumlah_media']}")
-print(f"Artikel dengan kutipan relevan: {len(data_hasil)}")
-print("="*70)
-
-# Buat visualisasi
-if all_text_tema1:
-    print("\n[1/4] Membuat word cloud tema 1...")
-    combined_text_tema1 = ' '.join(all_text_tema1)
-    buat_wordcloud(combined_text_tema1, 'Word Cloud - Tema 1: Revival Memory Y2K', 'wordcloud_tema1_revisi.png')
-    print("      ✓ Selesai")
-
-if all_text_tema2:
-    print("[2/4] Membuat word cloud tema 2...")
-    combined_text_tema2 = ' '.join(all_text_tema2)
-    buat_wordcloud(combined_text_tema2, 'Word Cloud - Tema 2: Identitas Generasional', 'wordcloud_tema2_revisi.png')
-    print("      ✓ Selesai")
-
-if all_kutipan:
-    print("[3/4] Membuat diagram batang...")
-    buat_diagram_batang(all_kutipan, 'diagram_pembahasan_revisi.png')
-    print("      ✓ Selesai")
-
-print("[4/4] Membuat dokumen Word...")
-output_path = 'Analisis_Tema_Olivia_Rodrigo_Revisi.docx'
-buat_dokumen_word(data_hasil, ringkasan_url, ringkasan_media, output_path)
-print(f"      ✓ Selesai: {output_path}")
-
-print("\n" + "="*70)
-print("✓ PROSES SELESAI! Semua file revisi telah dibuat.")
-print("="*70)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Arsip HTML mentah (mirip WARC) untuk memproses ulang hasil scraping tanpa jaringan.
+
+Setiap respons ditambahkan (append-only) ke <direktori>/arsip.warc.zst
+sebagai satu frame zstd berisi rekaman bergaya WARC:
+
+    WARC/1.1
+    WARC-Type: response
+    WARC-Target-URI: <url>
+    WARC-Date: <waktu ISO>
+    WARC-Payload-Digest: sha256:<hash body>
+    Content-Length: <panjang blok HTTP>
+
+    HTTP/1.1 <status>
+    <header respons>
+
+    <body>
+
+Karena tiap rekaman adalah frame terpisah, file tetap bisa didekompresi
+utuh dengan `zstd -d`, sekaligus bisa dibaca acak: indeks SQLite
+(<direktori>/indeks.sqlite) menyimpan offset dan panjang frame per URL
+kanonik. Rekaman terbaru untuk sebuah URL yang dipakai saat replay.
+
+Skrip scraping hanya mengaktifkan arsip jika dijalankan dengan --arsip
+(rekam) atau --from-archive (replay), jadi zstandard tidak wajib terpasang.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+from cache_http import url_kanonik
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+DIREKTORI_DEFAULT = 'arsip_html'
+NAMA_ARSIP = 'arsip.warc.zst'
+NAMA_INDEKS = 'indeks.sqlite'
+LEVEL_KOMPRESI = 10
+UKURAN_BACA = 1024 ** 2
+
+
+class TidakAdaDiArsip(LookupError):
+    """URL diminta dalam mode replay tetapi belum pernah diarsipkan"""
+
+
+def _header_blok(baris):
+    return ''.join(f"{k}: {v}\r\n" for k, v in baris).encode('utf-8')
+
+
+def _pisah_header(blok):
+    """b'Baris-1\\r\\nKunci: nilai\\r\\n...' -> (baris pertama, dict header)"""
+    baris = blok.decode('utf-8', errors='replace').split('\r\n')
+    headers = {}
+    for b in baris[1:]:
+        if ':' in b:
+            kunci, nilai = b.split(':', 1)
+            headers[kunci.strip()] = nilai.strip()
+    return baris[0], headers
+
+
+def buat_rekaman(url, status, headers, body, waktu=None):
+    """Rekaman WARC (bytes, belum dikompresi) untuk satu respons"""
+    waktu = waktu or time.time()
+    http = (f"HTTP/1.1 {status}\r\n".encode('utf-8') +
+            _header_blok((k, v) for k, v in dict(headers or {}).items()
+                         if k.lower() not in ('content-encoding', 'transfer-encoding')) +
+            b"\r\n" + body)
+    warc = [
+        ('WARC-Type', 'response'),
+        ('WARC-Target-URI', url),
+        ('WARC-Date', datetime.fromtimestamp(waktu, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')),
+        ('WARC-Payload-Digest', f"sha256:{hashlib.sha256(body).hexdigest()}"),
+        ('Content-Length', str(len(http))),
+    ]
+    return b"WARC/1.1\r\n" + _header_blok(warc) + b"\r\n" + http + b"\r\n\r\n"
+
+
+def baca_rekaman(data):
+    """Kebalikan buat_rekaman: bytes rekaman -> dict(url, status, headers, body, waktu)"""
+    blok_warc, sisa = data.split(b"\r\n\r\n", 1)
+    _, warc = _pisah_header(blok_warc)
+    http = sisa[:int(warc['Content-Length'])]
+    blok_http, body = http.split(b"\r\n\r\n", 1)
+    baris_status, headers = _pisah_header(blok_http)
+    return {
+        'url': warc['WARC-Target-URI'],
+        'status': int(baris_status.split()[1]),
+        'headers': headers,
+        'body': body,
+        'waktu': warc['WARC-Date'],
+        'hash_body': warc['WARC-Payload-Digest'].split(':', 1)[1],
+    }
+
+
+class ArsipHTML:
+    def __init__(self, direktori=DIREKTORI_DEFAULT):
+        """Membuka (atau membuat) arsip beserta indeks offset-nya"""
+        if _zstd is None:
+            raise ImportError("Arsip HTML membutuhkan paket zstandard (pip install zstandard)")
+        os.makedirs(direktori, exist_ok=True)
+        self.path_arsip = os.path.join(direktori, NAMA_ARSIP)
+        self._kompresor = _zstd.ZstdCompressor(level=LEVEL_KOMPRESI)
+        self._dekompresor = _zstd.ZstdDecompressor()
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(os.path.join(direktori, NAMA_INDEKS), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS rekaman (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kunci TEXT,
+                url TEXT,
+                offset INTEGER,
+                panjang INTEGER,
+                hash_body TEXT,
+                waktu REAL
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_kunci ON rekaman (kunci)")
+        self._db.commit()
+
+        self._tulis = open(self.path_arsip, 'ab')
+        self._baca = open(self.path_arsip, 'rb')
+        # Indeks tertinggal dari arsip (mis. proses terhenti sebelum commit): bangun ulang
+        terindeks = self._db.execute("SELECT COALESCE(MAX(offset + panjang), 0) FROM rekaman").fetchone()[0]
+        if terindeks != os.path.getsize(self.path_arsip):
+            self.bangun_ulang_indeks()
+
+    def _terbaru(self, kunci):
+        return self._db.execute(
+            "SELECT offset, panjang, hash_body FROM rekaman WHERE kunci = ? ORDER BY id DESC LIMIT 1",
+            (kunci,)).fetchone()
+
+    def simpan(self, url, status, headers, body):
+        """Menambahkan respons ke arsip; False jika body sama dengan rekaman terbaru URL ini"""
+        kunci = url_kanonik(url)
+        hash_body = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            terbaru = self._terbaru(kunci)
+            if terbaru and terbaru[2] == hash_body:
+                return False
+        frame = self._kompresor.compress(buat_rekaman(str(url), status, headers, body))
+        with self._lock:
+            # Posisi dari akhir file sebenarnya (mode 'ab' selalu menulis di akhir; tell() bisa usang)
+            offset = self._tulis.seek(0, os.SEEK_END)
+            self._tulis.write(frame)
+            self._tulis.flush()
+            self._db.execute("INSERT INTO rekaman (kunci, url, offset, panjang, hash_body, waktu) "
+                             "VALUES (?, ?, ?, ?, ?, ?)",
+                             (kunci, str(url), offset, len(frame), hash_body, time.time()))
+            self._db.commit()
+        return True
+
+    def _baca_frame(self, offset, panjang):
+        with self._lock:
+            self._baca.seek(offset)
+            frame = self._baca.read(panjang)
+        return baca_rekaman(self._dekompresor.decompress(frame))
+
+    def ambil(self, url):
+        """Rekaman terbaru untuk URL (dict) atau None"""
+        with self._lock:
+            baris = self._terbaru(url_kanonik(url))
+        return self._baca_frame(baris[0], baris[1]) if baris else None
+
+    def __contains__(self, url):
+        with self._lock:
+            return self._terbaru(url_kanonik(url)) is not None
+
+    def daftar_url(self):
+        """URL unik di arsip, urut sesuai pertama kali diarsipkan"""
+        with self._lock:
+            baris = self._db.execute("SELECT url, MIN(id) FROM rekaman GROUP BY kunci ORDER BY MIN(id)").fetchall()
+        return [b[0] for b in baris]
+
+    def _iter_frame(self, f):
+        """(offset, panjang terkompresi, data) untuk setiap frame utuh di file arsip"""
+        offset, sisa = 0, b''
+        while True:
+            data = sisa or f.read(UKURAN_BACA)
+            if not data:
+                return
+            obj = self._dekompresor.decompressobj()
+            keluaran, panjang = [], 0
+            while True:
+                try:
+                    keluaran.append(obj.decompress(data))
+                except _zstd.ZstdError:
+                    return          # sisa file rusak, berhenti di frame utuh terakhir
+                if obj.eof:
+                    sisa = obj.unused_data
+                    panjang += len(data) - len(sisa)
+                    break
+                panjang += len(data)
+                data = f.read(UKURAN_BACA)
+                if not data:
+                    return          # frame terakhir terpotong (proses terhenti saat menulis)
+            yield offset, panjang, b''.join(keluaran)
+            offset += panjang
+
+    def bangun_ulang_indeks(self):
+        """Membaca ulang seluruh arsip frame demi frame lalu menulis ulang indeks"""
+        with self._lock:
+            self._db.execute("DELETE FROM rekaman")
+            akhir = 0
+            with open(self.path_arsip, 'rb') as f:
+                for offset, panjang, data in self._iter_frame(f):
+                    rekaman = baca_rekaman(data)
+                    self._db.execute("INSERT INTO rekaman (kunci, url, offset, panjang, hash_body, waktu) "
+                                     "VALUES (?, ?, ?, ?, ?, ?)",
+                                     (url_kanonik(rekaman['url']), rekaman['url'], offset, panjang,
+                                      rekaman['hash_body'], time.time()))
+                    akhir = offset + panjang
+            self._db.commit()
+            # Buang sisa frame yang terpotong supaya rekaman baru tetap sejajar dengan indeks
+            if akhir != os.path.getsize(self.path_arsip):
+                self._tulis.truncate(akhir)
+                self._tulis.seek(akhir)
+
+    def statistik(self):
+        """Jumlah rekaman, URL unik, dan ukuran file arsip"""
+        with self._lock:
+            rekaman, unik = self._db.execute("SELECT COUNT(*), COUNT(DISTINCT kunci) FROM rekaman").fetchone()
+        return {'rekaman': rekaman, 'url': unik, 'ukuran': os.path.getsize(self.path_arsip)}
+
+    def tutup(self):
+        self._tulis.close()
+        self._baca.close()
+        self._db.close()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark mesin_fetch terhadap server HTTP lokal (tanpa akses internet).
+
+Server lokal meniru situs berita dengan latensi tetap per request.
+Beberapa "domain" disimulasikan lewat alamat loopback 127.0.0.x
+sehingga batas konkurensi per domain ikut teruji.
+
+Cara menjalankan:
+    python3 benchmark_fetch.py
+    python3 benchmark_fetch.py --jumlah-url 1000 --latensi 0.1
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mesin_fetch import jalankan_fetch
+
+HALAMAN = (b"<html><head><title>Artikel Uji</title></head><body><article>"
+           + b"<p>Olivia Rodrigo membawa kembali gaya Y2K ke generasi Z.</p>" * 50
+           + b"</article></body></html>")
+
+
+class HandlerLokal(BaseHTTPRequestHandler):
+    latensi = 0.05
+
+    def do_GET(self):
+        time.sleep(self.latensi)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(HALAMAN)))
+        self.end_headers()
+        self.wfile.write(HALAMAN)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ServerLokal(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+
+def jalankan_server(latensi):
+    """Menjalankan server lokal di thread background, mengembalikan (server, port)"""
+    HandlerLokal.latensi = latensi
+    server = ServerLokal(('0.0.0.0', 0), HandlerLokal)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+
+def buat_daftar_url(port, jumlah_url, jumlah_domain):
+    """URL uji yang tersebar ke beberapa host loopback"""
+    return [f"http://127.0.0.{(i % jumlah_domain) + 1}:{port}/artikel/{i}" for i in range(jumlah_url)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark URL per detik untuk mesin_fetch')
+    parser.add_argument('--jumlah-url', type=int, default=512)
+    parser.add_argument('--jumlah-domain', type=int, default=16)
+    parser.add_argument('--per-domain', type=int, default=8)
+    parser.add_argument('--latensi', type=float, default=0.05, help='latensi server per request (detik)')
+    parser.add_argument('--konkurensi', type=int, nargs='+', default=[1, 8, 32, 128])
+    parser.add_argument('--laju', type=float, default=0,
+                        help='request/detik per domain (0 = tanpa token bucket, ukur throughput mentah)')
+    args = parser.parse_args()
+
+    server, port = jalankan_server(args.latensi)
+    urls = buat_daftar_url(port, args.jumlah_url, args.jumlah_domain)
+
+    print("=" * 70)
+    print("BENCHMARK MESIN FETCH")
+    print("=" * 70)
+    print(f"URL: {len(urls)} | Domain: {args.jumlah_domain} | Per domain: {args.per_domain} | "
+          f"Latensi: {args.latensi * 1000:.0f} ms | Laju/domain: {args.laju or '-'}\n")
+    print(f"{'Konkurensi':>10s} | {'Waktu (s)':>10s} | {'URL/detik':>10s} | {'Gagal':>6s}")
+    print("-" * 46)
+
+    for konkurensi in args.konkurensi:
+        # Konkurensi 1 cukup diukur dengan sebagian URL agar tidak terlalu lama
+        sampel = urls if konkurensi > 1 else urls[:max(1, min(len(urls), 64))]
+        mulai = time.perf_counter()
+        hasil = jalankan_fetch(sampel, konkurensi=konkurensi, per_domain=args.per_domain,
+                               laju_per_domain=args.laju or None)
+        durasi = time.perf_counter() - mulai
+        gagal = sum(1 for h in hasil if isinstance(h, dict) and not h.get('success', True))
+        print(f"{konkurensi:>10d} | {durasi:>10.2f} | {len(sampel) / durasi:>10.1f} | {gagal:>6d}")
+
+    server.shutdown()
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark ekstraksi konten utama (konten_utama.PelacakBlok).
+
+Membandingkan ArticleExtractor dengan dan tanpa deteksi konten utama:
+waktu parsing per halaman, jumlah karakter yang diteruskan ke pencarian
+kutipan / word cloud, serta jumlah kutipan yang ditemukan dan berapa yang
+berasal dari luar isi artikel. Halaman sintetis memuat navigasi, banner
+cookie, daftar artikel terkait, dan footer yang ikut menyebut kata kunci
+(sumber kutipan palsu).
+
+Cara menjalankan:
+    python3 benchmark_konten_utama.py halaman_tersimpan/*.html
+    python3 benchmark_konten_utama.py            # pakai halaman sintetis
+"""
+
+import argparse
+import time
+
+from analisis_tema_olivia_revisi import keywords_tema1, keywords_tema2
+from ekstraktor_artikel import ArticleExtractor
+from olah_artikel import cari_kutipan_relevan
+from parser_html import backend_tersedia
+
+
+def halaman_sintetis(jumlah=20):
+    """Halaman artikel tiruan dengan boilerplate yang ikut memuat kata kunci"""
+    navigasi = ''.join(f'<li><a href="/kategori/{i}">Fashion Y2K & Trend {i}</a></li>' for i in range(80))
+    terkait = ''.join(f'<li><a href="/artikel/{i}">Baca juga: nostalgia era 2000 dan gaya retro '
+                      f'selebriti gen z nomor {i} yang sedang viral</a></li>' for i in range(30))
+    cookie = ('<div class="cookie-consent"><p>Kami memakai cookie untuk pengalaman terbaik, termasuk konten '
+              'fashion dan style yang dipersonalisasi. Dengan melanjutkan, Anda menyetujui kebijakan kami.</p></div>')
+    paragraf = ''.join(f'<p>Paragraf {i}: Olivia Rodrigo dan gaya Y2K kembali populer di kalangan gen z, '
+                       f'dengan nuansa nostalgia era 2000-an dalam fashion dan musik.</p>' for i in range(40))
+    footer = ('<footer><p>Ikuti newsletter kami untuk update trend fashion, style selebriti, dan nostalgia '
+              'budaya pop generation terbaru setiap minggu.</p>' f'<ul>{navigasi}</ul></footer>')
+    html = (f'<html><head><title>Artikel Uji</title></head><body>{cookie}<nav><ul>{navigasi}</ul></nav>'
+            f'<div class="container"><article class="post-content"><h1>Judul Artikel</h1>{paragraf}</article>'
+            f'<aside class="sidebar related"><ul>{terkait}</ul></aside></div>{footer}</body></html>')
+    return [html.encode('utf-8')] * jumlah
+
+
+def ukur(halaman, konten_utama, backend, ulang):
+    """(detik, karakter teks per putaran, kutipan, kutipan dari luar isi artikel) untuk satu konfigurasi"""
+    kolom = 'teks_utama' if konten_utama else 'teks'
+    karakter = kutipan = boilerplate = 0
+    mulai = time.perf_counter()
+    for _ in range(ulang):
+        for konten in halaman:
+            artikel = ArticleExtractor.ekstrak(konten, backend=backend, konten_utama=konten_utama)
+            karakter += len(artikel[kolom])
+    durasi = time.perf_counter() - mulai
+    # Pencarian kutipan diukur terpisah supaya waktu parsing tidak tercampur
+    for konten in halaman:
+        artikel = ArticleExtractor.ekstrak(konten, backend=backend)
+        isi = ' '.join(artikel['konten_utama'])
+        teks = artikel[kolom]
+        for keywords in (keywords_tema1, keywords_tema2):
+            for k in cari_kutipan_relevan(teks, keywords):
+                kutipan += 1
+                boilerplate += k not in isi
+    return durasi, karakter // ulang, kutipan, boilerplate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ekstraksi konten utama')
+    parser.add_argument('files', nargs='*', help='file HTML artikel yang disimpan')
+    parser.add_argument('--ulang', type=int, default=5)
+    args = parser.parse_args()
+
+    halaman = [open(f, 'rb').read() for f in args.files] if args.files else halaman_sintetis()
+    print("=" * 78)
+    print("BENCHMARK KONTEN UTAMA")
+    print("=" * 78)
+    print(f"Sumber: {len(args.files)} file" if args.files else "Sumber: halaman sintetis")
+    print(f"\n{'Backend':12s} | {'Mode':14s} | {'ms/halaman':>10s} | {'Karakter':>10s} | {'Kutipan':>8s} | {'Boilerplate':>11s}")
+    print("-" * 80)
+
+    for backend in [b for b in backend_tersedia() if b in ('lxml', 'html.parser')]:
+        dasar = None
+        for konten_utama, mode in ((False, 'teks halaman'), (True, 'konten utama')):
+            durasi, karakter, kutipan, boilerplate = ukur(halaman, konten_utama, backend, args.ulang)
+            print(f"{backend:12s} | {mode:14s} | {durasi * 1000 / (len(halaman) * args.ulang):>10.2f} | "
+                  f"{karakter:>10d} | {kutipan:>8d} | {boilerplate:>11d}")
+            if dasar is None:
+                dasar = karakter
+            elif dasar:
+                print(f"{'':12s} | {'':14s}   pengurangan karakter: {100 * (1 - karakter / dasar):.1f}%")
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark pencarian kutipan: regex per kata kunci vs otomat Aho-Corasick.
+
+Teks diambil dari halaman sintetis server_berita_lokal (diekstrak dengan
+ArticleExtractor seperti saat scraping), sebagian dengan baris baru antar
+kalimat agar batas `.` regex ikut teruji. Otomat dijalankan di semua
+halaman; regex lama terlalu lambat untuk 10.000 halaman, jadi secara
+default hanya dijalankan pada sampel (--sampel-regex) lalu
+diekstrapolasi. Hasil kedua cara dibandingkan per halaman dan harus
+identik.
+
+Juga dibandingkan pencarian kemunculan pertama (find_quotes di
+scrape_articles.py) antara str.find per kata kunci dan otomat.
+
+Cara menjalankan:
+    python3 benchmark_kutipan.py
+    python3 benchmark_kutipan.py --jumlah 10000 --sampel-regex 10000   # regex penuh, lama
+"""
+
+import argparse
+import time
+
+from analisis_tema_olivia_revisi import keywords_tema1, keywords_tema2
+from ekstraktor_artikel import ArticleExtractor
+from otomat_kata_kunci import cari_kutipan, cari_kutipan_regex, kemunculan_pertama
+from server_berita_lokal import MEDIA, halaman_sintetis
+
+# Kata kunci find_quotes di scrape_articles.py
+THEME1_KW = ['Y2K', 'y2k', '2000an', 'nostalgia', 'retro', 'revival', 'early 2000s']
+THEME2_KW = ['Olivia Rodrigo', 'olivia rodrigo', 'Gen Z', 'generation']
+
+
+def buat_teks(jumlah):
+    """Teks artikel dari halaman sintetis; setiap halaman ketiga memakai baris baru antar kalimat"""
+    daftar = []
+    for i in range(jumlah):
+        teks = ArticleExtractor.ekstrak(halaman_sintetis(i % len(MEDIA), i), f"http://127.0.0.1/{i}")['teks_utama']
+        daftar.append(teks.replace('. ', '.\n') if i % 3 == 0 else teks)
+    return daftar
+
+
+def ukur(fungsi, daftar_teks):
+    mulai = time.perf_counter()
+    hasil = [fungsi(teks) for teks in daftar_teks]
+    return hasil, time.perf_counter() - mulai
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pencarian kutipan regex vs otomat')
+    parser.add_argument('--jumlah', type=int, default=10000, help='jumlah halaman')
+    parser.add_argument('--sampel-regex', type=int, default=200, help='jumlah halaman untuk regex lama')
+    parser.add_argument('--konteks', type=int, default=150)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("BENCHMARK PENCARIAN KUTIPAN")
+    print("=" * 70)
+    print(f"Menyiapkan {args.jumlah} halaman...", flush=True)
+    daftar_teks = buat_teks(args.jumlah)
+    rata_karakter = sum(len(t) for t in daftar_teks) / len(daftar_teks)
+    print(f"Rata-rata {rata_karakter:,.0f} karakter per halaman, "
+          f"{len(keywords_tema1)} + {len(keywords_tema2)} kata kunci\n")
+
+    def otomat(teks):
+        return (cari_kutipan(teks, keywords_tema1, args.konteks), cari_kutipan(teks, keywords_tema2, args.konteks))
+
+    def regex(teks):
+        return (cari_kutipan_regex(teks, keywords_tema1, args.konteks),
+                cari_kutipan_regex(teks, keywords_tema2, args.konteks))
+
+    hasil_otomat, waktu_otomat = ukur(otomat, daftar_teks)
+    sampel = daftar_teks[:args.sampel_regex]
+    hasil_regex, waktu_regex = ukur(regex, sampel)
+    beda = sum(1 for a, b in zip(hasil_otomat, hasil_regex) if a != b)
+
+    ms_otomat = waktu_otomat / len(daftar_teks) * 1000
+    ms_regex = waktu_regex / max(1, len(sampel)) * 1000
+    print(f"{'Metode':<22s} | {'Halaman':>8s} | {'ms/halaman':>10s} | {'Total (s)':>10s}")
+    print("-" * 60)
+    print(f"{'Regex per kata kunci':<22s} | {len(sampel):>8d} | {ms_regex:>10.2f} | {waktu_regex:>10.2f}")
+    print(f"{'Otomat Aho-Corasick':<22s} | {len(daftar_teks):>8d} | {ms_otomat:>10.2f} | {waktu_otomat:>10.2f}")
+    print(f"\nEstimasi regex untuk {len(daftar_teks)} halaman: {ms_regex * len(daftar_teks) / 1000:,.0f} s "
+          f"(otomat {ms_otomat and ms_regex / ms_otomat:.0f}x lebih cepat)")
+    print(f"Hasil identik: {len(sampel) - beda}/{len(sampel)} halaman sampel")
+
+    # Kemunculan pertama (find_quotes): str.find berhenti di kata kunci pertama yang ketemu
+    teks_kecil = [t.lower() for t in daftar_teks]
+    _, waktu_find = ukur(lambda t: ([t.find(k.lower()) for k in THEME1_KW], [t.find(k.lower()) for k in THEME2_KW]),
+                         teks_kecil)
+    _, waktu_pertama = ukur(lambda t: (kemunculan_pertama(t, THEME1_KW), kemunculan_pertama(t, THEME2_KW)),
+                            teks_kecil)
+    print(f"\nKemunculan pertama (find_quotes): str.find {waktu_find / len(teks_kecil) * 1000:.3f} ms/halaman, "
+          f"otomat {waktu_pertama / len(teks_kecil) * 1000:.3f} ms/halaman")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
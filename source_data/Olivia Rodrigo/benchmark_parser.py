@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark backend parser HTML (parser_html).
+
+Membandingkan waktu parsing dan memori puncak per backend pada halaman
+artikel yang disimpan (file .html). Setiap backend dijalankan di proses
+terpisah supaya memori puncak (RSS) tidak saling mempengaruhi.
+
+Cara menjalankan:
+    python3 benchmark_parser.py halaman_tersimpan/*.html
+    python3 benchmark_parser.py            # pakai halaman sintetis
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from parser_html import TAG_ARTIKEL, backend_tersedia, buat_soup, ekstrak_elemen
+
+# Pembanding: cara lama di script scraping (pohon BeautifulSoup penuh, html.parser)
+BACKEND_PEMBANDING = ['bs4-penuh', 'bs4-lxml-penuh']
+
+
+def halaman_sintetis(jumlah=20):
+    """Halaman artikel tiruan dengan banyak boilerplate dan aset inline"""
+    navigasi = ''.join(f'<li><a href="/kategori/{i}">Kategori {i}</a></li>' for i in range(150))
+    skrip = '<script>var data = "' + 'x' * 20000 + '";</script>'
+    paragraf = ''.join(f'<p>Paragraf {i}: Olivia Rodrigo dan gaya Y2K kembali populer di kalangan gen z, '
+                       f'dengan nuansa nostalgia era 2000-an dalam fashion dan musik.</p>' for i in range(60))
+    html = (f'<html><head><title>Artikel Uji</title>'
+            f'<meta property="article:published_time" content="2024-05-01T08:00:00Z">{skrip}</head>'
+            f'<body><nav><ul>{navigasi}</ul></nav><article><h1>Judul Artikel</h1>'
+            f'<time datetime="2024-05-01">1 Mei 2024</time>{paragraf}</article>'
+            f'<footer><ul>{navigasi}</ul></footer></body></html>')
+    return [html.encode('utf-8')] * jumlah
+
+
+def jalankan_backend(backend, halaman, ulang):
+    """Parsing semua halaman `ulang` kali; mengembalikan (detik, jumlah elemen)"""
+    jumlah = 0
+    mulai = time.perf_counter()
+    for _ in range(ulang):
+        for konten in halaman:
+            if backend == 'bs4-penuh':
+                jumlah += len(buat_soup(konten, builder='html.parser').find_all(list(TAG_ARTIKEL)))
+            elif backend == 'bs4-lxml-penuh':
+                jumlah += len(buat_soup(konten, builder='lxml').find_all(list(TAG_ARTIKEL)))
+            else:
+                jumlah += len(ekstrak_elemen(konten, TAG_ARTIKEL, backend=backend))
+    return time.perf_counter() - mulai, jumlah
+
+
+def anak(backend, files, ulang):
+    """Dijalankan di subprocess: ukur satu backend lalu cetak JSON"""
+    halaman = [open(f, 'rb').read() for f in files] if files else halaman_sintetis()
+    rss_awal = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    durasi, jumlah = jalankan_backend(backend, halaman, ulang)
+    rss_puncak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        'backend': backend,
+        'halaman': len(halaman) * ulang,
+        'detik': durasi,
+        'elemen': jumlah,
+        'tambahan_rss_kb': rss_puncak - rss_awal,
+        'rss_puncak_kb': rss_puncak,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark backend parser HTML')
+    parser.add_argument('files', nargs='*', help='file HTML artikel yang disimpan')
+    parser.add_argument('--ulang', type=int, default=5)
+    parser.add_argument('--anak', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.anak:
+        anak(args.anak, args.files, args.ulang)
+        return
+
+    daftar_backend = BACKEND_PEMBANDING + backend_tersedia()
+    print("=" * 78)
+    print("BENCHMARK PARSER HTML")
+    print("=" * 78)
+    print(f"Sumber: {len(args.files)} file" if args.files else "Sumber: halaman sintetis")
+    print(f"\n{'Backend':16s} | {'ms/halaman':>10s} | {'Elemen':>8s} | {'+RSS (KB)':>10s} | {'RSS puncak':>10s}")
+    print("-" * 66)
+
+    for backend in daftar_backend:
+        if backend == 'bs4-lxml-penuh' and 'lxml' not in daftar_backend:
+            continue
+        keluaran = subprocess.run([sys.executable, __file__, '--anak', backend, '--ulang', str(args.ulang)] + args.files,
+                                  capture_output=True, text=True)
+        if keluaran.returncode != 0:
+            print(f"{backend:16s} | gagal: {keluaran.stderr.strip().splitlines()[-1]}")
+            continue
+        h = json.loads(keluaran.stdout)
+        print(f"{h['backend']:16s} | {h['detik'] * 1000 / h['halaman']:>10.2f} | {h['elemen']:>8d} | "
+              f"{h['tambahan_rss_kb']:>10d} | {h['rss_puncak_kb']:>10d}")
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark scraping ujung-ke-ujung terhadap server berita lokal (tanpa internet).
+
+Setiap skenario menyalakan server_berita_lokal baru (port baru, jadi
+circuit breaker dan jeda Retry-After tidak terbawa antar skenario), lalu
+menjalankan scraping seperti analisis_tema_olivia_revisi: fetch paralel
+lewat jalankan_pipeline, parsing + pencarian kutipan di process pool.
+Yang dilaporkan per skenario:
+- throughput (URL/detik) dan jumlah URL sukses / gagal
+- distribusi latensi per URL (p50/p90/p95/p99/maks) dari performa_scrape,
+  beserta p95 TTFB dan parse + ekstraksi
+- memori: RSS puncak proses utama dan proses pekerja (ru_maxrss, bersifat
+  kumulatif sepanjang benchmark), serta puncak alokasi Python jika
+  --tracemalloc dipakai
+- status respons yang dilihat server (200/429/5xx/putus)
+
+Hasil bisa disimpan (--simpan) lalu dibandingkan dengan run lain
+(--banding) untuk menilai perubahan scraper.
+
+Cara menjalankan:
+    python3 benchmark_scraping.py
+    python3 benchmark_scraping.py --skenario ideal throttle --jumlah-url 400 --simpan dasar.json
+    python3 benchmark_scraping.py --banding dasar.json
+    python3 benchmark_scraping.py --arsip arsip_html        # halaman rekaman, bukan sintetis
+"""
+
+import argparse
+import json
+import resource
+import time
+import tracemalloc
+
+from analisis_tema_olivia_revisi import keywords_tema1, keywords_tema2
+from mesin_fetch import aktifkan_performa, sesi
+from olah_artikel import olah_halaman
+from performa_scrape import persentil
+from pipeline_scrape import jalankan_pipeline
+from server_berita_lokal import MEDIA, ServerBeritaLokal
+
+SKENARIO = {
+    'ideal': dict(latensi=0.05),
+    'latensi_tinggi': dict(latensi=0.3, jitter=0.2),
+    'throttle': dict(latensi=0.05, batas_per_detik=1),
+    'body_lambat': dict(latensi=0.05, peluang_lambat=0.3, jeda_potongan=0.05),
+    'gagal': dict(latensi=0.05, peluang_gagal=0.15),
+    'campuran': dict(latensi=0.1, jitter=0.1, batas_per_detik=2, peluang_lambat=0.1, peluang_gagal=0.05),
+}
+
+
+def rss_puncak_mb():
+    """(RSS puncak proses utama, RSS puncak proses anak) dalam MB; ru_maxrss Linux dalam KB"""
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024)
+
+
+def jalankan_skenario(nama, konfigurasi, args):
+    server = ServerBeritaLokal(jumlah_domain=args.jumlah_domain, arsip=args.arsip, seed=args.seed,
+                               **konfigurasi).mulai()
+    urls = server.daftar_url(args.jumlah_url)
+    performa = aktifkan_performa()
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    mulai = time.perf_counter()
+    hasil = jalankan_pipeline(urls, olah_halaman, argumen=(keywords_tema1, keywords_tema2),
+                              konkurensi=args.konkurensi, per_domain=args.per_domain,
+                              jumlah_proses=args.proses, laju_per_domain=args.laju or None)
+    durasi = time.perf_counter() - mulai
+
+    alokasi_puncak = None
+    if args.tracemalloc:
+        alokasi_puncak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        tracemalloc.stop()
+    server.berhenti()
+
+    rekaman = performa.daftar()
+    total = [r['total'] * 1000 for r in rekaman]
+    rss_utama, rss_anak = rss_puncak_mb()
+    return {
+        'skenario': nama,
+        'konfigurasi': konfigurasi,
+        'url': len(urls),
+        'sukses': sum(1 for h in hasil if h and h.get('success')),
+        'gagal': sum(1 for h in hasil if not (h and h.get('success'))),
+        'durasi_s': round(durasi, 3),
+        'url_per_detik': round(len(urls) / durasi, 2),
+        'latensi_ms': dict({f"p{p}": round(persentil(total, p), 1) for p in (50, 90, 95, 99)},
+                           maks=round(max(total, default=0.0), 1)),
+        'ttfb_p95_ms': round(persentil([r['ttfb'] * 1000 for r in rekaman], 95), 1),
+        'olah_p95_ms': round(persentil([(r['parse'] + r['ekstraksi']) * 1000 for r in rekaman], 95), 1),
+        'megabyte': round(sum(r['byte'] for r in rekaman) / 1024 ** 2, 2),
+        'rss_utama_mb': round(rss_utama, 1),
+        'rss_pekerja_mb': round(rss_anak, 1),
+        'alokasi_puncak_mb': round(alokasi_puncak, 1) if alokasi_puncak is not None else None,
+        'status_server': {str(k): v for k, v in sorted(server.statistik().items(), key=str)},
+    }
+
+
+def cetak_tabel(daftar, banding=None):
+    print(f"{'Skenario':<15s} | {'URL/s':>7s} | {'Sukses':>6s} | {'p50':>7s} | {'p95':>7s} | {'p99':>7s} | "
+          f"{'TTFB95':>7s} | {'Olah95':>6s} | {'RSS MB':>6s}")
+    print("-" * 96)
+    for h in daftar:
+        print(f"{h['skenario']:<15s} | {h['url_per_detik']:>7.1f} | {h['sukses']:>3d}/{h['url']:<2d} | "
+              f"{h['latensi_ms']['p50']:>7.0f} | {h['latensi_ms']['p95']:>7.0f} | {h['latensi_ms']['p99']:>7.0f} | "
+              f"{h['ttfb_p95_ms']:>7.0f} | {h['olah_p95_ms']:>6.1f} | {h['rss_utama_mb']:>6.0f}")
+        lama = (banding or {}).get(h['skenario'])
+        if lama:
+            def selisih(baru, dasar):
+                return f"{(baru - dasar) / dasar * 100:+.0f}%" if dasar else '-'
+            print(f"{'  vs dasar':<15s} | {selisih(h['url_per_detik'], lama['url_per_detik']):>7s} | {'':>6s} | "
+                  f"{selisih(h['latensi_ms']['p50'], lama['latensi_ms']['p50']):>7s} | "
+                  f"{selisih(h['latensi_ms']['p95'], lama['latensi_ms']['p95']):>7s} | "
+                  f"{selisih(h['latensi_ms']['p99'], lama['latensi_ms']['p99']):>7s} | "
+                  f"{selisih(h['ttfb_p95_ms'], lama['ttfb_p95_ms']):>7s} | "
+                  f"{selisih(h['olah_p95_ms'], lama['olah_p95_ms']):>6s} | "
+                  f"{selisih(h['rss_utama_mb'], lama['rss_utama_mb']):>6s}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scraping terhadap server berita lokal')
+    parser.add_argument('--skenario', nargs='+', choices=sorted(SKENARIO), default=list(SKENARIO))
+    parser.add_argument('--jumlah-url', type=int, default=160)
+    parser.add_argument('--jumlah-domain', type=int, default=len(MEDIA))
+    parser.add_argument('--konkurensi', type=int, default=32)
+    parser.add_argument('--per-domain', type=int, default=4)
+    parser.add_argument('--proses', type=int, default=None, help='jumlah proses parsing (default: jumlah CPU)')
+    parser.add_argument('--laju', type=float, default=2.0,
+                        help='request/detik per domain di scraper (0 = tanpa token bucket)')
+    parser.add_argument('--arsip', default=None, help='sajikan halaman rekaman dari direktori arsip HTML')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tracemalloc', action='store_true', help='ukur puncak alokasi Python (lebih lambat)')
+    parser.add_argument('--simpan', default=None, help='simpan hasil ke file JSON')
+    parser.add_argument('--banding', default=None, help='bandingkan dengan hasil JSON sebelumnya')
+    args = parser.parse_args()
+
+    banding = None
+    if args.banding:
+        with open(args.banding, encoding='utf-8') as f:
+            banding = {h['skenario']: h for h in json.load(f)['hasil']}
+
+    print("=" * 96)
+    print("BENCHMARK SCRAPING (SERVER BERITA LOKAL)")
+    print("=" * 96)
+    print(f"URL: {args.jumlah_url} | Domain: {args.jumlah_domain} | Konkurensi: {args.konkurensi} | "
+          f"Per domain: {args.per_domain} | Laju/domain: {args.laju or '-'} | "
+          f"Halaman: {'rekaman ' + args.arsip if args.arsip else 'sintetis'}\n")
+
+    daftar = []
+    for nama in args.skenario:
+        print(f"Menjalankan skenario {nama}...", flush=True)
+        daftar.append(jalankan_skenario(nama, SKENARIO[nama], args))
+        print(f"  status server: {daftar[-1]['status_server']}")
+
+    print()
+    cetak_tabel(daftar, banding)
+    print("=" * 96)
+    print("Latensi dalam ms per URL (fetch + parsing). RSS puncak bersifat kumulatif sepanjang benchmark.")
+    print(f"Statistik sesi per host: {sum(s['percobaan'] for s in sesi.statistik_host().values())} percobaan, "
+          f"{sum(s['gagal'] for s in sesi.statistik_host().values())} gagal")
+
+    if args.simpan:
+        with open(args.simpan, 'w', encoding='utf-8') as f:
+            json.dump({'argumen': vars(args), 'hasil': daftar}, f, ensure_ascii=False, indent=2)
+        print(f"Hasil disimpan ke {args.simpan}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Cache respons HTTP di disk untuk script scraping.
+
+Body disimpan content-addressed (nama file = SHA-256 isi body) di
+<direktori>/objek/, sedangkan indeks per URL kanonik (status, header,
+waktu fetch, waktu akses terakhir) disimpan di SQLite. Entri yang sudah
+melewati TTL direvalidasi dengan ETag/Last-Modified, dan cache dibatasi
+ukurannya dengan eviction LRU berdasarkan waktu akses terakhir.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DIREKTORI_DEFAULT = '.cache_http'
+TTL_DEFAULT = 7 * 24 * 3600           # 7 hari
+UKURAN_MAKS_DEFAULT = 512 * 1024 ** 2  # 512 MB
+
+
+def url_kanonik(url):
+    """Bentuk kanonik URL untuk kunci cache (host huruf kecil, tanpa fragment, query terurut)"""
+    bagian = urlsplit(str(url).strip())
+    query = urlencode(sorted(parse_qsl(bagian.query, keep_blank_values=True)))
+    path = bagian.path or '/'
+    return urlunsplit((bagian.scheme.lower(), bagian.netloc.lower(), path, query, ''))
+
+
+class CacheRespons:
+    def __init__(self, direktori=DIREKTORI_DEFAULT, ttl=TTL_DEFAULT, ukuran_maks=UKURAN_MAKS_DEFAULT):
+        """Membuka (atau membuat) cache di direktori yang diberikan"""
+        self.direktori = direktori
+        self.ttl = ttl
+        self.ukuran_maks = ukuran_maks
+        self.dir_objek = os.path.join(direktori, 'objek')
+        os.makedirs(self.dir_objek, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(direktori, 'indeks.sqlite'), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entri (
+                kunci TEXT PRIMARY KEY,
+                status INTEGER,
+                headers TEXT,
+                hash_body TEXT,
+                ukuran INTEGER,
+                waktu_fetch REAL,
+                waktu_akses REAL
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_akses ON entri (waktu_akses)")
+        self._db.commit()
+
+    def _path_objek(self, hash_body):
+        return os.path.join(self.dir_objek, hash_body[:2], hash_body)
+
+    def ambil(self, url):
+        """Mengambil entri cache untuk URL (dict) atau None jika tidak ada"""
+        kunci = url_kanonik(url)
+        with self._lock:
+            baris = self._db.execute(
+                "SELECT status, headers, hash_body, waktu_fetch FROM entri WHERE kunci = ?",
+                (kunci,)).fetchone()
+            if baris is None:
+                return None
+            status, headers, hash_body, waktu_fetch = baris
+            try:
+                with open(self._path_objek(hash_body), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                # File objek hilang, anggap entri tidak ada
+                self._db.execute("DELETE FROM entri WHERE kunci = ?", (kunci,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE entri SET waktu_akses = ? WHERE kunci = ?", (time.time(), kunci))
+            self._db.commit()
+
+        return {
+            'url': kunci,
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'waktu_fetch': waktu_fetch,
+        }
+
+    def segar(self, entri):
+        """True jika entri belum melewati TTL"""
+        return (time.time() - entri['waktu_fetch']) < self.ttl
+
+    @staticmethod
+    def header_validasi(entri):
+        """Header If-None-Match / If-Modified-Since untuk revalidasi entri"""
+        headers = {k.lower(): v for k, v in entri['headers'].items()}
+        validasi = {}
+        if 'etag' in headers:
+            validasi['If-None-Match'] = headers['etag']
+        if 'last-modified' in headers:
+            validasi['If-Modified-Since'] = headers['last-modified']
+        return validasi
+
+    def simpan(self, url, status, headers, body):
+        """Menyimpan respons ke cache lalu menjalankan eviction jika perlu"""
+        kunci = url_kanonik(url)
+        hash_body = hashlib.sha256(body).hexdigest()
+        path = self._path_objek(hash_body)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(body)
+            os.replace(tmp, path)
+
+        sekarang = time.time()
+        with self._lock:
+            lama = self._db.execute("SELECT hash_body FROM entri WHERE kunci = ?", (kunci,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entri VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kunci, status, json.dumps(dict(headers)), hash_body, len(body), sekarang, sekarang))
+            if lama and lama[0] != hash_body:
+                self._hapus_objek_jika_yatim(lama[0])
+            self._evict()
+            self._db.commit()
+
+    def perbarui(self, url, headers=None):
+        """Menandai entri masih valid setelah respons 304 Not Modified"""
+        kunci = url_kanonik(url)
+        sekarang = time.time()
+        with self._lock:
+            if headers:
+                baris = self._db.execute("SELECT headers FROM entri WHERE kunci = ?", (kunci,)).fetchone()
+                if baris:
+                    gabungan = json.loads(baris[0])
+                    gabungan.update(dict(headers))
+                    self._db.execute("UPDATE entri SET headers = ? WHERE kunci = ?", (json.dumps(gabungan), kunci))
+            self._db.execute("UPDATE entri SET waktu_fetch = ?, waktu_akses = ? WHERE kunci = ?",
+                             (sekarang, sekarang, kunci))
+            self._db.commit()
+
+    def _hapus_objek_jika_yatim(self, hash_body):
+        dipakai = self._db.execute("SELECT 1 FROM entri WHERE hash_body = ? LIMIT 1", (hash_body,)).fetchone()
+        if not dipakai:
+            try:
+                os.remove(self._path_objek(hash_body))
+            except OSError:
+                pass
+
+    def _evict(self):
+        """Eviction LRU sampai total ukuran body unik di bawah ukuran_maks"""
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(ukuran), 0) FROM (SELECT DISTINCT hash_body, ukuran FROM entri)").fetchone()[0]
+        if total <= self.ukuran_maks:
+            return
+        for kunci, hash_body, ukuran in self._db.execute(
+                "SELECT kunci, hash_body, ukuran FROM entri ORDER BY waktu_akses").fetchall():
+            self._db.execute("DELETE FROM entri WHERE kunci = ?", (kunci,))
+            dipakai = self._db.execute("SELECT 1 FROM entri WHERE hash_body = ? LIMIT 1", (hash_body,)).fetchone()
+            if not dipakai:
+                self._hapus_objek_jika_yatim(hash_body)
+                total -= ukuran
+            if total <= self.ukuran_maks:
+                break
+
+    def statistik(self):
+        """Jumlah entri dan total ukuran body di cache"""
+        with self._lock:
+            jumlah, ukuran = self._db.execute("SELECT COUNT(*), COALESCE(SUM(ukuran), 0) FROM entri").fetchone()
+        return {'entri': jumlah, 'ukuran': ukuran}
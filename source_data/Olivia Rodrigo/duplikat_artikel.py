@@ -0,0 +1,119 @@
+"""
+Deteksi artikel hampir-duplikat (siaran pers yang disindikasi ulang).
+
+Teks artikel dipecah menjadi shingle (k kata berurutan), lalu diringkas
+menjadi tanda MinHash berukuran tetap. Tanda dibagi ke beberapa band
+(LSH): artikel yang punya minimal satu band identik menjadi kandidat,
+sehingga tidak perlu membandingkan semua pasangan (sub-kuadratik).
+Kandidat diverifikasi dengan estimasi kemiripan Jaccard, lalu
+digabung menjadi grup dengan union-find.
+
+Tanda MinHash cukup kecil untuk disimpan di ledger, jadi deteksi bisa
+dijalankan ulang tanpa teks lengkap.
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+
+import numpy as np
+
+JUMLAH_PERMUTASI = 64
+JUMLAH_BAND = 16            # 16 band x 4 baris: kandidat mulai di kemiripan ~0.5
+UKURAN_SHINGLE = 5
+AMBANG_KEMIRIPAN = 0.6
+
+_PRIMA_MERSENNE = np.uint64((1 << 61) - 1)
+_MAKS_HASH = np.uint64((1 << 32) - 1)
+# Parameter permutasi tetap (seed tetap) supaya tanda sama antar proses dan antar run
+_acak = np.random.RandomState(20240501)
+_A = _acak.randint(1, 1 << 32, size=JUMLAH_PERMUTASI, dtype=np.uint64)
+_B = _acak.randint(0, 1 << 32, size=JUMLAH_PERMUTASI, dtype=np.uint64)
+
+POLA_KATA = re.compile(r'\w+')
+
+
+def shingle(teks, k=UKURAN_SHINGLE):
+    """Himpunan k-gram kata (huruf kecil) dari teks"""
+    kata = POLA_KATA.findall(str(teks).lower())
+    if len(kata) < k:
+        return {' '.join(kata)} if kata else set()
+    return {' '.join(kata[i:i + k]) for i in range(len(kata) - k + 1)}
+
+
+def _hash_shingle(s):
+    # hash() bawaan Python berbeda tiap proses (PYTHONHASHSEED), jadi pakai blake2b
+    return int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+def tanda_minhash(teks, k=UKURAN_SHINGLE):
+    """Tanda MinHash (list int, panjang JUMLAH_PERMUTASI) atau None jika teks kosong"""
+    himpunan = shingle(teks, k)
+    if not himpunan:
+        return None
+    nilai = np.fromiter((_hash_shingle(s) for s in himpunan), dtype=np.uint64, count=len(himpunan))
+    # (a*x + b) mod p, dipotong ke 32 bit; overflow uint64 disengaja seperti implementasi MinHash umumnya
+    with np.errstate(over='ignore'):
+        permutasi = ((np.outer(nilai, _A) + _B) % _PRIMA_MERSENNE) & _MAKS_HASH
+    return permutasi.min(axis=0).tolist()
+
+
+def kemiripan(tanda_a, tanda_b):
+    """Estimasi kemiripan Jaccard dari dua tanda MinHash"""
+    return sum(1 for a, b in zip(tanda_a, tanda_b) if a == b) / len(tanda_a)
+
+
+def _akar(induk, i):
+    while induk[i] != i:
+        induk[i] = induk[induk[i]]
+        i = induk[i]
+    return i
+
+
+def kelompokkan_duplikat(daftar_tanda, ambang=AMBANG_KEMIRIPAN, jumlah_band=JUMLAH_BAND):
+    """
+    Grup artikel hampir-duplikat dari list tanda MinHash (None dilewati).
+
+    Mengembalikan list grup (list indeks, urut naik), hanya grup dengan
+    dua anggota atau lebih, urut berdasarkan anggota pertama.
+    """
+    baris_per_band = JUMLAH_PERMUTASI // jumlah_band
+    ember = defaultdict(list)
+    for i, tanda in enumerate(daftar_tanda):
+        if tanda is None:
+            continue
+        for band in range(jumlah_band):
+            potong = tuple(tanda[band * baris_per_band:(band + 1) * baris_per_band])
+            ember[(band, potong)].append(i)
+
+    induk = list(range(len(daftar_tanda)))
+    diperiksa = set()
+    for anggota in ember.values():
+        for posisi, i in enumerate(anggota):
+            for j in anggota[posisi + 1:]:
+                if (i, j) in diperiksa:
+                    continue
+                diperiksa.add((i, j))
+                if kemiripan(daftar_tanda[i], daftar_tanda[j]) >= ambang:
+                    induk[_akar(induk, j)] = _akar(induk, i)
+
+    grup = defaultdict(list)
+    for i, tanda in enumerate(daftar_tanda):
+        if tanda is not None:
+            grup[_akar(induk, i)].append(i)
+    return sorted((g for g in grup.values() if len(g) > 1), key=lambda g: g[0])
+
+
+def pilih_kanonik(grup, kunci=None):
+    """Anggota grup yang dianalisis: nilai kunci(i) terkecil (default: baris pertama)"""
+    return min(grup, key=kunci) if kunci else grup[0]
+
+
+def peta_kanonik(jumlah, daftar_grup, kunci=None):
+    """List sepanjang `jumlah`: indeks kanonik untuk setiap artikel (dirinya sendiri jika unik)"""
+    peta = list(range(jumlah))
+    for grup in daftar_grup:
+        kanonik = pilih_kanonik(grup, kunci)
+        for i in grup:
+            peta[i] = kanonik
+    return peta
@@ -0,0 +1,280 @@
+"""
+Ekstraksi artikel satu kali jalan (single pass) untuk semua script scraping.
+
+ArticleExtractor menerima event parsing (start/end/data) dari parser_html
+dan sekaligus mengisi satu record terstruktur:
+judul, judul h1, tanggal terbit (meta / JSON-LD / <time> / teks / URL),
+URL kanonik, nama situs, daftar paragraf beserta offset-nya, dan teks
+halaman lengkap (pengganti soup.get_text() yang dulu dipakai tiap script).
+Pada jalan yang sama, konten_utama.PelacakBlok memilih isi artikel
+(tanpa navigasi/footer/boilerplate) untuk teks_utama.
+"""
+
+import json
+import re
+from datetime import datetime
+from urllib.parse import urlparse
+
+from konten_utama import PelacakBlok
+from normalisasi_url import nama_penerbit
+from parser_html import jalankan_target
+from performa_scrape import ukur
+
+# Meta tag yang berisi tanggal terbit, urut dari yang paling dipercaya
+META_TANGGAL = ['article:published_time', 'datePublished', 'publishdate', 'date',
+                'publish-date', 'og:published_time', 'pubdate', 'dc.date.issued']
+
+# Paragraf di dalam tag ini bukan isi artikel
+TAG_BUKAN_ARTIKEL = {'nav', 'footer', 'header', 'aside'}
+TAG_TANPA_TEKS = {'script', 'style'}
+
+BULAN = {'January': '01', 'February': '02', 'March': '03', 'April': '04',
+         'May': '05', 'June': '06', 'July': '07', 'August': '08',
+         'September': '09', 'October': '10', 'November': '11', 'December': '12'}
+
+POLA_TANGGAL_TEKS = [
+    (re.compile(r'(\d{4})-(\d{2})-(\d{2})'), lambda m: f"{m.group(1)}-{m.group(2)}-{m.group(3)}"),
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), lambda m: f"{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
+    (re.compile(r'(' + '|'.join(BULAN) + r')\s+(\d{1,2}),?\s+(\d{4})'),
+     lambda m: f"{m.group(3)}-{BULAN[m.group(1)]}-{m.group(2).zfill(2)}"),
+]
+POLA_TANGGAL_URL = [re.compile(r'/(\d{4})/(\d{2})/(\d{2})/'), re.compile(r'/(\d{4})-(\d{2})-(\d{2})')]
+
+TANGGAL_KOSONG = "Tidak tersedia"
+
+
+def ekstrak_nama_media(url):
+    """Nama media dari tabel penerbit (normalisasi_url.PENERBIT), cadangan label domain"""
+    try:
+        return nama_penerbit(url)
+    except Exception:
+        return "Unknown"
+
+
+def normalisasi_tanggal(nilai):
+    """Tanggal ISO/teks bebas -> 'YYYY-MM-DD', atau None"""
+    if not nilai:
+        return None
+    nilai = str(nilai).strip()
+    try:
+        return datetime.fromisoformat(nilai.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+    except ValueError:
+        pass
+    for pola, format_tanggal in POLA_TANGGAL_TEKS:
+        match = pola.search(nilai)
+        if match:
+            return format_tanggal(match)
+    return None
+
+
+def tanggal_dari_teks_atau_url(text, url):
+    """Cadangan: cari tanggal di 3000 karakter pertama teks, lalu di URL"""
+    for pola, format_tanggal in POLA_TANGGAL_TEKS:
+        match = pola.search(text[:3000])
+        if match:
+            return format_tanggal(match), 'teks'
+    for pola in POLA_TANGGAL_URL:
+        match = pola.search(str(url))
+        if match:
+            return f"{match.group(1)}-{match.group(2)}-{match.group(3)}", 'url'
+    return TANGGAL_KOSONG, None
+
+
+def _rapikan_teks_halaman(text):
+    """Normalisasi spasi seperti yang dulu dilakukan setelah soup.get_text()"""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return ' '.join(chunk for chunk in chunks if chunk)
+
+
+def _cari_tanggal_jsonld(data):
+    """Mencari datePublished di struktur JSON-LD (bisa list / @graph)"""
+    if isinstance(data, list):
+        for item in data:
+            tanggal = _cari_tanggal_jsonld(item)
+            if tanggal:
+                return tanggal
+    elif isinstance(data, dict):
+        for kunci in ('datePublished', 'dateCreated', 'uploadDate'):
+            if data.get(kunci):
+                return data[kunci]
+        if '@graph' in data:
+            return _cari_tanggal_jsonld(data['@graph'])
+    return None
+
+
+class ArticleExtractor:
+    def __init__(self, url='', konten_utama=True):
+        """Target parser: dipanggil start/end/data oleh parser_html.jalankan_target"""
+        self.url = url
+        self.pelacak_blok = PelacakBlok() if konten_utama else None
+        self.tumpukan = []          # (tag, daftar penangkap yang dibuka di elemen ini)
+        self.penangkap = []         # penangkap teks yang sedang aktif: [jenis, potongan, attrs]
+        self.dalam_tanpa_teks = 0
+        self.dalam_bukan_artikel = 0
+        self.potongan_halaman = []
+
+        self.judul = None
+        self.judul_h1 = None
+        self.meta = {}
+        self.url_kanonik = None
+        self.tanggal_jsonld = None
+        self.tanggal_time = None
+        self.tanggal_kelas = None
+        self.paragraf = []
+
+    @classmethod
+    def ekstrak(cls, konten, url='', backend=None, konten_utama=True, encoding=None):
+        """
+        Parsing konten HTML sekali jalan dan mengembalikan record artikel (dict).
+        encoding: charset dari header HTTP; tanpa itu dideteksi dari BOM/<meta>.
+        """
+        return jalankan_target(konten, cls(url, konten_utama), backend=backend, encoding=encoding)
+
+    # --- antarmuka target parser ---
+
+    def start(self, tag, attrs):
+        tag = tag.lower() if isinstance(tag, str) else ''
+        dibuka = []
+
+        if tag in TAG_TANPA_TEKS:
+            self.dalam_tanpa_teks += 1
+            if tag == 'script' and 'ld+json' in attrs.get('type', '').lower():
+                dibuka.append(['jsonld', [], attrs])
+        elif tag in TAG_BUKAN_ARTIKEL:
+            self.dalam_bukan_artikel += 1
+        elif tag == 'meta':
+            kunci = attrs.get('property') or attrs.get('name') or attrs.get('itemprop')
+            if kunci and attrs.get('content') and kunci not in self.meta:
+                self.meta[kunci] = attrs['content']
+        elif tag == 'link':
+            if 'canonical' in attrs.get('rel', '').lower().split() and attrs.get('href'):
+                self.url_kanonik = self.url_kanonik or attrs['href']
+        elif tag == 'title' and self.judul is None:
+            dibuka.append(['title', [], attrs])
+        elif tag == 'h1' and self.judul_h1 is None:
+            dibuka.append(['h1', [], attrs])
+        elif tag == 'p':
+            dibuka.append(['p', [], attrs])
+        elif tag == 'time' and self.tanggal_time is None:
+            dibuka.append(['time', [], attrs])
+
+        if self.tanggal_kelas is None and tag not in ('time', 'meta'):
+            kelas = attrs.get('class', '').split()
+            if 'date' in kelas or 'published-date' in kelas:
+                dibuka.append(['kelas_tanggal', [], attrs])
+
+        if self.pelacak_blok and not self.dalam_tanpa_teks:
+            self.pelacak_blok.buka(tag, attrs)
+        self.penangkap.extend(dibuka)
+        self.tumpukan.append((tag, dibuka))
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else ''
+        # HTML sering tidak rapi: tutup sampai elemen yang cocok ditemukan
+        for posisi in range(len(self.tumpukan) - 1, -1, -1):
+            if self.tumpukan[posisi][0] == tag:
+                while len(self.tumpukan) > posisi:
+                    self._tutup_elemen(*self.tumpukan.pop())
+                return
+
+    def data(self, teks):
+        if self.dalam_tanpa_teks:
+            for jenis, potongan, _ in self.penangkap:
+                if jenis == 'jsonld':
+                    potongan.append(teks)
+            return
+        self.potongan_halaman.append(teks)
+        if self.pelacak_blok:
+            self.pelacak_blok.data(teks)
+        for _, potongan, _ in self.penangkap:
+            potongan.append(teks)
+
+    def comment(self, teks):
+        pass
+
+    def close(self):
+        while self.tumpukan:
+            self._tutup_elemen(*self.tumpukan.pop())
+        with ukur('ekstraksi'):
+            return self.hasil()
+
+    # --- internal ---
+
+    def _tutup_elemen(self, tag, dibuka):
+        if tag in TAG_TANPA_TEKS:
+            self.dalam_tanpa_teks -= 1
+        elif tag in TAG_BUKAN_ARTIKEL:
+            self.dalam_bukan_artikel -= 1
+        if self.pelacak_blok and not self.dalam_tanpa_teks:
+            self.pelacak_blok.tutup(tag)
+
+        if dibuka:
+            self.penangkap = [p for p in self.penangkap if not any(p is d for d in dibuka)]
+        for penangkap in dibuka:
+            jenis, potongan, attrs = penangkap
+            teks = ''.join(potongan)
+            if jenis == 'title':
+                self.judul = teks.strip()
+            elif jenis == 'h1':
+                self.judul_h1 = ' '.join(teks.split())
+            elif jenis == 'p':
+                teks = ' '.join(teks.split())
+                if teks and not self.dalam_bukan_artikel:
+                    self.paragraf.append(teks)
+            elif jenis == 'time':
+                self.tanggal_time = attrs.get('datetime') or teks.strip() or None
+            elif jenis == 'kelas_tanggal':
+                self.tanggal_kelas = ' '.join(teks.split()) or None
+            elif jenis == 'jsonld' and self.tanggal_jsonld is None:
+                try:
+                    self.tanggal_jsonld = _cari_tanggal_jsonld(json.loads(teks))
+                except ValueError:
+                    pass
+
+    def _tanggal(self, teks_halaman):
+        """(tanggal 'YYYY-MM-DD', sumber, nilai mentah) dengan urutan prioritas"""
+        kandidat = [(self.meta.get(tag), 'meta') for tag in META_TANGGAL]
+        kandidat += [(self.tanggal_jsonld, 'json-ld'), (self.tanggal_time, 'time'), (self.tanggal_kelas, 'kelas')]
+        for mentah, sumber in kandidat:
+            tanggal = normalisasi_tanggal(mentah)
+            if tanggal:
+                return tanggal, sumber, mentah
+        tanggal, sumber = tanggal_dari_teks_atau_url(teks_halaman, self.url)
+        return tanggal, sumber, None
+
+    def hasil(self):
+        teks_halaman = _rapikan_teks_halaman(''.join(self.potongan_halaman))
+        tanggal, sumber_tanggal, tanggal_mentah = self._tanggal(teks_halaman)
+
+        # Offset (awal, akhir) tiap paragraf di dalam teks_artikel
+        offset, posisi = [], 0
+        for p in self.paragraf:
+            offset.append((posisi, posisi + len(p)))
+            posisi += len(p) + 2
+        domain = urlparse(str(self.url)).netloc.replace('www.', '')
+        konten_utama = self.pelacak_blok.hasil() if self.pelacak_blok else []
+
+        return {
+            'url': self.url,
+            'url_kanonik': self.url_kanonik or self.meta.get('og:url') or self.url,
+            'judul': self.judul or self.meta.get('og:title') or "No Title",
+            'judul_h1': self.judul_h1,
+            'tanggal': tanggal,
+            'sumber_tanggal': sumber_tanggal,
+            'tanggal_mentah': tanggal_mentah,
+            'nama_situs': self.meta.get('og:site_name') or self.meta.get('application-name') or domain,
+            'nama_media': ekstrak_nama_media(self.url),
+            'paragraf': self.paragraf,
+            'offset_paragraf': offset,
+            'teks_artikel': '\n\n'.join(self.paragraf),
+            'teks': teks_halaman,
+            'konten_utama': konten_utama,
+            # Jika konten utama tidak terdeteksi, pakai teks halaman agar tidak ada artikel yang hilang
+            'teks_utama': ' '.join(konten_utama) if konten_utama else teks_halaman,
+        }
+
+
+def ekstrak_artikel(konten, url='', backend=None, konten_utama=True, encoding=None):
+    """Singkatan untuk ArticleExtractor.ekstrak"""
+    return ArticleExtractor.ekstrak(konten, url, backend, konten_utama, encoding)
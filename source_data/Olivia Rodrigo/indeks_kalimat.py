@@ -0,0 +1,120 @@
+"""
+Indeks batas kalimat per dokumen untuk memotong kutipan per kalimat.
+
+Kutipan lama berupa potongan +/- N karakter di sekitar kata kunci, yang
+sering memotong kata dan kalimat di tengah. IndeksKalimat memindai teks
+sekali (waktu linear) dan menyimpan offset awal/akhir setiap kalimat;
+posisi kemunculan kata kunci lalu dipetakan ke kalimatnya dengan bisect
+(O(log n)), atau ke jendela N kalimat di sekitarnya.
+
+Batas kalimat: tanda . ! ? (boleh beruntun dan diikuti tanda kutip /
+kurung tutup) yang diikuti spasi atau akhir teks, serta baris baru.
+Titik pada singkatan umum (Mr., Dr., U.S., e.g.) dan inisial satu huruf
+bukan akhir kalimat, begitu juga titik di dalam angka (2.0) karena tidak
+diikuti spasi.
+
+Teks tanpa tanda baca bisa menjadi satu "kalimat" ribuan karakter; jendela
+yang lebih panjang dari PANJANG_MAKS dipotong menjadi +/- KONTEKS karakter
+di sekitar kata kunci (di batas kata), seperti kutipan per karakter.
+"""
+
+import re
+from bisect import bisect_right
+
+POLA_AKHIR = re.compile(r'[.!?]+["\'”’)\]]*(?=\s|$)|\n')
+SINGKATAN = {'mr', 'mrs', 'ms', 'dr', 'prof', 'st', 'jr', 'sr', 'vs', 'etc', 'no', 'vol', 'inc', 'ltd',
+             'co', 'corp', 'dept', 'est', 'fig', 'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep',
+             'sept', 'oct', 'nov', 'dec', 'u.s', 'u.k', 'e.g', 'i.e', 'a.m', 'p.m', 'dll', 'dsb', 'dkk',
+             'tsb', 'yth', 'bpk', 'sdr'}
+PANJANG_MAKS = 600      # jendela kalimat lebih panjang dari ini dipotong per karakter
+KONTEKS = 150           # +/- karakter di sekitar kata kunci untuk jendela yang dipotong
+
+
+class IndeksKalimat:
+    def __init__(self, teks):
+        """Memindai teks sekali dan mencatat offset (awal, akhir) setiap kalimat"""
+        self.teks = teks
+        self.awal = []
+        self.akhir = []
+        posisi = 0
+        for m in POLA_AKHIR.finditer(teks):
+            if m.group() == '.' and self._singkatan(m.start()):
+                continue
+            self._tambah(posisi, m.start() if m.group() == '\n' else m.end())
+            posisi = m.end()
+        self._tambah(posisi, len(teks))
+
+    def _singkatan(self, titik):
+        """True jika titik di posisi ini milik singkatan atau inisial, bukan akhir kalimat"""
+        awal_kata = titik
+        while awal_kata > 0 and titik - awal_kata < 8 and not self.teks[awal_kata - 1].isspace():
+            awal_kata -= 1
+        kata = self.teks[awal_kata:titik].lstrip('("\'“').lower()
+        return kata in SINGKATAN or (len(kata) == 1 and kata.isalpha())
+
+    def _tambah(self, awal, akhir):
+        teks = self.teks
+        while awal < akhir and teks[awal].isspace():
+            awal += 1
+        while akhir > awal and teks[akhir - 1].isspace():
+            akhir -= 1
+        if awal < akhir:
+            self.awal.append(awal)
+            self.akhir.append(akhir)
+
+    def __len__(self):
+        return len(self.awal)
+
+    def kalimat_ke(self, offset):
+        """Nomor kalimat (0-based) yang memuat offset; spasi antar kalimat ikut kalimat sebelumnya"""
+        if not self.awal:
+            raise IndexError("Teks tidak memiliki kalimat")
+        return min(max(bisect_right(self.awal, offset) - 1, 0), len(self.awal) - 1)
+
+    def kalimat(self, i):
+        """Teks kalimat ke-i"""
+        return self.teks[self.awal[i]:self.akhir[i]]
+
+    def jangkauan(self, i, n=1):
+        """(dari, sampai) nomor kalimat jendela n kalimat berpusat pada kalimat ke-i (inklusif)"""
+        dari = max(0, i - (n - 1) // 2)
+        sampai = min(len(self.awal) - 1, dari + n - 1)
+        dari = max(0, sampai - n + 1)      # di akhir teks, jendela digeser ke belakang
+        return dari, sampai
+
+    def potong(self, awal, akhir, mulai, selesai, konteks=KONTEKS):
+        """
+        (awal, akhir) dipersempit menjadi +/- konteks karakter di sekitar
+        [mulai, selesai) jika lebih panjang dari PANJANG_MAKS; kata di
+        tepi potongan tidak ikut terpotong
+        """
+        if akhir - awal <= PANJANG_MAKS:
+            return awal, akhir
+        teks = self.teks
+        kiri, kanan = max(awal, mulai - konteks), min(akhir, selesai + konteks)
+        while kiri > awal and kiri < mulai and not teks[kiri - 1].isspace():
+            kiri += 1
+        while kanan < akhir and kanan > selesai and not teks[kanan].isspace():
+            kanan -= 1
+        while kiri < mulai and teks[kiri].isspace():
+            kiri += 1
+        while kanan > selesai and teks[kanan - 1].isspace():
+            kanan -= 1
+        return kiri, kanan
+
+    def rentang(self, offset, n=1, panjang_kata=0, konteks=KONTEKS):
+        """
+        (awal, akhir) jendela n kalimat berpusat pada kalimat yang memuat offset;
+        jendela yang terlalu panjang dipotong di sekitar kata di offset (lihat potong)
+        """
+        dari, sampai = self.jangkauan(self.kalimat_ke(offset), n)
+        return self.potong(self.awal[dari], self.akhir[sampai], offset, offset + panjang_kata, konteks)
+
+    def jendela(self, offset, n=1, panjang_kata=0, konteks=KONTEKS):
+        """Teks jendela n kalimat di sekitar offset (n=1: kalimat yang memuat offset)"""
+        awal, akhir = self.rentang(offset, n, panjang_kata, konteks)
+        return self.teks[awal:akhir]
+
+    def semua(self):
+        """Semua kalimat, urut sesuai teks"""
+        return [self.teks[a:b] for a, b in zip(self.awal, self.akhir)]
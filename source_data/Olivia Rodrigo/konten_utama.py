@@ -0,0 +1,162 @@
+"""
+Ekstraksi konten utama (boilerplate removal) ala readability.
+
+PelacakBlok mengikuti event parsing yang sama dengan ArticleExtractor
+(buka/tutup/data) sehingga tetap satu kali jalan. Setiap blok (div,
+section, article, ...) dicatat panjang teks dan panjang teks link-nya;
+setiap unit teks (p, li, blockquote, ... atau teks lepas yang panjang)
+memberi skor ke blok induk dan kakeknya. Blok dengan skor tertinggi
+setelah dikalikan (1 - kepadatan link), beserta saudaranya yang cukup
+kuat, dianggap isi artikel. Navigasi, footer, banner cookie, dan daftar
+artikel terkait tidak ikut ke pencarian kutipan dan word cloud.
+"""
+
+import re
+
+TAG_BLOK = {'body', 'main', 'article', 'section', 'div', 'td', 'table', 'form',
+            'ul', 'ol', 'nav', 'header', 'footer', 'aside'}
+TAG_UNIT = {'p', 'pre', 'blockquote', 'li', 'h2', 'h3', 'h4', 'h5', 'h6', 'dd'}
+
+BOBOT_TAG = {'article': 10, 'main': 10, 'div': 5, 'td': 3, 'section': 3, 'form': -3,
+             'ul': -3, 'ol': -3, 'table': -3, 'nav': -25, 'header': -25,
+             'footer': -25, 'aside': -25}
+
+POLA_POSITIF = re.compile(r'article|body|content|entry|hentry|main|page|post|text|blog|story|berita|isi', re.I)
+POLA_NEGATIF = re.compile(r'comment|contact|foot|masthead|outbrain|promo|related|scroll|share|sidebar|'
+                          r'sponsor|shopping|tags|tool|widget|nav|menu|cookie|banner|consent|newsletter|'
+                          r'subscribe|social|advert|\bad\b|ads|popup|breadcrumb|trending|terkait|baca-juga', re.I)
+
+PANJANG_UNIT_MIN = 25
+PANJANG_TEKS_LEPAS_MIN = 80
+KEPADATAN_LINK_MAKS = 0.5
+
+
+def _bobot_kelas(attrs):
+    nama = f"{attrs.get('class', '')} {attrs.get('id', '')}"
+    if not nama.strip():
+        return 0
+    bobot = 0
+    if POLA_NEGATIF.search(nama):
+        bobot -= 25
+    if POLA_POSITIF.search(nama):
+        bobot += 25
+    return bobot
+
+
+class PelacakBlok:
+    def __init__(self):
+        """Mengumpulkan statistik blok dan unit teks selama parsing"""
+        # Node blok: [tag, induk, bobot, panjang, panjang_link]
+        self.blok = []
+        self.tumpukan_blok = []
+        # Unit yang sedang terbuka: [urutan, blok, potongan, panjang_link]
+        self.tumpukan_unit = []
+        self.teks_lepas = {}         # id blok -> [urutan, potongan]
+        self.dalam_link = 0
+        self.urutan = 0
+        self.unit = []               # (urutan, teks, blok, panjang_link)
+
+    def _blok_aktif(self):
+        return self.tumpukan_blok[-1] if self.tumpukan_blok else None
+
+    def buka(self, tag, attrs):
+        if tag in TAG_BLOK:
+            self.blok.append([tag, self._blok_aktif(), BOBOT_TAG.get(tag, 0) + _bobot_kelas(attrs), 0, 0])
+            self.tumpukan_blok.append(len(self.blok) - 1)
+        if tag in TAG_UNIT:
+            self.tumpukan_unit.append([None, self._blok_aktif(), [], 0])
+        elif tag == 'a':
+            self.dalam_link += 1
+
+    def tutup(self, tag):
+        if tag == 'a':
+            self.dalam_link = max(0, self.dalam_link - 1)
+        if tag in TAG_UNIT and self.tumpukan_unit:
+            urutan, blok, potongan, panjang_link = self.tumpukan_unit.pop()
+            teks = ' '.join(''.join(potongan).split())
+            if teks and urutan is not None:
+                self.unit.append((urutan, teks, blok, panjang_link))
+        if tag in TAG_BLOK and self.tumpukan_blok:
+            id_blok = self.tumpukan_blok.pop()
+            lepas = self.teks_lepas.pop(id_blok, None)
+            if lepas:
+                teks = ' '.join(''.join(lepas[1]).split())
+                if len(teks) >= PANJANG_TEKS_LEPAS_MIN:
+                    self.unit.append((lepas[0], teks, id_blok, 0))
+            # Total subtree diteruskan ke blok induk
+            induk = self.blok[id_blok][1]
+            if induk is not None:
+                self.blok[induk][3] += self.blok[id_blok][3]
+                self.blok[induk][4] += self.blok[id_blok][4]
+
+    def data(self, teks):
+        panjang = len(teks.strip())
+        if not panjang:
+            return
+        self.urutan += 1
+        blok = self._blok_aktif()
+        if blok is not None:
+            self.blok[blok][3] += panjang
+            if self.dalam_link:
+                self.blok[blok][4] += panjang
+        if self.tumpukan_unit:
+            unit = self.tumpukan_unit[-1]
+            if unit[0] is None:
+                unit[0] = self.urutan
+            unit[2].append(teks)
+            if self.dalam_link:
+                unit[3] += panjang
+        elif blok is not None:
+            lepas = self.teks_lepas.setdefault(blok, [self.urutan, []])
+            lepas[1].append(teks)
+
+    def kepadatan_link(self, id_blok):
+        _, _, _, panjang, panjang_link = self.blok[id_blok]
+        return panjang_link / panjang if panjang else 0.0
+
+    def _leluhur(self, id_blok):
+        while id_blok is not None:
+            yield id_blok
+            id_blok = self.blok[id_blok][1]
+
+    def hasil(self):
+        """Daftar teks unit yang termasuk konten utama (urutan dokumen)"""
+        while self.tumpukan_unit:
+            self.tutup('p')
+        while self.tumpukan_blok:
+            self.tutup(self.blok[self.tumpukan_blok[-1]][0])
+
+        skor = {}
+        for _, teks, blok, _ in self.unit:
+            if blok is None or len(teks) < PANJANG_UNIT_MIN:
+                continue
+            nilai = 1 + teks.count(',') + min(len(teks) // 100, 3)
+            for level, id_blok in enumerate(self._leluhur(blok)):
+                if level > 2:
+                    break
+                if id_blok not in skor:
+                    skor[id_blok] = self.blok[id_blok][2]
+                skor[id_blok] += nilai / (1 if level == 0 else level * 2)
+
+        if not skor:
+            return []
+        akhir = {b: s * (1 - self.kepadatan_link(b)) for b, s in skor.items()}
+        terbaik = max(akhir, key=akhir.get)
+        ambang = max(10, akhir[terbaik] * 0.2)
+        induk_terbaik = self.blok[terbaik][1]
+        terpilih = {terbaik}
+        terpilih.update(b for b, s in akhir.items()
+                        if b != terbaik and self.blok[b][1] == induk_terbaik and induk_terbaik is not None
+                        and s >= ambang)
+
+        return [teks for urutan, teks, blok, panjang_link in sorted(self.unit)
+                if self._di_konten(blok, terpilih) and panjang_link / len(teks) <= KEPADATAN_LINK_MAKS]
+
+    def _di_konten(self, blok, terpilih):
+        """True jika blok ada di dalam blok terpilih tanpa melewati blok berbobot negatif kuat"""
+        for id_blok in self._leluhur(blok):
+            if id_blok in terpilih:
+                return True
+            if self.blok[id_blok][2] <= -20:
+                return False
+        return False
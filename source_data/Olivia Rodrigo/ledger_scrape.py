@@ -0,0 +1,197 @@
+"""
+Ledger scraping inkremental (SQLite) untuk Bank Link.
+
+Setiap URL (dengan kunci normalisasi_url.kunci_url) dicatat
+per tugas/script: status, jumlah percobaan, waktu fetch, hash konten,
+pesan error, dan field hasil ekstraksi (JSON). Saat script dijalankan
+ulang, hanya URL baru, URL yang gagal tetapi masih layak dicoba ulang,
+atau URL yang hasilnya dibuat dengan versi (mis. daftar keyword) berbeda
+yang diambil lagi; sisanya digabung dari ledger ke laporan.
+Mode full refresh mengabaikan ledger dan mengambil ulang semua URL.
+
+Versi skema disimpan di PRAGMA user_version. Ledger lama (kunci
+cache_http.url_kanonik, skema 1) dimigrasikan otomatis ke kunci_url saat
+dibuka; baris yang kini berbagi kunci digabung (sukses dan terbaru menang).
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from normalisasi_url import kunci_url
+
+PATH_DEFAULT = '.ledger_scrape.sqlite'
+MAKS_PERCOBAAN = 3
+# 1: kunci url_kanonik, 2: kunci normalisasi_url.kunci_url
+VERSI_SKEMA = 2
+
+STATUS_SUKSES = 'sukses'
+STATUS_GAGAL = 'gagal'
+
+# Kegagalan yang tidak akan berubah jika dicoba ulang (halaman hilang, bukan HTML)
+POLA_GAGAL_PERMANEN = re.compile(r'\b(?:404|410|451)\b|Dilewati')
+
+
+def hash_konten(konten):
+    """SHA-256 dari konten halaman (bytes atau str)"""
+    if isinstance(konten, str):
+        konten = konten.encode('utf-8')
+    return hashlib.sha256(konten or b'').hexdigest()
+
+
+def gagal_permanen(error):
+    """True jika pesan error menunjukkan kegagalan yang tidak perlu dicoba ulang"""
+    return bool(POLA_GAGAL_PERMANEN.search(str(error or '')))
+
+
+class LedgerScrape:
+    def __init__(self, path=PATH_DEFAULT, tugas='default', versi='', maks_percobaan=MAKS_PERCOBAAN):
+        """
+        Membuka (atau membuat) ledger.
+
+        tugas: nama script/analisis, supaya beberapa script bisa berbagi file.
+        versi: apa saja yang mempengaruhi hasil (mis. daftar keyword); jika
+        berubah, hasil lama dianggap usang dan URL diambil ulang.
+        """
+        self.tugas = tugas
+        self.versi = hashlib.sha256(str(versi).encode('utf-8')).hexdigest()[:16]
+        self.maks_percobaan = maks_percobaan
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS ledger (
+                tugas TEXT,
+                kunci TEXT,
+                url TEXT,
+                versi TEXT,
+                status TEXT,
+                percobaan INTEGER,
+                waktu_fetch REAL,
+                hash_konten TEXT,
+                error TEXT,
+                hasil TEXT,
+                PRIMARY KEY (tugas, kunci)
+            )""")
+        self._db.commit()
+        if self._db.execute("PRAGMA user_version").fetchone()[0] < VERSI_SKEMA:
+            self._migrasi_kunci()
+
+    def _migrasi_kunci(self):
+        """Hitung ulang kunci semua baris dari kolom url dengan kunci_url (skema 1 -> 2)"""
+        with self._db:
+            baris = self._db.execute("SELECT * FROM ledger").fetchall()
+            terpilih = {}
+            for b in baris:
+                tugas, url, status, waktu = b[0], b[2], b[4], b[6] or 0
+                kunci = (tugas, kunci_url(url))
+                peringkat = (status == STATUS_SUKSES, waktu)
+                if kunci not in terpilih or peringkat > terpilih[kunci][0]:
+                    terpilih[kunci] = (peringkat, b)
+            self._db.execute("DELETE FROM ledger")
+            self._db.executemany("INSERT INTO ledger VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                 [(k[0], k[1]) + b[2:] for k, (_, b) in terpilih.items()])
+            self._db.execute(f"PRAGMA user_version = {VERSI_SKEMA}")
+
+    def ambil(self, url):
+        """Baris ledger untuk URL (dict) atau None"""
+        with self._lock:
+            baris = self._db.execute(
+                "SELECT url, versi, status, percobaan, waktu_fetch, hash_konten, error, hasil "
+                "FROM ledger WHERE tugas = ? AND kunci = ?", (self.tugas, kunci_url(url))).fetchone()
+        if baris is None:
+            return None
+        kolom = ('url', 'versi', 'status', 'percobaan', 'waktu_fetch', 'hash_konten', 'error', 'hasil')
+        entri = dict(zip(kolom, baris))
+        entri['hasil'] = json.loads(entri['hasil']) if entri['hasil'] else None
+        return entri
+
+    def perlu_diambil(self, url, full_refresh=False):
+        """True jika URL baru, usang, atau gagal dan masih boleh dicoba ulang"""
+        if full_refresh:
+            return True
+        entri = self.ambil(url)
+        if entri is None or entri['versi'] != self.versi:
+            return True
+        if entri['status'] == STATUS_SUKSES:
+            return False
+        return not gagal_permanen(entri['error']) and entri['percobaan'] < self.maks_percobaan
+
+    def catat(self, url, hasil, hash_konten=None):
+        """Mencatat hasil satu URL (dict dengan kunci 'success' / 'error')"""
+        sukses = bool(hasil and hasil.get('success'))
+        error = None if sukses else str((hasil or {}).get('error', 'Tidak ada hasil'))
+        kunci = kunci_url(url)
+        with self._lock:
+            lama = self._db.execute("SELECT percobaan, versi FROM ledger WHERE tugas = ? AND kunci = ?",
+                                    (self.tugas, kunci)).fetchone()
+            # Percobaan dihitung ulang dari nol setelah sukses atau jika versi berubah
+            percobaan = 0 if sukses or not lama or lama[1] != self.versi else lama[0]
+            self._db.execute(
+                "INSERT OR REPLACE INTO ledger VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.tugas, kunci, str(url), self.versi, STATUS_SUKSES if sukses else STATUS_GAGAL,
+                 percobaan + (0 if sukses else 1), time.time(), hash_konten, error,
+                 json.dumps(hasil, ensure_ascii=False, default=str)))
+            self._db.commit()
+
+    def statistik(self):
+        """Jumlah URL per status untuk tugas ini"""
+        with self._lock:
+            baris = self._db.execute("SELECT status, COUNT(*) FROM ledger WHERE tugas = ? GROUP BY status",
+                                     (self.tugas,)).fetchall()
+        return dict(baris)
+
+
+def jalankan_inkremental(ledger, urls, ambil_semua, full_refresh=False, kolom=None):
+    """
+    Mengambil hanya URL yang perlu diambil lalu menggabungkannya dengan ledger.
+
+    ambil_semua(daftar_url) harus mengembalikan list hasil (dict) dengan
+    urutan yang sama, mis. lambda u: jalankan_fetch(u, worker=...).
+    Semua ejaan asli sebuah URL (varian AMP/mobile/pelacak) ikut dikirim
+    ke ambil_semua, supaya jalankan_fetch/jalankan_pipeline bisa mengambil
+    kelompok itu sekali dan mencoba ejaan lain jika ejaan pertama gagal.
+    kolom: field hasil yang disimpan di ledger (None = semua). Hasil boleh
+    berisi 'hash_konten' sebagai hash halaman mentah.
+
+    Mengembalikan (list hasil sesuai urutan urls, ringkasan dict).
+    """
+    urls = list(urls)
+    # kunci_url -> semua URL baris kelompok itu; dicatat di ledger sekali per kelompok
+    perlu, dicek = {}, set()
+    for url in urls:
+        kunci = kunci_url(url)
+        if kunci in perlu:
+            perlu[kunci].append(url)
+        elif kunci not in dicek:
+            dicek.add(kunci)
+            if ledger.perlu_diambil(url, full_refresh):
+                perlu[kunci] = [url]
+
+    daftar = [url for kelompok in perlu.values() for url in kelompok]
+    baru = ambil_semua(daftar) if daftar else []
+    awal = 0
+    for kelompok in perlu.values():
+        hasil_kelompok = baru[awal:awal + len(kelompok)]
+        awal += len(kelompok)
+        # Hasil berhasil pertama (ambil_semua yang tidak mengelompokkan mengambil tiap ejaan sendiri)
+        hasil = next((h for h in hasil_kelompok if h and h.get('success') is not False), hasil_kelompok[0])
+        if hasil and kolom:
+            hasil = {k: hasil[k] for k in ('success', 'error', 'hash_konten') + tuple(kolom) if k in hasil}
+        ledger.catat(kelompok[0], hasil, (hasil or {}).get('hash_konten'))
+
+    hasil_akhir = []
+    for url in urls:
+        entri = ledger.ambil(url)
+        hasil_akhir.append(entri['hasil'] if entri and entri['hasil'] is not None
+                           else {'success': False, 'error': 'Tidak ada hasil'})
+
+    ringkasan = {
+        'total': len(urls),
+        'diambil': len(perlu),
+        'dari_ledger': len(urls) - sum(1 for u in urls if kunci_url(u) in perlu),
+        'full_refresh': full_refresh,
+    }
+    return hasil_akhir, ringkasan
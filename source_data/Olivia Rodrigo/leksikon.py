@@ -0,0 +1,97 @@
+"""
+Registri leksikon: semua daftar kata kunci kategori di satu tempat.
+
+Daftar kata kunci sebelumnya tersebar dan diduplikasi di setiap skrip
+(keywords_tema1/2, kategori diagram batang, tema AnalisisTipologi, tiga
+daftar AnalisisWacanaNostalgia), dan setiap kategori dihitung dengan
+text.count(kw) per kata kunci, diulang per artikel dan per media.
+
+Di sini setiap leksikon (kumpulan kategori -> kata kunci) dimuat dari
+leksikon.json (atau file YAML), semua kata kuncinya dikompilasi menjadi
+satu otomat Aho-Corasick, lalu satu kali pindai per dokumen menghasilkan
+jumlah per kata kunci. Vektor per kategori dijumlahkan dari situ, dan
+vektor per dokumen bisa dijumlahkan lagi per media / per periode tanpa
+memindai ulang teks. Jumlah per kata kunci sama dengan str.count pada
+teks huruf kecil.
+
+Contoh:
+    from leksikon import leksikon
+    tipologi = leksikon('tipologi')
+    hitungan = tipologi.hitung(teks)            # Counter kata kunci -> jumlah
+    tipologi.per_kategori(hitungan)             # {'Fashion & Style': 3, ...}
+"""
+
+import functools
+import json
+import os
+from collections import Counter
+
+from otomat_kata_kunci import otomat_untuk
+
+try:
+    import yaml as _yaml
+except ImportError:
+    _yaml = None
+
+PATH_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'leksikon.json')
+
+
+class Leksikon:
+    def __init__(self, kategori, nama=''):
+        """kategori: dict nama kategori -> daftar kata kunci (kata kunci boleh dipakai di beberapa kategori)"""
+        self.nama = nama
+        self.kategori = {kat: [k.lower() for k in kata] for kat, kata in kategori.items()}
+        self.kata = list(dict.fromkeys(k for kata in self.kategori.values() for k in kata))
+        self._otomat = otomat_untuk(tuple(self.kata))
+
+    def __getitem__(self, kategori):
+        """Daftar kata kunci satu kategori"""
+        return self.kategori[kategori]
+
+    def __iter__(self):
+        return iter(self.kategori)
+
+    def items(self):
+        return self.kategori.items()
+
+    def hitung(self, teks):
+        """Counter kata kunci -> jumlah kemunculan di teks (satu kali pindai, tanpa membedakan huruf)"""
+        teks_kecil = str(teks).lower()
+        if self._otomat is None:
+            jumlah = [teks_kecil.count(k) for k in self.kata]
+        else:
+            jumlah = self._otomat.hitung(teks_kecil)
+        return Counter({k: n for k, n in zip(self.kata, jumlah) if n})
+
+    def per_kategori(self, hitungan):
+        """Vektor jumlah per kategori (urutan sesuai registri) dari hasil hitung()"""
+        return {kat: sum(hitungan[k] for k in kata) for kat, kata in self.kategori.items()}
+
+    def vektor(self, teks):
+        """Jumlah kata kunci per kategori untuk satu teks"""
+        return self.per_kategori(self.hitung(teks))
+
+
+def muat_registri(path=PATH_DEFAULT):
+    """Semua leksikon di file JSON/YAML: dict nama -> Leksikon"""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            if _yaml is None:
+                raise ImportError("Leksikon YAML membutuhkan paket PyYAML (pip install pyyaml)")
+            data = _yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    return {nama: Leksikon(kategori, nama) for nama, kategori in data.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _registri(path):
+    return muat_registri(path)
+
+
+def leksikon(nama, path=PATH_DEFAULT):
+    """Leksikon bernama dari registri (file dimuat dan dikompilasi sekali per proses)"""
+    registri = _registri(path)
+    if nama not in registri:
+        raise KeyError(f"Leksikon '{nama}' tidak ada di {path} (tersedia: {', '.join(registri)})")
+    return registri[nama]
@@ -0,0 +1,309 @@
+"""
+Mesin fetch asinkron untuk scraping URL dari Bank Link.
+
+Semua script scraping memakai modul ini supaya URL diambil secara paralel
+dengan batas konkurensi global dan batas konkurensi per domain.
+Kesopanan per domain diatur token bucket (laju request per detik per
+domain, menghormati Retry-After) dan URL dijadwalkan bergiliran antar
+domain, sehingga lama total mengikuti jumlah domain, bukan jumlah URL.
+Sebelum fetch, baris dikelompokkan dengan URL normal (normalisasi_url.py)
+sehingga varian AMP/mobile/pelacak dari artikel yang sama hanya diambil
+sekali lalu hasilnya dibagikan ke semua barisnya. Yang di-fetch adalah
+URL asli baris pertama kelompok; jika gagal, URL asli lain di kelompok
+itu dicoba berurutan.
+Hasil selalu dikembalikan sesuai urutan URL masukan (urutan baris Excel).
+Jika arsip aktif (arsip_html.py), setiap body direkam ke arsip HTML mentah;
+mode replay membaca dari arsip saja tanpa jaringan.
+Body diunduh secara streaming (lihat unduhan.py): dibatasi ukurannya,
+respons non-HTML dilewati, dan bisa berhenti dini setelah isi artikel.
+ambil_konten mengembalikan unduhan.Konten (bytes + charset header
+Content-Type), juga untuk body dari cache dan arsip.
+Jika perekam performa aktif (performa_scrape.py), setiap URL mendapat
+rekaman waktu per fase (dns, connect, ttfb, unduh, parse, ekstraksi).
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import performa_scrape
+from arsip_html import DIREKTORI_DEFAULT as DIREKTORI_ARSIP_DEFAULT, ArsipHTML, TidakAdaDiArsip
+from cache_http import CacheRespons, DIREKTORI_DEFAULT, TTL_DEFAULT, UKURAN_MAKS_DEFAULT
+from normalisasi_url import rencana_unik, url_asli
+from sesi_http import SesiHTTP
+from unduhan import (BATAS_BYTE_DEFAULT, HEADER_TERPOTONG, baca_body, buat_konten, entri_cukup,
+                     periksa_tipe_konten, periksa_url)
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+KONKURENSI_DEFAULT = 32
+PER_DOMAIN_DEFAULT = 4
+LAJU_PER_DOMAIN_DEFAULT = 2.0      # request per detik per domain
+KAPASITAS_BUCKET_DEFAULT = 2       # burst yang diizinkan per domain
+
+# Session bersama (pool koneksi, retry, circuit breaker) untuk semua script
+sesi = SesiHTTP()
+_cache = None
+_unduhan = {'batas_byte': BATAS_BYTE_DEFAULT, 'henti_dini': False}
+_arsip = None
+_putar_arsip = False
+_performa = None
+
+
+def aktifkan_cache(direktori=DIREKTORI_DEFAULT, ttl=TTL_DEFAULT, ukuran_maks=UKURAN_MAKS_DEFAULT):
+    """Mengaktifkan cache respons di disk untuk semua pemanggilan ambil_konten"""
+    global _cache
+    _cache = CacheRespons(direktori, ttl, ukuran_maks)
+    return _cache
+
+
+def aktifkan_arsip(direktori=DIREKTORI_ARSIP_DEFAULT, putar=False):
+    """
+    Mengaktifkan arsip HTML mentah untuk semua pemanggilan ambil_konten.
+
+    putar=False: setiap halaman yang diambil ikut direkam ke arsip.
+    putar=True: mode replay, halaman hanya dibaca dari arsip (tanpa jaringan).
+    """
+    global _arsip, _putar_arsip
+    _arsip = ArsipHTML(direktori)
+    _putar_arsip = putar
+    return _arsip
+
+
+def aktifkan_performa():
+    """Mengaktifkan rekaman waktu per URL untuk jalankan_fetch / jalankan_pipeline"""
+    global _performa
+    _performa = performa_scrape.PerekamPerforma()
+    return _performa
+
+
+def perekam_performa():
+    """PerekamPerforma yang aktif, atau None"""
+    return _performa
+
+
+def panggil_terukur(fungsi, url):
+    """fungsi(url), direkam ke perekam performa jika aktif (dipanggil di thread worker)"""
+    if _performa is None:
+        return fungsi(url)
+    with performa_scrape.rekam(url) as rekaman:
+        try:
+            hasil = fungsi(url)
+        finally:
+            _performa.tambah(rekaman)
+        if isinstance(hasil, dict) and not hasil.get('success', True):
+            rekaman['error'] = str(hasil.get('error', ''))
+    return hasil
+
+
+def mode_replay():
+    """True jika ambil_konten sedang membaca dari arsip, bukan dari jaringan"""
+    return _arsip is not None and _putar_arsip
+
+
+def _rekam(url, status, headers, body):
+    if _arsip is not None and not _putar_arsip:
+        _arsip.simpan(url, status, headers, body)
+    return buat_konten(body, headers)
+
+
+def atur_unduhan(batas_byte=BATAS_BYTE_DEFAULT, henti_dini=False):
+    """
+    Mengatur unduhan streaming untuk semua pemanggilan ambil_konten.
+
+    batas_byte: ukuran body maksimum (None/0 = tanpa batas).
+    henti_dini: berhenti membaca setelah </article> atau cukup banyak <p>.
+    """
+    _unduhan.update(batas_byte=batas_byte, henti_dini=henti_dini)
+
+
+def ambil_konten(url, timeout=10, headers=None):
+    """Mengambil isi halaman (unduhan.Konten: bytes + charset header) dari URL, lewat cache jika aktif"""
+    periksa_url(url)
+    if mode_replay():
+        rekaman = _arsip.ambil(url)
+        if rekaman is None:
+            raise TidakAdaDiArsip(f"URL tidak ada di arsip: {url}")
+        performa_scrape.atur(sumber='arsip', status=rekaman['status'], byte=len(rekaman['body']))
+        return buat_konten(rekaman['body'], rekaman['headers'])
+
+    headers = dict(headers or HEADERS)
+    entri = _cache.ambil(url) if _cache else None
+    # Body terpotong di cache hanya dipakai jika mode unduhan saat ini juga memotongnya
+    if entri and not entri_cukup(entri, **_unduhan):
+        entri = None
+    if entri and _cache.segar(entri):
+        performa_scrape.atur(sumber='cache', status=entri['status'], byte=len(entri['body']))
+        return _rekam(url, entri['status'], entri['headers'], entri['body'])
+    if entri:
+        headers.update(_cache.header_validasi(entri))
+
+    # ttfb: dari request dikirim sampai header diterima (dns/connect dicatat terpisah)
+    with performa_scrape.ukur('ttfb'):
+        response = sesi.get(url, headers=headers, timeout=timeout, stream=True)
+    if entri and response.status_code == 304:
+        response.close()
+        _cache.perbarui(url, response.headers)
+        performa_scrape.atur(sumber='revalidasi', status=entri['status'], byte=len(entri['body']))
+        return _rekam(url, entri['status'], entri['headers'], entri['body'])
+    performa_scrape.atur(sumber='jaringan', status=response.status_code)
+    if not response.ok:
+        response.close()
+    response.raise_for_status()
+    periksa_tipe_konten(response)
+
+    with performa_scrape.ukur('unduh'):
+        body, terpotong = baca_body(response, **_unduhan)
+    performa_scrape.atur(byte=len(body))
+    if _cache:
+        response_headers = dict(response.headers)
+        if terpotong:
+            response_headers[HEADER_TERPOTONG] = terpotong
+        _cache.simpan(url, response.status_code, response_headers, body)
+    return _rekam(url, response.status_code, response.headers, body)
+
+
+def kunci_domain(url):
+    """Kunci domain untuk pembatasan konkurensi per domain"""
+    try:
+        return urlparse(str(url)).netloc.lower().replace('www.', '')
+    except Exception:
+        return ''
+
+
+def urutan_antar_domain(urls):
+    """Indeks urls yang disusun bergiliran antar domain (round-robin)"""
+    per_domain = OrderedDict()
+    for i, url in enumerate(urls):
+        per_domain.setdefault(kunci_domain(url), []).append(i)
+    antrian = list(per_domain.values())
+    urutan = []
+    for putaran in range(max((len(a) for a in antrian), default=0)):
+        urutan.extend(a[putaran] for a in antrian if putaran < len(a))
+    return urutan
+
+
+class TokenBucket:
+    def __init__(self, laju, kapasitas=KAPASITAS_BUCKET_DEFAULT):
+        """Token bucket untuk satu domain: `laju` token per detik, maksimal `kapasitas`"""
+        self.laju = laju
+        self.kapasitas = kapasitas
+        self.token = float(kapasitas)
+        self.terakhir = time.monotonic()
+
+    def reservasi(self, jeda_sampai=0.0):
+        """Mengambil satu token; mengembalikan lama tunggu (detik) sebelum request boleh dikirim"""
+        sekarang = time.monotonic()
+        self.token = min(self.kapasitas, self.token + (sekarang - self.terakhir) * self.laju)
+        self.terakhir = sekarang
+        self.token -= 1
+        tunggu = -self.token / self.laju if self.token < 0 else 0.0
+        return max(tunggu, jeda_sampai - sekarang)
+
+
+class PembatasKonkurensi:
+    def __init__(self, konkurensi=KONKURENSI_DEFAULT, per_domain=PER_DOMAIN_DEFAULT,
+                 laju_per_domain=LAJU_PER_DOMAIN_DEFAULT, kapasitas=KAPASITAS_BUCKET_DEFAULT):
+        """
+        Semaphore global + semaphore dan token bucket per domain (dibuat di
+        dalam event loop). laju_per_domain=None mematikan token bucket.
+        """
+        self.semafor_global = asyncio.Semaphore(konkurensi)
+        self.per_domain = per_domain
+        # Replay dari arsip tidak menyentuh server, jadi tidak perlu dibatasi lajunya
+        self.laju_per_domain = None if mode_replay() else laju_per_domain
+        self.kapasitas = kapasitas
+        self.semafor_per_domain = {}
+        self.bucket = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, url):
+        """Menunggu slot domain, token domain (dan jeda Retry-After), lalu slot global"""
+        domain = kunci_domain(url)
+        if domain not in self.semafor_per_domain:
+            self.semafor_per_domain[domain] = asyncio.Semaphore(self.per_domain)
+            if self.laju_per_domain:
+                self.bucket[domain] = TokenBucket(self.laju_per_domain, self.kapasitas)
+        async with self.semafor_per_domain[domain]:
+            if domain in self.bucket:
+                # Menunggu token tanpa memegang slot global, domain lain tetap jalan
+                tunggu = self.bucket[domain].reservasi(sesi.jeda_sampai(url))
+                if tunggu > 0:
+                    await asyncio.sleep(tunggu)
+            async with self.semafor_global:
+                yield
+
+
+def rencana_fetch(urls, normalisasi=True):
+    """
+    (URL yang diambil per kelompok, indeks kelompok untuk setiap baris,
+    daftar baris per kelompok, URL cadangan per kelompok) -- dengan
+    normalisasi, baris duplikat berbagi satu fetch. URL cadangan adalah URL
+    asli lain di kelompok itu, dicoba jika URL pertama gagal.
+    """
+    unik, peta = rencana_unik(urls) if normalisasi else (list(urls), list(range(len(urls))))
+    baris = [[] for _ in unik]
+    for i, j in enumerate(peta):
+        baris[j].append(i)
+    cadangan = [[u for u in dict.fromkeys(url_asli(urls[i]) for i in b) if u != unik[j]] if normalisasi else []
+                for j, b in enumerate(baris)]
+    return unik, peta, baris, cadangan
+
+
+def hasil_gagal(hasil):
+    """True jika hasil worker menandai kegagalan ({'success': False, ...})"""
+    return isinstance(hasil, dict) and hasil.get('success') is False
+
+
+async def jalankan_fetch_async(urls, worker=ambil_konten, konkurensi=KONKURENSI_DEFAULT,
+                               per_domain=PER_DOMAIN_DEFAULT, progress=None,
+                               laju_per_domain=LAJU_PER_DOMAIN_DEFAULT, normalisasi=True):
+    """Versi async dari jalankan_fetch, bisa dipakai dari event loop yang sudah berjalan"""
+    urls = list(urls)
+    if not urls:
+        return []
+
+    loop = asyncio.get_running_loop()
+    pembatas = PembatasKonkurensi(konkurensi, per_domain, laju_per_domain)
+    unik, peta, baris, cadangan = rencana_fetch(urls, normalisasi)
+    hasil = [None] * len(unik)
+
+    with ThreadPoolExecutor(max_workers=konkurensi) as executor:
+        async def tugas(j, url):
+            async with pembatas.slot(url):
+                for kandidat in [url] + cadangan[j]:
+                    try:
+                        hasil[j] = await loop.run_in_executor(executor, panggil_terukur, worker, kandidat)
+                    except Exception as e:
+                        hasil[j] = {'success': False, 'error': str(e)}
+                    if not hasil_gagal(hasil[j]):
+                        break
+            if progress:
+                for i in baris[j]:
+                    progress(i, urls[i], hasil[j])
+
+        await asyncio.gather(*(tugas(j, unik[j]) for j in urutan_antar_domain(unik)))
+
+    return [hasil[j] for j in peta]
+
+
+def jalankan_fetch(urls, worker=ambil_konten, konkurensi=KONKURENSI_DEFAULT,
+                   per_domain=PER_DOMAIN_DEFAULT, progress=None,
+                   laju_per_domain=LAJU_PER_DOMAIN_DEFAULT, normalisasi=True):
+    """
+    Menjalankan worker(url) untuk semua URL secara konkuren.
+
+    worker dipanggil di thread terpisah; jika worker melempar exception,
+    hasilnya diganti {'success': False, 'error': ...}. Nilai kembali berupa
+    list dengan urutan yang sama seperti urls. progress(i, url, hasil)
+    dipanggil setiap kali satu URL selesai (urutan selesai, bukan urutan baris).
+    laju_per_domain: request per detik per domain (None = tanpa batas laju).
+    normalisasi: baris dengan URL yang sama setelah normalisasi hanya diambil
+    sekali lalu berbagi hasil; worker menerima URL asli baris pertama (lalu
+    URL asli baris lain di kelompok itu jika gagal).
+    """
+    return asyncio.run(jalankan_fetch_async(urls, worker, konkurensi, per_domain, progress,
+                                            laju_per_domain, normalisasi))
@@ -0,0 +1,259 @@
+"""
+Normalisasi URL Bank Link sebelum fetch.
+
+Satu artikel sering tercantum beberapa kali sebagai varian AMP, mobile,
+atau dengan parameter pelacak. normalisasi_url() mengubah semua varian
+itu ke satu URL (kunci deduplikasi; yang di-fetch tetap URL asli):
+- host huruf kecil, port default dibuang, fragment dibuang
+- parameter pelacak (utm_*, fbclid, gclid, ...) dibuang, query diurutkan
+- pengalih yang dikenal dibuka (l.facebook.com, google.com/url, AMP cache
+  Google, ...); link pendek (t.co, bit.ly, ...) hanya diikuti jika
+  resolve_pendek=True karena butuh request jaringan
+- AMP (/amp, .amp.html, ?amp=1, amp.host) dan mobile (m.host) dilipat
+  ke versi desktop
+
+kunci_url() memberi kunci deduplikasi (tanpa skema dan www), dan
+nama_penerbit() memetakan domain ke nama media lewat tabel PENERBIT.
+"""
+
+import functools
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+PARAMETER_PELACAK = {'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+                     '_ga', '_gl', 'ocid', 'cmpid', 'ref_src', 'ref_url', 'spm', 'smid', 'smtyp',
+                     '__twitter_impression', 'guccounter', 'guce_referrer', 'guce_referrer_sig'}
+PREFIKS_PELACAK = ('utm_', 'hsa_', 'pk_')
+PARAMETER_AMP = {'amp', 'amp=1', 'amp=true', 'outputtype=amp', '_amp=true', 'usqp=mq331aqa'}
+
+# Pengalih berbasis query: host -> (awalan path, nama parameter tujuan)
+PENGALIH_QUERY = {
+    'l.facebook.com': ('/l.php', ('u',)),
+    'lm.facebook.com': ('/l.php', ('u',)),
+    'www.facebook.com': ('/l.php', ('u',)),
+    'm.facebook.com': ('/l.php', ('u',)),
+    'l.instagram.com': ('/', ('u',)),
+    'www.google.com': ('/url', ('q', 'url')),
+    'google.com': ('/url', ('q', 'url')),
+    'www.youtube.com': ('/redirect', ('q',)),
+    'out.reddit.com': ('/', ('url',)),
+    'away.vk.com': ('/away.php', ('to',)),
+    't.umblr.com': ('/redirect', ('z',)),
+    'slack-redir.net': ('/link', ('url',)),
+}
+# Link pendek yang hanya bisa dibuka dengan mengikuti redirect HTTP
+PENYINGKAT = {'t.co', 'bit.ly', 'ow.ly', 'buff.ly', 'lnkd.in', 'tinyurl.com', 'goo.gl', 'dlvr.it',
+              'trib.al', 'fb.me', 'ift.tt', 'shorturl.at', 'rebrand.ly', 's.id', 'kmp.im', 'dtk.id'}
+
+POLA_AMP_CACHE = re.compile(r'^/[cvi]/(?:s/)?(.+)$')
+POLA_AMP_PATH = [
+    (re.compile(r'/amp/?$'), '/'),
+    (re.compile(r'^/amp/'), '/'),
+    (re.compile(r'\.amp(\.html?)$'), r'\1'),
+    (re.compile(r'/amp(/[^/]+\.html?)$'), r'\1'),
+]
+PREFIKS_HOST_MOBILE = ('m.', 'mobile.', 'amp.')
+
+# Sufiks dua tingkat yang umum di Bank Link (nama media ada di label sebelumnya)
+SUFIKS_DUA_TINGKAT = {'co.uk', 'org.uk', 'ac.uk', 'co.id', 'ac.id', 'or.id', 'go.id', 'web.id', 'my.id',
+                      'com.au', 'net.au', 'co.jp', 'com.sg', 'com.my', 'co.in', 'co.za', 'com.br',
+                      'co.nz', 'com.ph', 'com.vn', 'co.kr', 'com.tr', 'com.mx'}
+
+# Tabel domain -> nama penerbit. Subdomain ikut domain induknya (edition.cnn.com -> CNN).
+PENERBIT = {
+    'prnewswire.com': 'PR Newswire',
+    'laotiantimes.com': 'Laotian Times',
+    'tribuneindia.com': 'The Tribune India',
+    'thejakartapost.com': 'The Jakarta Post',
+    'jakartaglobe.id': 'Jakarta Globe',
+    'indoindians.com': 'IndoIndians',
+    'whatsnewindonesia.com': "What's New Indonesia",
+    'antaranews.com': 'Antara News',
+    'kompas.com': 'Kompas',
+    'kompas.id': 'Kompas',
+    'detik.com': 'Detik',
+    'cnnindonesia.com': 'CNN Indonesia',
+    'tempo.co': 'Tempo',
+    'liputan6.com': 'Liputan6',
+    'kumparan.com': 'Kumparan',
+    'idntimes.com': 'IDN Times',
+    'tribunnews.com': 'Tribunnews',
+    'okezone.com': 'Okezone',
+    'suara.com': 'Suara',
+    'cnn.com': 'CNN',
+    'bbc.com': 'BBC',
+    'bbc.co.uk': 'BBC',
+    'nytimes.com': 'The New York Times',
+    'theguardian.com': 'The Guardian',
+    'washingtonpost.com': 'The Washington Post',
+    'reuters.com': 'Reuters',
+    'apnews.com': 'AP News',
+    'vogue.com': 'Vogue',
+    'teenvogue.com': 'Teen Vogue',
+    'elle.com': 'Elle',
+    'harpersbazaar.com': "Harper's Bazaar",
+    'cosmopolitan.com': 'Cosmopolitan',
+    'glamour.com': 'Glamour',
+    'wmagazine.com': 'W Magazine',
+    'billboard.com': 'Billboard',
+    'rollingstone.com': 'Rolling Stone',
+    'nme.com': 'NME',
+    'pitchfork.com': 'Pitchfork',
+    'variety.com': 'Variety',
+    'people.com': 'People',
+    'eonline.com': 'E! Online',
+    'buzzfeed.com': 'BuzzFeed',
+    'refinery29.com': 'Refinery29',
+    'nylon.com': 'Nylon',
+    'hypebae.com': 'Hypebae',
+    'independent.co.uk': 'The Independent',
+    'dailymail.co.uk': 'Daily Mail',
+    'forbes.com': 'Forbes',
+    'time.com': 'TIME',
+    'yahoo.com': 'Yahoo',
+}
+
+
+def _buka_pengalih(bagian):
+    """URL tujuan dari pengalih yang dikenal (tanpa jaringan), atau None"""
+    host = bagian.netloc.lower()
+    if host.endswith('.cdn.ampproject.org'):
+        match = POLA_AMP_CACHE.match(bagian.path)
+        if match:
+            return 'https://' + match.group(1)
+    if host in ('www.google.com', 'google.com') and bagian.path.startswith('/amp/s/'):
+        return 'https://' + bagian.path[len('/amp/s/'):]
+    if host in PENGALIH_QUERY:
+        awalan, nama_parameter = PENGALIH_QUERY[host]
+        if bagian.path.startswith(awalan):
+            query = dict(parse_qsl(bagian.query))
+            for nama in nama_parameter:
+                if query.get(nama, '').startswith(('http://', 'https://')):
+                    return query[nama]
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def buka_link_pendek(url, timeout=10):
+    """Mengikuti redirect HTTP link pendek; URL asli jika gagal"""
+    try:
+        return requests.head(url, allow_redirects=True, timeout=timeout,
+                             headers={'User-Agent': 'Mozilla/5.0'}).url
+    except requests.exceptions.RequestException:
+        return url
+
+
+def _lipat_host(host):
+    for prefiks in PREFIKS_HOST_MOBILE:
+        if host.startswith(prefiks) and host.count('.') >= 2:
+            return 'www.' + host[len(prefiks):]
+    return host
+
+
+def _lipat_path_amp(path):
+    for pola, ganti in POLA_AMP_PATH:
+        path = pola.sub(ganti, path)
+    return path
+
+
+def _query_bersih(query):
+    pasangan = []
+    for kunci, nilai in parse_qsl(query, keep_blank_values=True):
+        k = kunci.lower()
+        if k in PARAMETER_PELACAK or k.startswith(PREFIKS_PELACAK):
+            continue
+        if (f"{k}={nilai.lower()}" if nilai else k) in PARAMETER_AMP:
+            continue
+        pasangan.append((kunci, nilai))
+    return urlencode(sorted(pasangan))
+
+
+def url_asli(url):
+    """URL dari spreadsheet apa adanya, hanya dirapikan (spasi, skema yang hilang) untuk di-fetch"""
+    url = str(url).strip()
+    return url if not url or '://' in url else 'https://' + url
+
+
+def normalisasi_url(url, resolve_pendek=False):
+    """
+    Bentuk normal URL artikel, hanya untuk deduplikasi: host m./amp. dilipat
+    ke www. dan query diurutkan, jadi belum tentu bisa di-fetch
+    """
+    url = str(url).strip()
+    if not url:
+        return url
+    if '://' not in url:
+        url = 'https://' + url
+
+    # Pengalih bisa bertumpuk (mis. t.co -> l.facebook.com -> artikel)
+    for _ in range(5):
+        bagian = urlsplit(url)
+        host = bagian.netloc.lower()
+        tujuan = _buka_pengalih(bagian)
+        if tujuan is None and resolve_pendek and host.replace('www.', '') in PENYINGKAT:
+            tujuan = buka_link_pendek(url)
+            tujuan = None if tujuan == url else tujuan
+        if tujuan is None:
+            break
+        url = tujuan
+
+    bagian = urlsplit(url)
+    skema = bagian.scheme.lower() or 'https'
+    host = (bagian.hostname or '').lower().rstrip('.')
+    if bagian.port and not ((skema == 'http' and bagian.port == 80) or (skema == 'https' and bagian.port == 443)):
+        host = f"{host}:{bagian.port}"
+    host = _lipat_host(host)
+    path = _lipat_path_amp(re.sub(r'/{2,}', '/', bagian.path or '/'))
+    return urlunsplit((skema, host, path, _query_bersih(bagian.query), ''))
+
+
+def kunci_url(url):
+    """Kunci deduplikasi: URL normal tanpa skema, www, dan garis miring akhir"""
+    bagian = urlsplit(normalisasi_url(url))
+    host = bagian.netloc[4:] if bagian.netloc.startswith('www.') else bagian.netloc
+    path = bagian.path.rstrip('/') or '/'
+    return f"{host}{path}" + (f"?{bagian.query}" if bagian.query else '')
+
+
+def rencana_unik(urls):
+    """
+    Mengelompokkan baris dengan URL yang sama setelah normalisasi.
+
+    Mengembalikan (URL asli baris pertama tiap kelompok, list indeks kelompok
+    untuk setiap baris). URL normal hanya dipakai sebagai kunci; yang di-fetch
+    tetap URL asli dari spreadsheet.
+    """
+    unik, posisi, peta = [], {}, []
+    for url in urls:
+        kunci = kunci_url(url)
+        if kunci not in posisi:
+            posisi[kunci] = len(unik)
+            unik.append(url_asli(url))
+        peta.append(posisi[kunci])
+    return unik, peta
+
+
+def domain_terdaftar(host):
+    """Domain terdaftar dari host (edition.cnn.com -> cnn.com, www.bbc.co.uk -> bbc.co.uk)"""
+    label = host.lower().split(':')[0].strip('.').split('.')
+    if len(label) >= 3 and '.'.join(label[-2:]) in SUFIKS_DUA_TINGKAT:
+        return '.'.join(label[-3:])
+    return '.'.join(label[-2:])
+
+
+def nama_penerbit(url):
+    """Nama penerbit dari tabel PENERBIT; jika tidak ada, label domain (huruf besar)"""
+    host = urlsplit(normalisasi_url(url)).hostname or ''
+    if not host:
+        return "Unknown"
+    label = host.split('.')
+    # Cocokkan dari host lengkap ke domain induknya
+    for i in range(len(label) - 1):
+        nama = PENERBIT.get('.'.join(label[i:]))
+        if nama:
+            return nama
+    if host.replace('.', '').isdigit():
+        return host
+    return domain_terdaftar(host).split('.')[0].upper()
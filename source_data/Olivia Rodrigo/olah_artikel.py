@@ -0,0 +1,46 @@
+"""
+Pengolahan halaman artikel (parsing HTML, ekstraksi tanggal, dan kutipan).
+
+Fungsi di modul ini murni CPU dan tidak mengakses jaringan, sehingga bisa
+dijalankan di ProcessPoolExecutor oleh pipeline_scrape.
+"""
+
+from duplikat_artikel import tanda_minhash
+from ekstraktor_artikel import ArticleExtractor
+from ledger_scrape import hash_konten
+from otomat_kata_kunci import cari_kutipan
+from performa_scrape import ukur
+from skor_kutipan import peringkat_kutipan
+
+# Kutipan = kalimat yang memuat kata kunci (None: potongan +/- context_length karakter)
+KALIMAT_PER_KUTIPAN = 1
+MAKS_KUTIPAN = 3
+
+
+def cari_kutipan_relevan(text, keywords, context_length=150, kalimat=KALIMAT_PER_KUTIPAN, rapikan=True):
+    """
+    Max 3 kutipan per tema. Mode kalimat: kutipan dengan skor relevansi
+    tertinggi (skor_kutipan), jendela kalimat yang terlalu panjang dipotong
+    +/- context_length karakter; mode karakter: max 2 match pertama per keyword.
+    """
+    if kalimat:
+        return peringkat_kutipan(text, keywords, MAKS_KUTIPAN, kalimat, rapikan, context_length)
+    return cari_kutipan(text, keywords, context_length, rapikan, maks=MAKS_KUTIPAN)
+
+def parse_artikel_lengkap(url, konten):
+    """Parsing HTML artikel sekali jalan: teks bersih, judul, tanggal, dan record lengkap"""
+    artikel = ArticleExtractor.ekstrak(konten, url)
+    return dict(artikel, success=True, text=artikel['teks_utama'], title=artikel['judul'])
+
+def olah_halaman(url, konten, keywords_tema1, keywords_tema2):
+    """Parsing halaman lalu mencari kutipan kedua tema (satu tugas untuk process pool)"""
+    try:
+        hasil = parse_artikel_lengkap(url, konten)
+    except Exception as e:
+        return {'success': False, 'error': str(e)}
+    with ukur('ekstraksi'):
+        hasil['kutipan_tema1'] = cari_kutipan_relevan(hasil['text'], keywords_tema1)
+        hasil['kutipan_tema2'] = cari_kutipan_relevan(hasil['text'], keywords_tema2)
+        hasil['hash_konten'] = hash_konten(konten)
+        hasil['minhash'] = tanda_minhash(hasil['text'])
+    return hasil
@@ -0,0 +1,239 @@
+"""
+Pencarian banyak kata kunci sekaligus dengan otomat Aho-Corasick.
+
+Pencarian kutipan lama membuat regex `.{0,C}keyword.{0,C}` untuk setiap
+kata kunci di setiap artikel; regex itu mencoba setiap posisi awal dan
+melakukan backtracking sampai C karakter, jadi biayanya
+O(jumlah kata kunci x panjang teks x C). Di sini kata kunci satu tema
+dikompilasi sekali menjadi otomat, teks (huruf kecil) dipindai satu kali
+untuk mendapatkan semua posisi kemunculan, lalu jendela kutipan dipotong
+langsung dari posisi itu.
+
+Hasilnya identik dengan versi regex: jendela_regex() meniru urutan match
+re.findall (match paling kiri, `.{0,C}` serakah, `.` tidak melewati
+baris baru, pencarian berikutnya mulai dari akhir match sebelumnya).
+Untuk teks yang huruf kecilnya tidak sejajar dengan aturan IGNORECASE
+modul re (lihat KARAKTER_KHUSUS) dipakai kembali jalur regex.
+
+Dengan kalimat=N, kutipan dipotong per kalimat lewat indeks_kalimat
+(jendela N kalimat di sekitar kata kunci) alih-alih per karakter;
+jendela yang terlalu panjang (teks tanpa tanda baca) tetap dipotong
++/- panjang_konteks karakter.
+"""
+
+import functools
+import re
+from bisect import bisect_left, bisect_right
+
+from indeks_kalimat import KONTEKS, IndeksKalimat
+
+# Karakter yang hasil .lower()-nya tidak sama dengan padanan re.IGNORECASE
+# untuk huruf ASCII (İ juga memanjang saat .lower())
+KARAKTER_KHUSUS = frozenset('İıſ')
+
+
+class OtomatKataKunci:
+    def __init__(self, kata_kunci):
+        """Membangun trie + tautan gagal untuk daftar kata kunci (urutan dan duplikat dipertahankan)"""
+        self.kata = [k.lower() for k in kata_kunci]
+        self._goto = [{}]
+        self._gagal = [0]
+        self._keluaran = [[]]
+        for indeks, kata in enumerate(self.kata):
+            state = 0
+            for c in kata:
+                if c not in self._goto[state]:
+                    self._goto.append({})
+                    self._gagal.append(0)
+                    self._keluaran.append([])
+                    self._goto[state][c] = len(self._goto) - 1
+                state = self._goto[state][c]
+            self._keluaran[state].append(indeks)
+
+        # BFS: tautan gagal = state untuk sufiks terpanjang yang juga prefiks kata kunci
+        # (anak akar gagal ke akar)
+        antrian = list(self._goto[0].values())
+        for state in antrian:
+            for c, berikut in self._goto[state].items():
+                antrian.append(berikut)
+                gagal = self._gagal[state]
+                while gagal and c not in self._goto[gagal]:
+                    gagal = self._gagal[gagal]
+                self._gagal[berikut] = self._goto[gagal].get(c, 0)
+                self._keluaran[berikut] = self._keluaran[berikut] + self._keluaran[self._gagal[berikut]]
+
+    def cari(self, teks_kecil):
+        """Posisi awal semua kemunculan (boleh tumpang tindih) tiap kata kunci: list per kata, urut naik"""
+        posisi = [[] for _ in self.kata]
+        goto, gagal, keluaran, panjang = self._goto, self._gagal, self._keluaran, [len(k) for k in self.kata]
+        akar = goto[0]
+        state = 0
+        for i, c in enumerate(teks_kecil):
+            if state == 0:
+                state = akar.get(c, 0)
+            else:
+                while state and c not in goto[state]:
+                    state = gagal[state]
+                state = goto[state].get(c, 0)
+            if keluaran[state]:
+                for k in keluaran[state]:
+                    posisi[k].append(i - panjang[k] + 1)
+        return posisi
+
+    def hitung(self, teks_kecil):
+        """
+        Jumlah kemunculan tiap kata kunci, sama dengan teks_kecil.count(kata)
+        (tidak tumpang tindih dengan dirinya sendiri), dalam satu kali pindai.
+        """
+        jumlah = [0] * len(self.kata)
+        batas = [0] * len(self.kata)         # akhir kemunculan terakhir yang dihitung
+        goto, gagal, keluaran, panjang = self._goto, self._gagal, self._keluaran, [len(k) for k in self.kata]
+        akar = goto[0]
+        state = 0
+        for i, c in enumerate(teks_kecil):
+            if state == 0:
+                state = akar.get(c, 0)
+            else:
+                while state and c not in goto[state]:
+                    state = gagal[state]
+                state = goto[state].get(c, 0)
+            if keluaran[state]:
+                for k in keluaran[state]:
+                    if i - panjang[k] + 1 >= batas[k]:
+                        jumlah[k] += 1
+                        batas[k] = i + 1
+        return jumlah
+
+
+@functools.lru_cache(maxsize=64)
+def otomat_untuk(kata_kunci):
+    """Otomat untuk tuple kata kunci (dikompilasi sekali per tema per proses); None jika tidak didukung"""
+    if not kata_kunci or any(not k or '\n' in k or not k.isascii() for k in kata_kunci):
+        return None
+    return OtomatKataKunci(kata_kunci)
+
+
+def bisa_pakai_otomat(teks):
+    """True jika posisi di teks.lower() sama dengan posisi match re.IGNORECASE di teks"""
+    if teks.isascii():
+        return True
+    return len(teks.lower()) == len(teks) and not KARAKTER_KHUSUS.intersection(teks)
+
+
+def posisi_baris_baru(teks):
+    posisi, i = [], teks.find('\n')
+    while i != -1:
+        posisi.append(i)
+        i = teks.find('\n', i + 1)
+    return posisi
+
+
+def jendela_regex(teks, kemunculan, panjang_kata, baris_baru, konteks, maks=None):
+    """
+    Sama dengan re.findall('.{0,C}' + kata + '.{0,C}', teks, re.I)[:maks]
+    dengan C = konteks, dihitung dari posisi kemunculan kata (urut naik)
+    dan posisi baris baru di teks.
+    """
+    hasil = []
+    mulai_cari = 0
+    while maks is None or len(hasil) < maks:
+        j = bisect_left(kemunculan, mulai_cari)
+        if j == len(kemunculan):
+            break
+        pertama = kemunculan[j]
+        b = bisect_left(baris_baru, pertama) - 1
+        # Posisi awal paling kiri yang masih bisa mencapai kemunculan pertama
+        awal = max(mulai_cari, pertama - konteks, baris_baru[b] + 1 if b >= 0 else 0)
+        b = bisect_left(baris_baru, awal)
+        batas = min(awal + konteks, (baris_baru[b] if b < len(baris_baru) else len(teks)) - 1)
+        # `.{0,C}` serakah: kemunculan terakhir yang masih terjangkau dari awal
+        kata = kemunculan[bisect_right(kemunculan, batas) - 1]
+        akhir_kata = kata + panjang_kata
+        b = bisect_left(baris_baru, akhir_kata)
+        akhir = min(akhir_kata + konteks, baris_baru[b] if b < len(baris_baru) else len(teks))
+        hasil.append(teks[awal:akhir])
+        mulai_cari = akhir
+    return hasil
+
+
+def posisi_kata_kunci(teks, kata_kunci):
+    """Posisi kemunculan (tanpa membedakan huruf besar/kecil) tiap kata kunci: list per kata, urut naik"""
+    otomat = otomat_untuk(tuple(kata_kunci))
+    if otomat is not None and bisa_pakai_otomat(teks):
+        return otomat.cari(teks.lower())
+    return [[m.start() for m in re.finditer(re.escape(k.lower()), teks, re.IGNORECASE)] if k else []
+            for k in kata_kunci]
+
+
+def cari_kutipan_regex(teks, kata_kunci, panjang_konteks, rapikan=True, maks_per_kata=2, maks=3):
+    """Implementasi regex asli (acuan untuk teks yang tidak didukung otomat)"""
+    kutipan = []
+    for keyword in kata_kunci:
+        pattern = re.compile(r'.{0,' + str(panjang_konteks) + r'}' + re.escape(keyword.lower()) +
+                             r'.{0,' + str(panjang_konteks) + r'}', re.IGNORECASE)
+        for match in pattern.findall(teks)[:maks_per_kata]:
+            bersih = ' '.join(match.strip().split()) if rapikan else match.strip()
+            if len(bersih) > 50 and bersih not in kutipan:
+                kutipan.append(bersih)
+    return kutipan[:maks]
+
+
+def jendela_kalimat(indeks, kemunculan, n, maks=None, panjang_kata=0, konteks=KONTEKS):
+    """Jendela n kalimat (berbeda) untuk kemunculan kata, urut dari kemunculan pertama"""
+    hasil, dilihat = [], set()
+    for posisi in kemunculan:
+        if maks is not None and len(hasil) >= maks:
+            break
+        rentang = indeks.rentang(posisi, n, panjang_kata, konteks)
+        if rentang not in dilihat:
+            dilihat.add(rentang)
+            hasil.append(indeks.teks[rentang[0]:rentang[1]])
+    return hasil
+
+
+def cari_kutipan(teks, kata_kunci, panjang_konteks=150, rapikan=True, maks_per_kata=2, maks=3, kalimat=None):
+    """
+    Kutipan kata kunci dengan konteks +/- panjang_konteks karakter:
+    maksimal maks_per_kata match pertama per kata kunci, lebih dari 50
+    karakter, tanpa duplikat, maksimal `maks` kutipan.
+    rapikan: spasi/baris baru di dalam kutipan diringkas menjadi satu spasi.
+    kalimat: jika diisi N, kutipan berupa jendela N kalimat di sekitar
+    kata kunci; panjang_konteks hanya dipakai untuk jendela yang lebih
+    panjang dari indeks_kalimat.PANJANG_MAKS.
+    """
+    otomat = otomat_untuk(tuple(kata_kunci))
+    pakai_otomat = otomat is not None and bisa_pakai_otomat(teks)
+    if not pakai_otomat and not kalimat:
+        return cari_kutipan_regex(teks, kata_kunci, panjang_konteks, rapikan, maks_per_kata, maks)
+
+    semua_posisi = posisi_kata_kunci(teks, kata_kunci)
+
+    if kalimat:
+        indeks = IndeksKalimat(teks) if any(semua_posisi) else None
+
+        def potong(posisi, panjang_kata):
+            return jendela_kalimat(indeks, posisi, kalimat, maks_per_kata, panjang_kata, panjang_konteks)
+    else:
+        baris_baru = posisi_baris_baru(teks)
+
+        def potong(posisi, panjang_kata):
+            return jendela_regex(teks, posisi, panjang_kata, baris_baru, panjang_konteks, maks_per_kata)
+
+    kutipan = []
+    for kata, posisi in zip(kata_kunci, semua_posisi):
+        # Kutipan hanya ditambah di belakang, jadi setelah `maks` kutipan hasil tidak berubah lagi
+        if len(kutipan) >= maks:
+            break
+        for match in potong(posisi, len(kata)):
+            bersih = ' '.join(match.strip().split()) if rapikan else match.strip()
+            if len(bersih) > 50 and bersih not in kutipan:
+                kutipan.append(bersih)
+    return kutipan[:maks]
+
+
+def kemunculan_pertama(teks_kecil, kata_kunci):
+    """Posisi kemunculan pertama tiap kata kunci di teks huruf kecil (-1 jika tidak ada)"""
+    otomat = otomat_untuk(tuple(kata_kunci))
+    if otomat is None:
+        return [teks_kecil.find(k.lower()) for k in kata_kunci]
+    return [p[0] if p else -1 for p in otomat.cari(teks_kecil)]
@@ -0,0 +1,330 @@
+"""
+Lapisan parser HTML yang bisa diganti-ganti backend-nya.
+
+Dua cara pakai:
+1. buat_soup(konten, hanya=...) -> objek BeautifulSoup seperti biasa,
+   memakai tree builder tercepat yang terpasang (lxml, lalu html.parser).
+   Argumen `hanya` membatasi parsing ke tag tertentu (SoupStrainer).
+2. ekstrak_elemen(konten, tags) -> list Elemen(tag, attrs, teks) untuk
+   tag yang diminta saja, dengan backend selectolax / lxml / html.parser
+   bawaan Python. Jalur ini tidak membangun pohon BeautifulSoup sama sekali.
+
+3. jalankan_target(konten, target) -> menyalurkan event parsing
+   (start/end/data/close, antarmuka target lxml) ke objek target, untuk
+   ekstraktor yang cukup berjalan satu kali atas dokumen.
+
+Backend dipilih otomatis sesuai library yang terpasang, atau bisa dipaksa
+lewat argumen backend=.
+
+Konten bytes didekode dengan encoding dari deteksi_encoding(): charset
+header HTTP (argumen encoding=, atau atribut charset dari Konten hasil
+mesin_fetch.ambil_konten) jika ada, lalu BOM, <meta charset>, UTF-8
+jika valid, dan terakhir windows-1252 -- urutan yang sama dengan
+BeautifulSoup (UnicodeDammit), tanpa tebakan chardet.
+"""
+
+import codecs
+from collections import namedtuple
+from html.parser import HTMLParser as _HTMLParserBawaan
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+
+from performa_scrape import ukur
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+    except ImportError:
+        _SelectolaxParser = None
+
+try:
+    import lxml.html as _lxml_html
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_html = None
+    _lxml_etree = None
+
+Elemen = namedtuple('Elemen', ['tag', 'attrs', 'teks'])
+
+# Tag yang cukup untuk ekstraksi artikel
+TAG_ARTIKEL = ('title', 'h1', 'p', 'time', 'meta')
+
+TAG_DIABAIKAN = {'script', 'style', 'noscript', 'template'}
+# Tag blok yang secara implisit menutup <p> yang masih terbuka
+TAG_PENUTUP_P = {'address', 'article', 'aside', 'blockquote', 'div', 'dl', 'fieldset', 'footer',
+                 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+                 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul'}
+TAG_VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+            'link', 'meta', 'param', 'source', 'track', 'wbr'}
+
+
+def backend_tersedia():
+    """Daftar backend yang bisa dipakai, urut dari yang tercepat"""
+    backend = []
+    if _SelectolaxParser is not None:
+        backend.append('selectolax')
+    if _lxml_html is not None:
+        backend.append('lxml')
+    backend.extend(['html.parser', 'bs4'])
+    return backend
+
+
+def builder_soup():
+    """Nama tree builder BeautifulSoup tercepat yang terpasang"""
+    return 'lxml' if _lxml_html is not None else 'html.parser'
+
+
+def buat_soup(konten, hanya=None, builder=None, encoding=None):
+    """
+    Membuat BeautifulSoup dengan builder tercepat.
+
+    hanya: nama tag / list tag yang perlu dibangun (lainnya dilewati).
+    encoding: charset dari header HTTP; default konten.charset (mesin_fetch.ambil_konten).
+    """
+    encoding = encoding or getattr(konten, 'charset', None)
+    parse_only = SoupStrainer(hanya) if hanya else None
+    with ukur('parse'):
+        return BeautifulSoup(konten, builder or builder_soup(), parse_only=parse_only,
+                             from_encoding=encoding if isinstance(konten, bytes) else None)
+
+
+def _rapikan(teks):
+    return ' '.join(teks.split())
+
+
+def _nama_codec(encoding):
+    try:
+        return codecs.lookup(encoding).name
+    except (LookupError, TypeError):
+        return None
+
+
+def deteksi_encoding(konten, encoding=None):
+    """
+    Encoding untuk mendekode bytes HTML: charset header HTTP (encoding,
+    default konten.charset dari ambil_konten), BOM, <meta charset>,
+    UTF-8 jika valid, lalu windows-1252
+    """
+    nama = _nama_codec(encoding or getattr(konten, 'charset', None))
+    if nama:
+        return nama
+    _, bom = EncodingDetector.strip_byte_order_mark(konten)
+    if bom:
+        return _nama_codec(bom)
+    nama = _nama_codec(EncodingDetector.find_declared_encoding(konten, is_html=True))
+    if nama:
+        return nama
+    try:
+        konten.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp1252'
+
+
+def _dekode(konten, encoding=None):
+    if isinstance(konten, bytes):
+        enc = deteksi_encoding(konten, encoding)
+        if enc == 'utf-8':
+            # BOM ikut terbuang seperti pada parser lain
+            enc = 'utf-8-sig'
+        return konten.decode(enc, errors='replace')
+    return konten
+
+
+def _bytes_utf8(konten, encoding=None):
+    """Konten sebagai bytes UTF-8 untuk lxml (tanpa dekode ulang jika sudah UTF-8)"""
+    if isinstance(konten, bytes) and deteksi_encoding(konten, encoding) == 'utf-8':
+        return konten
+    return _dekode(konten, encoding).encode('utf-8')
+
+
+class _PengumpulTag(_HTMLParserBawaan):
+    """Parser bawaan Python yang hanya menyimpan tag yang diminta"""
+
+    def __init__(self, tags):
+        super().__init__(convert_charrefs=True)
+        self.tags = set(tags)
+        self.hasil = []
+        self.terbuka = []      # (tag, index hasil, attrs, potongan teks)
+        self.abaikan = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in TAG_DIABAIKAN:
+            self.abaikan += 1
+            return
+        if tag in TAG_PENUTUP_P:
+            self._tutup('p')
+        if tag not in self.tags:
+            return
+        attrs = {k: (v or '') for k, v in attrs}
+        if tag in TAG_VOID:
+            self.hasil.append(Elemen(tag, attrs, ''))
+            return
+        self.hasil.append(None)
+        self.terbuka.append((tag, len(self.hasil) - 1, attrs, []))
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in self.tags:
+            self.hasil.append(Elemen(tag, {k: (v or '') for k, v in attrs}, ''))
+
+    def handle_endtag(self, tag):
+        if tag in TAG_DIABAIKAN:
+            self.abaikan = max(0, self.abaikan - 1)
+            return
+        if tag in TAG_PENUTUP_P and tag != 'p':
+            self._tutup('p')
+        if tag in self.tags and tag not in TAG_VOID:
+            self._tutup(tag)
+
+    def _tutup(self, tag):
+        """Menutup elemen terbuka terdekat dengan tag yang sama (HTML sering tidak rapi)"""
+        for posisi in range(len(self.terbuka) - 1, -1, -1):
+            if self.terbuka[posisi][0] == tag:
+                for t, idx, attrs, potongan in self.terbuka[posisi:]:
+                    self.hasil[idx] = Elemen(t, attrs, _rapikan(''.join(potongan)))
+                del self.terbuka[posisi:]
+                break
+
+    def handle_data(self, data):
+        if self.abaikan:
+            return
+        for _, _, _, potongan in self.terbuka:
+            potongan.append(data)
+
+    def selesai(self):
+        self.close()
+        for t, idx, attrs, potongan in self.terbuka:
+            self.hasil[idx] = Elemen(t, attrs, _rapikan(''.join(potongan)))
+        self.terbuka = []
+        return [e for e in self.hasil if e is not None]
+
+
+def _ekstrak_selectolax(konten, tags, encoding=None):
+    pohon = _SelectolaxParser(_dekode(konten, encoding))
+    pohon.strip_tags(list(TAG_DIABAIKAN))
+    return [Elemen(node.tag, {k: (v or '') for k, v in node.attributes.items()},
+                   _rapikan(node.text(deep=True, separator='')))
+            for node in pohon.css(', '.join(tags))]
+
+
+def _ekstrak_lxml(konten, tags, encoding=None):
+    if not konten.strip():
+        return []
+    konten = _bytes_utf8(konten, encoding)
+    root = _lxml_html.fromstring(konten, parser=_lxml_html.HTMLParser(encoding='utf-8'))
+    for el in list(root.iter(*TAG_DIABAIKAN)):
+        el.drop_tree()
+    return [Elemen(el.tag, dict(el.attrib), _rapikan(el.text_content()))
+            for el in root.iter(*tags)]
+
+
+def _ekstrak_bawaan(konten, tags, encoding=None):
+    pengumpul = _PengumpulTag(tags)
+    pengumpul.feed(_dekode(konten, encoding))
+    return pengumpul.selesai()
+
+
+def _ekstrak_bs4(konten, tags, encoding=None):
+    soup = BeautifulSoup(_dekode(konten, encoding), 'html.parser', parse_only=SoupStrainer(list(tags)))
+    for el in soup(list(TAG_DIABAIKAN)):
+        el.decompose()
+    return [Elemen(el.name, {k: (' '.join(v) if isinstance(v, list) else v) for k, v in el.attrs.items()},
+                   _rapikan(el.get_text()))
+            for el in soup.find_all(list(tags))]
+
+
+_BACKEND = {
+    'selectolax': _ekstrak_selectolax,
+    'lxml': _ekstrak_lxml,
+    'html.parser': _ekstrak_bawaan,
+    'bs4': _ekstrak_bs4,
+}
+
+
+def ekstrak_elemen(konten, tags=TAG_ARTIKEL, backend=None, encoding=None):
+    """
+    Mengambil elemen dengan tag tertentu saja (urutan dokumen).
+
+    konten boleh bytes atau str. backend=None memilih yang tercepat.
+    encoding: charset dari header HTTP, jika diketahui (lihat deteksi_encoding).
+    """
+    backend = backend or backend_tersedia()[0]
+    if backend not in _BACKEND:
+        raise ValueError(f"Backend parser tidak dikenal: {backend}")
+    with ukur('parse'):
+        return _BACKEND[backend](konten, tuple(tags), encoding)
+
+
+class _AdapterTarget(_HTMLParserBawaan):
+    """Meneruskan event parser bawaan Python ke target bergaya lxml"""
+
+    def __init__(self, target):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+        self.p_terbuka = False
+
+    def _tutup_p(self):
+        if self.p_terbuka:
+            self.p_terbuka = False
+            self.target.end('p')
+
+    def handle_starttag(self, tag, attrs):
+        if tag in TAG_PENUTUP_P:
+            self._tutup_p()
+        self.target.start(tag, {k: (v or '') for k, v in attrs})
+        if tag in TAG_VOID:
+            self.target.end(tag)
+        elif tag == 'p':
+            self.p_terbuka = True
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in TAG_VOID:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in TAG_VOID:
+            return
+        if tag == 'p':
+            if self.p_terbuka:
+                self._tutup_p()
+            return
+        if tag in TAG_PENUTUP_P:
+            self._tutup_p()
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+def jalankan_target(konten, target, backend=None, encoding=None):
+    """
+    Parsing konten sekali jalan dan menyalurkan event ke target
+    (method start(tag, attrs), end(tag), data(teks), close()).
+
+    backend: 'lxml' atau 'html.parser'; None memilih lxml jika terpasang.
+    encoding: charset dari header HTTP, jika diketahui (lihat deteksi_encoding).
+    Mengembalikan nilai target.close().
+    """
+    with ukur('parse'):
+        return _jalankan_target(konten, target, backend, encoding)
+
+
+def _jalankan_target(konten, target, backend, encoding=None):
+    backend = backend or ('lxml' if _lxml_etree is not None else 'html.parser')
+    if backend == 'lxml':
+        konten = _bytes_utf8(konten, encoding)
+        if not konten.strip():
+            return target.close()
+        parser = _lxml_etree.HTMLParser(target=target, encoding='utf-8')
+        parser.feed(konten)
+        return parser.close()
+    if backend == 'html.parser':
+        adapter = _AdapterTarget(target)
+        adapter.feed(_dekode(konten, encoding))
+        adapter.close()
+        return target.close()
+    raise ValueError(f"Backend target tidak dikenal: {backend}")
@@ -0,0 +1,182 @@
+"""
+Instrumentasi waktu scraping per URL.
+
+Setiap URL yang diambil lewat mesin_fetch / pipeline_scrape mendapat satu
+rekaman: fase dns, connect (TCP + TLS), ttfb (request sampai header
+respons, termasuk retry), unduh (body), parse, dan ekstraksi, ditambah
+jumlah byte, status HTTP, dan sumber body (jaringan/cache/revalidasi/arsip).
+
+Rekaman aktif disimpan per thread, jadi kode di jalur scraping cukup
+membungkus bagiannya dengan `with ukur('parse'):` tanpa meneruskan objek
+apa pun. Waktu fase bersifat eksklusif: fase yang bersarang (mis. dns di
+dalam connect) dikurangkan dari fase luarnya. Tanpa rekaman aktif, ukur()
+tidak melakukan apa-apa.
+
+PerekamPerforma mengumpulkan rekaman dari semua thread, mengekspornya ke
+CSV/JSON, dan meringkasnya (p50/p95 per domain, URL paling lambat).
+"""
+
+import contextlib
+import csv
+import json
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlparse
+
+FASE = ('dns', 'connect', 'ttfb', 'unduh', 'parse', 'ekstraksi')
+KOLOM_EKSPOR = (('url', 'domain', 'sumber', 'status', 'byte') + tuple(f"{f}_ms" for f in FASE) +
+                ('total_ms', 'error'))
+
+_lokal = threading.local()
+
+
+def _rekaman_baru(url):
+    rekaman = {'url': str(url), 'domain': urlparse(str(url)).netloc.lower().replace('www.', ''),
+               'sumber': '', 'status': None, 'byte': 0, 'total': 0.0, 'error': ''}
+    rekaman.update((f, 0.0) for f in FASE)
+    return rekaman
+
+
+def aktif():
+    """True jika thread ini sedang merekam performa satu URL"""
+    return getattr(_lokal, 'rekaman', None) is not None
+
+
+@contextlib.contextmanager
+def rekam(url):
+    """Mengaktifkan rekaman baru untuk url di thread ini; exception dicatat sebagai error"""
+    sebelumnya = (getattr(_lokal, 'rekaman', None), getattr(_lokal, 'tumpukan', None))
+    rekaman = _rekaman_baru(url)
+    _lokal.rekaman, _lokal.tumpukan = rekaman, []
+    mulai = time.perf_counter()
+    try:
+        yield rekaman
+    except Exception as e:
+        rekaman['error'] = str(e)
+        raise
+    finally:
+        rekaman['total'] += time.perf_counter() - mulai
+        _lokal.rekaman, _lokal.tumpukan = sebelumnya
+
+
+@contextlib.contextmanager
+def ukur(fase):
+    """Menambahkan waktu blok ini (tanpa fase bersarang di dalamnya) ke fase rekaman aktif"""
+    rekaman = getattr(_lokal, 'rekaman', None)
+    if rekaman is None:
+        yield
+        return
+    tumpukan = _lokal.tumpukan
+    tumpukan.append(0.0)
+    mulai = time.perf_counter()
+    try:
+        yield
+    finally:
+        lama = time.perf_counter() - mulai
+        rekaman[fase] += lama - tumpukan.pop()
+        if tumpukan:
+            tumpukan[-1] += lama
+
+
+def atur(**nilai):
+    """Mengisi field rekaman aktif (mis. atur(status=200, byte=1234))"""
+    rekaman = getattr(_lokal, 'rekaman', None)
+    if rekaman is not None:
+        rekaman.update(nilai)
+
+
+def panggil_terukur(fungsi, url, *argumen):
+    """
+    fungsi(url, *argumen) di bawah rekaman baru; mengembalikan (hasil, rekaman).
+    Dipakai di process pool, lalu rekamannya digabung di proses utama.
+    """
+    with rekam(url) as rekaman:
+        hasil = fungsi(url, *argumen)
+    return hasil, rekaman
+
+
+def persentil(nilai, p):
+    """Persentil p (0-100) dengan interpolasi linear"""
+    nilai = sorted(nilai)
+    if not nilai:
+        return 0.0
+    posisi = (len(nilai) - 1) * p / 100
+    bawah = int(posisi)
+    atas = min(bawah + 1, len(nilai) - 1)
+    return nilai[bawah] + (nilai[atas] - nilai[bawah]) * (posisi - bawah)
+
+
+class PerekamPerforma:
+    def __init__(self):
+        """Kumpulan rekaman performa per URL (thread-safe)"""
+        self._lock = threading.Lock()
+        self._rekaman = {}
+
+    def tambah(self, rekaman):
+        with self._lock:
+            self._rekaman[rekaman['url']] = rekaman
+
+    def gabung(self, url, rekaman_lain, error=None):
+        """Menambahkan fase dari rekaman lain (mis. hasil process pool) ke rekaman URL"""
+        with self._lock:
+            rekaman = self._rekaman.setdefault(str(url), _rekaman_baru(url))
+            for fase in FASE + ('total',):
+                rekaman[fase] += rekaman_lain.get(fase, 0.0)
+            if error and not rekaman['error']:
+                rekaman['error'] = str(error)
+
+    def daftar(self):
+        """Semua rekaman (salinan), urut sesuai waktu dicatat"""
+        with self._lock:
+            return [dict(r) for r in self._rekaman.values()]
+
+    def __len__(self):
+        return len(self._rekaman)
+
+    @staticmethod
+    def _baris_ekspor(rekaman):
+        baris = {k: rekaman[k] for k in ('url', 'domain', 'sumber', 'status', 'byte', 'error')}
+        for fase in FASE + ('total',):
+            baris[f"{fase}_ms"] = round(rekaman[fase] * 1000, 2)
+        return baris
+
+    def ringkasan_domain(self):
+        """p50/p95 total dan per fase (ms) untuk setiap domain, domain paling lambat (p95) dulu"""
+        per_domain = defaultdict(list)
+        for rekaman in self.daftar():
+            per_domain[rekaman['domain']].append(rekaman)
+        ringkasan = []
+        for domain, daftar in per_domain.items():
+            item = {'domain': domain, 'jumlah': len(daftar), 'byte': sum(r['byte'] for r in daftar)}
+            for fase in FASE + ('total',):
+                nilai = [r[fase] * 1000 for r in daftar]
+                item[f"{fase}_p50"] = round(persentil(nilai, 50), 2)
+                item[f"{fase}_p95"] = round(persentil(nilai, 95), 2)
+            ringkasan.append(item)
+        return sorted(ringkasan, key=lambda x: x['total_p95'], reverse=True)
+
+    def paling_lambat(self, n=10):
+        """n rekaman dengan total terlama, masing-masing dengan fase dominannya"""
+        hasil = []
+        for rekaman in sorted(self.daftar(), key=lambda r: r['total'], reverse=True)[:n]:
+            baris = self._baris_ekspor(rekaman)
+            baris['fase_dominan'] = max(FASE, key=lambda f: rekaman[f])
+            hasil.append(baris)
+        return hasil
+
+    def ekspor_csv(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            penulis = csv.DictWriter(f, fieldnames=KOLOM_EKSPOR)
+            penulis.writeheader()
+            for rekaman in self.daftar():
+                penulis.writerow(self._baris_ekspor(rekaman))
+
+    def ekspor_json(self, path):
+        data = {
+            'ringkasan_domain': self.ringkasan_domain(),
+            'paling_lambat': self.paling_lambat(),
+            'url': [self._baris_ekspor(r) for r in self.daftar()],
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,113 @@
+"""
+Pipeline dua tahap untuk scraping: unduh (I/O) -> olah (CPU).
+
+Tahap I/O mengunduh halaman secara konkuren (batas global dan per domain
+dari mesin_fetch) lalu memasukkan bytes mentah ke antrian berukuran tetap.
+Tahap CPU mengambil dari antrian dan menjalankan fungsi pengolah
+(parsing, ekstraksi tanggal, pencarian kutipan) di ProcessPoolExecutor.
+
+Jika antrian penuh, unduhan baru menunggu (backpressure) sehingga memori
+tetap terbatas. Hasil dikumpulkan berdasarkan indeks sehingga urutannya
+sama dengan urutan URL masukan.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from mesin_fetch import (KONKURENSI_DEFAULT, LAJU_PER_DOMAIN_DEFAULT, PER_DOMAIN_DEFAULT, PembatasKonkurensi,
+                         ambil_konten, panggil_terukur, perekam_performa, rencana_fetch, urutan_antar_domain)
+from performa_scrape import panggil_terukur as panggil_terukur_proses
+
+
+async def jalankan_pipeline_async(urls, pengolah, argumen=(), fetch=ambil_konten,
+                                  konkurensi=KONKURENSI_DEFAULT, per_domain=PER_DOMAIN_DEFAULT,
+                                  jumlah_proses=None, ukuran_antrian=None, progress=None,
+                                  laju_per_domain=LAJU_PER_DOMAIN_DEFAULT, normalisasi=True):
+    """Versi async dari jalankan_pipeline"""
+    urls = list(urls)
+    if not urls:
+        return []
+
+    jumlah_proses = jumlah_proses or os.cpu_count() or 1
+    ukuran_antrian = ukuran_antrian or jumlah_proses * 2
+
+    loop = asyncio.get_running_loop()
+    pembatas = PembatasKonkurensi(konkurensi, per_domain, laju_per_domain)
+    perekam = perekam_performa()
+    antrian = asyncio.Queue(maxsize=ukuran_antrian)
+    unik, peta, baris, cadangan = rencana_fetch(urls, normalisasi)
+    hasil = [None] * len(unik)
+
+    def selesai(j):
+        if progress:
+            for i in baris[j]:
+                progress(i, urls[i], hasil[j])
+
+    with ThreadPoolExecutor(max_workers=konkurensi) as pool_io, \
+            ProcessPoolExecutor(max_workers=jumlah_proses) as pool_cpu:
+
+        async def unduh(i, url):
+            async with pembatas.slot(url):
+                # URL asli berikutnya di kelompok yang sama dicoba jika unduhan gagal
+                for kandidat in [url] + cadangan[i]:
+                    try:
+                        konten = await loop.run_in_executor(pool_io, panggil_terukur, fetch, kandidat)
+                    except Exception as e:
+                        galat = e
+                    else:
+                        url = kandidat
+                        break
+                else:
+                    hasil[i] = {'success': False, 'error': str(galat)}
+                    selesai(i)
+                    return
+                # Menunggu di sini saat antrian penuh = backpressure ke tahap unduh
+                await antrian.put((i, url, konten))
+
+        async def olah():
+            while True:
+                item = await antrian.get()
+                if item is None:
+                    break
+                i, url, konten = item
+                try:
+                    if perekam is None:
+                        hasil[i] = await loop.run_in_executor(pool_cpu, pengolah, url, konten, *argumen)
+                    else:
+                        # Fase parse/ekstraksi direkam di proses pekerja lalu digabung ke rekaman fetch
+                        hasil[i], rekaman = await loop.run_in_executor(
+                            pool_cpu, panggil_terukur_proses, pengolah, url, konten, *argumen)
+                        perekam.gabung(url, rekaman, (hasil[i] or {}).get('error'))
+                except Exception as e:
+                    hasil[i] = {'success': False, 'error': str(e)}
+                    if perekam is not None:
+                        perekam.gabung(url, {}, e)
+                selesai(i)
+
+        pengolah_tasks = [asyncio.create_task(olah()) for _ in range(jumlah_proses)]
+        await asyncio.gather(*(unduh(j, unik[j]) for j in urutan_antar_domain(unik)))
+        for _ in pengolah_tasks:
+            await antrian.put(None)
+        await asyncio.gather(*pengolah_tasks)
+
+    return [hasil[j] for j in peta]
+
+
+def jalankan_pipeline(urls, pengolah, argumen=(), fetch=ambil_konten,
+                      konkurensi=KONKURENSI_DEFAULT, per_domain=PER_DOMAIN_DEFAULT,
+                      jumlah_proses=None, ukuran_antrian=None, progress=None,
+                      laju_per_domain=LAJU_PER_DOMAIN_DEFAULT, normalisasi=True):
+    """
+    Mengunduh semua URL lalu menjalankan pengolah(url, konten, *argumen)
+    di process pool.
+
+    pengolah harus fungsi level modul (bisa di-pickle), misalnya
+    olah_artikel.olah_halaman. Nilai kembali berupa list sesuai urutan urls;
+    kegagalan unduh/olah menjadi {'success': False, 'error': ...}.
+    Penjadwalan antar domain, laju_per_domain, dan normalisasi/deduplikasi
+    URL sama seperti jalankan_fetch.
+    """
+    return asyncio.run(jalankan_pipeline_async(urls, pengolah, argumen, fetch, konkurensi, per_domain,
+                                               jumlah_proses, ukuran_antrian, progress, laju_per_domain,
+                                               normalisasi))
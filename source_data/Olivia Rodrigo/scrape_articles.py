@@ -1,42 +1,41 @@
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from docx import Document
 from datetime import datetime
-import time
 import re
+import argparse
+from mesin_fetch import aktifkan_arsip, aktifkan_cache, ambil_konten, jalankan_fetch, sesi
+from ekstraktor_artikel import ekstrak_artikel
+from ledger_scrape import LedgerScrape, hash_konten, jalankan_inkremental
+from indeks_kalimat import IndeksKalimat
 
 def extract_article_content(url):
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        for script in soup(["script", "style"]):
-            script.decompose()
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        return ' '.join(chunk for chunk in chunks if chunk)
-    except:
-        return None
-
-def find_quotes(text, keywords):
-    if not text:
+        konten = ambil_konten(url, timeout=10)
+        return {'success': True, 'text': ekstrak_artikel(konten, url)['teks_utama'], 'hash_konten': hash_konten(konten)}
+    except Exception as e:
+        return {'success': False, 'error': str(e)}
+
+def find_quotes(indeks, text_lower, keywords):
+    """indeks: IndeksKalimat teks artikel (dibangun sekali per artikel); text_lower: teks huruf kecil"""
+    if not text_lower:
         return []
     quotes = []
-    text_lower = text.lower()
     for keyword in keywords:
         pos = text_lower.find(keyword.lower())
         if pos != -1:
-            start = max(0, pos - 200)
-            end = min(len(text), pos + len(keyword) + 200)
-            quote = text[start:end].strip()
+            # Kalimat yang memuat keyword beserta satu kalimat sebelum dan sesudahnya
+            quote = indeks.jendela(pos, 3).strip()
             if quote:
                 quotes.append(quote)
                 break
     return quotes
 
+parser = argparse.ArgumentParser(description='Scraping artikel Bank Link')
+parser.add_argument('--full-refresh', action='store_true', help='abaikan ledger dan scraping ulang semua URL')
+parser.add_argument('--arsip', action='store_true', help='rekam HTML mentah ke arsip (butuh zstandard) agar bisa diproses ulang dengan --from-archive')
+parser.add_argument('--from-archive', action='store_true', help='proses ulang dari arsip HTML mentah tanpa jaringan')
+args = parser.parse_args()
+
 excel_file = '/home/mahatma/belajar_python_mahatma/source_data/Olivia Rodrigo/Bank Link.xlsx'
 df = pd.read_excel(excel_file)
 
@@ -49,21 +48,30 @@ total = len(df)
 
 print(f"Memproses {total} URL...\n")
 
-for idx, row in df.iterrows():
+rows = [(idx, row) for idx, row in df.iterrows() if not pd.isna(row.get('Bank Link'))]
+aktifkan_cache()  # rerun hanya merevalidasi halaman, tidak mengunduh ulang
+if args.arsip or args.from_archive:
+    aktifkan_arsip(putar=args.from_archive)
+# Ledger: rerun hanya mengambil URL baru / gagal yang layak diulang
+ledger = LedgerScrape(tugas='scrape_articles')
+contents, ringkasan_ledger = jalankan_inkremental(
+    ledger, [row.get('Bank Link') for _, row in rows],
+    lambda urls: jalankan_fetch(urls, worker=extract_article_content),
+    full_refresh=args.full_refresh or args.from_archive, kolom=('text',))
+print(f"Diambil: {ringkasan_ledger['diambil']} URL, dari ledger: {ringkasan_ledger['dari_ledger']} URL\n")
+
+for (idx, row), hasil in zip(rows, contents):
+    content = hasil.get('text')
     url = row.get('Bank Link')
     media = row.get('Media Name', 'Unknown')
     date = row.get('Date', 'Unknown')
     
-    if pd.isna(url):
-        continue
-    
     print(f"[{idx+1}/{total}] {media}...", end=' ')
     
-    content = extract_article_content(url)
-    
     if content:
-        q1 = find_quotes(content, theme1_kw)
-        q2 = find_quotes(content, theme2_kw)
+        indeks, content_lower = IndeksKalimat(content), content.lower()
+        q1 = find_quotes(indeks, content_lower, theme1_kw)
+        q2 = find_quotes(indeks, content_lower, theme2_kw)
         
         results.append({
             'no': idx + 1,
@@ -78,8 +86,6 @@ for idx, row in df.iterrows():
     else:
         url_summary.append({'no': idx + 1, 'url': url, 'media': media, 'tanggal': date, 'status': 'Gagal'})
         print("✗")
-    
-    time.sleep(0.5)
 
 print("\nMembuat dokumen Word...")
 doc = Document()
@@ -87,7 +93,7 @@ doc = Document()
 doc.add_heading('Hasil Scraping Artikel - Analisis Tema Y2K dan Olivia Rodrigo', 0)
 
 doc.add_heading('Ringkasan URL yang Diakses', 1)
-t1 = doc.add_table(rows=1, cols=5)
+t1 = doc.add_table(rows=1, cols=7)
 t1.style = 'Light Grid Accent 1'
 h = t1.rows[0].cells
 h[0].text = 'No'
@@ -95,14 +101,19 @@ h[1].text = 'URL'
 h[2].text = 'Nama Media'
 h[3].text = 'Tanggal'
 h[4].text = 'Keterangan'
+h[5].text = 'Percobaan (Host)'
+h[6].text = 'Gagal (Host)'
 
 for item in url_summary:
+    stat_host = sesi.statistik_host(str(item['url']))
     r = t1.add_row().cells
     r[0].text = str(item['no'])
     r[1].text = str(item['url'])
     r[2].text = str(item['media'])
     r[3].text = str(item['tanggal'])
     r[4].text = item['status']
+    r[5].text = str(stat_host['percobaan'])
+    r[6].text = str(stat_host['gagal'])
 
 sukses = sum(1 for i in url_summary if i['status'] == 'Sukses')
 gagal = len(url_summary) - sukses
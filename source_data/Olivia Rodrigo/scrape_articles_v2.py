@@ -1,74 +1,67 @@
+import argparse
 import openpyxl
 from docx import Document
-import requests
-from bs4 import BeautifulSoup
-import time
 from urllib.parse import urlparse
+from mesin_fetch import aktifkan_arsip, aktifkan_cache, ambil_konten, jalankan_fetch
+from ekstraktor_artikel import TANGGAL_KOSONG, ekstrak_artikel
+
+def ambil_artikel(link):
+    """Mengambil dan mengekstrak satu artikel (dijalankan paralel oleh mesin_fetch)"""
+    artikel = ekstrak_artikel(ambil_konten(link, timeout=10, headers={'User-Agent': 'Mozilla/5.0'}), link)
+    
+    # Ambil nama media dari domain
+    domain = urlparse(link).netloc.replace('www.', '')
+    
+    # Tanggal publikasi (meta, JSON-LD, <time>, .date) sudah dicari oleh ArticleExtractor
+    date = artikel['tanggal_mentah'] or (artikel['tanggal'] if artikel['tanggal'] != TANGGAL_KOSONG else None)
+    
+    # Judul dan paragraf artikel (paragraf di nav/header/footer sudah dibuang)
+    title_text = artikel['judul_h1'] or "Tanpa Judul"
+    content = '\n\n'.join([p for p in artikel['paragraf'] if len(p) > 50])
+    
+    return {'success': True, 'domain': domain, 'date': date, 'title': title_text, 'content': content}
+
+parser = argparse.ArgumentParser(description='Ambil artikel dari Bank Link ke dokumen Word')
+parser.add_argument('--arsip', action='store_true', help='rekam HTML mentah ke arsip (butuh zstandard) agar bisa diproses ulang dengan --from-archive')
+parser.add_argument('--from-archive', action='store_true', help='proses ulang dari arsip HTML mentah tanpa jaringan')
+args = parser.parse_args()
 
 # Baca file Excel
 wb = openpyxl.load_workbook('source_data/Olivia Rodrigo/Bank Link.xlsx')
 ws = wb.active
 
+links = [str(row[0]).strip() for row in ws.iter_rows(min_row=2, values_only=True) if row[0]]
+print(f"Mengambil {len(links)} link secara paralel...")
+aktifkan_cache()  # rerun hanya merevalidasi halaman, tidak mengunduh ulang
+if args.arsip or args.from_archive:
+    aktifkan_arsip(putar=args.from_archive)
+hasil = jalankan_fetch(links, worker=ambil_artikel)
+
 # Buat dokumen Word
 doc = Document()
 doc.add_heading('Artikel dari Bank Link', 0)
 
-# Iterasi setiap baris di Excel
+# Iterasi hasil sesuai urutan baris di Excel
 counter = 1
-for row in ws.iter_rows(min_row=2, values_only=True):
-    if not row[0]:
+for link, artikel in zip(links, hasil):
+    if not artikel['success']:
+        print(f"✗ Skip: {link} - {artikel['error']}")
         continue
     
-    link = str(row[0]).strip()
-    print(f"[{counter}] Mengambil: {link}")
+    title_text = artikel['title']
+    date = artikel['date']
     
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get(link, timeout=10, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Ambil nama media dari domain
-        domain = urlparse(link).netloc.replace('www.', '')
-        
-        # Cari tanggal publikasi
-        date = None
-        date_selectors = ['time', 'meta[property="article:published_time"]', 'meta[name="publish-date"]', '.date', '.published-date']
-        for selector in date_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                date = elem.get('datetime') or elem.get('content') or elem.get_text(strip=True)
-                break
-        
-        # Hapus script dan style
-        for tag in soup(['script', 'style', 'nav', 'footer', 'header']):
-            tag.decompose()
-        
-        # Ambil judul
-        title = soup.find('h1')
-        title_text = title.get_text(strip=True) if title else "Tanpa Judul"
-        
-        # Ambil paragraf artikel
-        paragraphs = soup.find_all('p')
-        content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-        
-        # Tambahkan ke Word
-        doc.add_heading(f"{counter}. {title_text}", 1)
-        doc.add_paragraph(f"Media: {domain}")
-        doc.add_paragraph(f"Tanggal: {date if date else 'Tidak ditemukan'}")
-        doc.add_paragraph(f"Sumber: {link}")
-        doc.add_paragraph("")
-        doc.add_paragraph(content[:5000])
-        doc.add_page_break()
-        
-        print(f"✓ Berhasil: {title_text}")
-        counter += 1
-        time.sleep(1)
-        
-    except Exception as e:
-        print(f"✗ Skip: {link} - {str(e)}")
-        continue
+    # Tambahkan ke Word
+    doc.add_heading(f"{counter}. {title_text}", 1)
+    doc.add_paragraph(f"Media: {artikel['domain']}")
+    doc.add_paragraph(f"Tanggal: {date if date else 'Tidak ditemukan'}")
+    doc.add_paragraph(f"Sumber: {link}")
+    doc.add_paragraph("")
+    doc.add_paragraph(artikel['content'][:5000])
+    doc.add_page_break()
+    
+    print(f"[{counter}] ✓ Berhasil: {title_text}")
+    counter += 1
 
 # Simpan dokumen
 doc.save('Artikel_Bank_Link.docx')
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Server berita lokal pengganti situs Bank Link, untuk benchmark tanpa internet.
+
+Setiap "domain" disimulasikan sebagai satu alamat loopback 127.0.0.x
+(Linux meneruskan seluruh 127.0.0.0/8 ke lo), sehingga batas per domain,
+token bucket, dan circuit breaker di scraper ikut teruji. Server hanya
+mendengarkan di alamat loopback itu (satu socket per host, port sama),
+tidak di 0.0.0.0, jadi tidak terjangkau dari jaringan. Halaman bisa:
+- sintetis: meniru media di Bank Link (Vogue, Billboard, The Jakarta
+  Post, ...) lengkap dengan navigasi, artikel terkait, footer, meta
+  tanggal, dan paragraf artikel dengan panjang bervariasi, atau
+- rekaman: body asli dari arsip HTML (arsip_html.py) hasil scraping.
+
+Perilaku server yang bisa diatur:
+- latensi: jeda sebelum header dikirim (rata-rata + jitter acak)
+- batas_per_detik: batas request per detik per domain; kelebihannya
+  dijawab 429 dengan Retry-After
+- peluang_lambat / jeda_potongan: body dikirim per potongan kecil
+  dengan jeda di antaranya (server lambat)
+- peluang_gagal: 500/503 atau koneksi diputus tanpa respons
+
+Keputusan acak ditentukan dari seed, path, dan nomor percobaan untuk path
+itu, jadi skenario yang sama memberi pola kegagalan yang sama antar run.
+
+Cara menjalankan mandiri:
+    python3 server_berita_lokal.py --port 8765 --latensi 0.1 --peluang-gagal 0.05
+"""
+
+import argparse
+import functools
+import hashlib
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from arsip_html import ArsipHTML
+
+# Media yang dimodelkan (domain, nama situs, pola path artikel)
+MEDIA = [
+    ('vogue.com', 'Vogue', '/article/olivia-rodrigo-y2k-{n}'),
+    ('billboard.com', 'Billboard', '/music/pop/olivia-rodrigo-{n}/'),
+    ('thejakartapost.com', 'The Jakarta Post', '/culture/2024/03/0{h}/olivia-rodrigo-{n}.html'),
+    ('rollingstone.com', 'Rolling Stone', '/music/music-news/olivia-rodrigo-{n}/'),
+    ('teenvogue.com', 'Teen Vogue', '/story/olivia-rodrigo-gen-z-{n}'),
+    ('nme.com', 'NME', '/news/music/olivia-rodrigo-{n}'),
+    ('kompas.com', 'Kompas', '/hype/read/2024/03/0{h}/olivia-rodrigo-{n}'),
+    ('detik.com', 'Detik', '/hot/music/d-{n}/olivia-rodrigo'),
+    ('cnn.com', 'CNN', '/2024/03/0{h}/entertainment/olivia-rodrigo-{n}/index.html'),
+    ('bbc.com', 'BBC', '/news/entertainment-arts-{n}'),
+    ('people.com', 'People', '/olivia-rodrigo-fashion-{n}'),
+    ('elle.com', 'Elle', '/fashion/celebrity-style/a{n}/olivia-rodrigo/'),
+    ('variety.com', 'Variety', '/2024/music/news/olivia-rodrigo-{n}/'),
+    ('nylon.com', 'Nylon', '/fashion/olivia-rodrigo-y2k-{n}'),
+    ('harpersbazaar.com', "Harper's Bazaar", '/celebrity/latest/a{n}/olivia-rodrigo/'),
+    ('glamour.com', 'Glamour', '/story/olivia-rodrigo-{n}'),
+]
+
+KALIMAT = [
+    "Olivia Rodrigo has become a cultural icon for gen z listeners around the world.",
+    "Her style channels the nostalgia of the early 2000s, from low-rise jeans to butterfly clips.",
+    "Fashion critics describe the look as a Y2K revival filtered through a modern aesthetic.",
+    "The generation that grew up online sees her as a marker of identity and belonging.",
+    "Retro references in her videos echo the throwback trend sweeping social media.",
+    "As a young celebrity, her influence spans music, fashion, and the wider youth culture.",
+    "Stylists say vintage pieces from the millennium era are selling out after each appearance.",
+    "Observers call her a cultural intermediary who translates noughties style for a new audience.",
+    "The tour merchandise leans on 2000s typography and a playful, glossy color palette.",
+    "Fans on TikTok recreate her outfits, turning each concert into a Y2K fashion event.",
+]
+
+UKURAN_POTONGAN = 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def halaman_sintetis(indeks_media, nomor, seed=0):
+    """HTML artikel tiruan untuk media ke-indeks_media (bytes, deterministik)"""
+    domain, nama, _ = MEDIA[indeks_media % len(MEDIA)]
+    acak = random.Random(f"{seed}:{indeks_media}:{nomor}")
+    hari = acak.randint(1, 9)
+    paragraf = ''.join(f"<p>{' '.join(acak.sample(KALIMAT, acak.randint(2, 5)))}</p>"
+                       for _ in range(acak.randint(6, 40)))
+    navigasi = ''.join(f'<li><a href="/kategori/{i}">Fashion &amp; Trend {i}</a></li>'
+                       for i in range(acak.randint(20, 80)))
+    terkait = ''.join(f'<li><a href="/artikel/{nomor + i}">Baca juga: nostalgia Y2K dan gaya retro '
+                      f'selebriti gen z nomor {i}</a></li>' for i in range(acak.randint(5, 25)))
+    skrip = '<script>' + 'var iklan = {"slot": "atas", "ukuran": [728, 90]};' * acak.randint(10, 200) + '</script>'
+    html = (
+        f'<html><head><title>Olivia Rodrigo and the Y2K revival {nomor} | {nama}</title>'
+        f'<meta property="og:site_name" content="{nama}">'
+        f'<meta property="article:published_time" content="2024-03-0{hari}T10:00:00Z">'
+        f'<link rel="canonical" href="https://www.{domain}/artikel/{nomor}">{skrip}</head><body>'
+        f'<div class="cookie-consent"><p>We use cookies to personalise fashion and style content.</p></div>'
+        f'<nav><ul>{navigasi}</ul></nav><div class="container">'
+        f'<article class="post-content"><h1>Olivia Rodrigo brings Y2K back ({nomor})</h1>{paragraf}</article>'
+        f'<aside class="sidebar related"><ul>{terkait}</ul></aside></div>'
+        f'<footer><p>Subscribe for weekly trend, style and celebrity news.</p><ul>{navigasi}</ul></footer>'
+        f'</body></html>'
+    )
+    return html.encode('utf-8')
+
+
+class HandlerBerita(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'     # keep-alive seperti situs sungguhan
+
+    def log_message(self, format, *args):
+        pass
+
+    def _acak(self):
+        """Random deterministik dari (seed, host, path, nomor percobaan)"""
+        kunci = (self.connection.getsockname()[0], self.path)
+        with self.server.lock:
+            self.server.percobaan[kunci] += 1
+            ke = self.server.percobaan[kunci]
+        benih = hashlib.blake2b(f"{self.server.seed}:{kunci}:{ke}".encode(), digest_size=8).digest()
+        return random.Random(benih)
+
+    def _kirim(self, status, body=b'', headers=None, lambat=False):
+        self.server.catat(status)
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for kunci, nilai in (headers or {}).items():
+            self.send_header(kunci, nilai)
+        self.end_headers()
+        if not lambat:
+            self.wfile.write(body)
+            return
+        for awal in range(0, len(body), UKURAN_POTONGAN):
+            self.wfile.write(body[awal:awal + UKURAN_POTONGAN])
+            self.wfile.flush()
+            time.sleep(self.server.jeda_potongan)
+
+    def do_GET(self):
+        server = self.server
+        acak = self._acak()
+        host = self.connection.getsockname()[0]
+
+        if not server.boleh_lewat(host):
+            self._kirim(429, b'Too Many Requests', {'Retry-After': '1'})
+            return
+
+        time.sleep(max(0.0, server.latensi + acak.uniform(-server.jitter, server.jitter)))
+
+        if acak.random() < server.peluang_gagal:
+            if acak.random() < 0.5:
+                server.catat('putus')
+                self.close_connection = True      # koneksi ditutup tanpa respons
+                return
+            self._kirim(acak.choice((500, 503)), b'Server Error')
+            return
+
+        body = server.halaman(host, self.path)
+        if body is None:
+            self._kirim(404, b'Not Found')
+            return
+        self._kirim(200, body, lambat=acak.random() < server.peluang_lambat)
+
+
+class _ServerDasar(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # Klien yang memutus koneksi (timeout, retry) adalah bagian dari skenario, bukan error server
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _PendengarHost(_ServerDasar):
+    """Socket dengar tambahan untuk host 127.0.0.x; state dan statistik milik server utama"""
+
+    def __init__(self, alamat, utama):
+        self.utama = utama
+        super().__init__(alamat, HandlerBerita)
+
+    def __getattr__(self, nama):
+        return getattr(self.utama, nama)
+
+
+class ServerBeritaLokal(_ServerDasar):
+    def __init__(self, port=0, latensi=0.05, jitter=0.0, batas_per_detik=None, peluang_lambat=0.0,
+                 jeda_potongan=0.05, peluang_gagal=0.0, jumlah_domain=len(MEDIA), arsip=None, seed=0):
+        """
+        Server di 127.0.0.1..127.0.0.<jumlah_domain>:port (0 = port bebas).
+        arsip: direktori arsip HTML untuk menyajikan halaman rekaman, bukan
+        halaman sintetis.
+        """
+        super().__init__(('127.0.0.1', port), HandlerBerita)
+        self.pendengar = []
+        try:
+            for i in range(2, jumlah_domain + 1):
+                self.pendengar.append(_PendengarHost((f'127.0.0.{i}', self.port), self))
+        except OSError:
+            self.server_close()
+            raise
+        self.latensi = latensi
+        self.jitter = jitter
+        self.batas_per_detik = batas_per_detik
+        self.peluang_lambat = peluang_lambat
+        self.jeda_potongan = jeda_potongan
+        self.peluang_gagal = peluang_gagal
+        self.jumlah_domain = jumlah_domain
+        self.seed = seed
+
+        self.lock = threading.Lock()
+        self.percobaan = defaultdict(int)
+        self.jendela = defaultdict(list)       # host -> waktu request dalam 1 detik terakhir
+        self.status = defaultdict(int)
+
+        self.rekaman = []
+        if arsip:
+            sumber = ArsipHTML(arsip)
+            try:
+                self.rekaman = [sumber.ambil(url)['body'] for url in sumber.daftar_url()]
+            finally:
+                sumber.tutup()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def mulai(self):
+        """Menjalankan server di thread background"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def berhenti(self):
+        self.shutdown()
+        self.server_close()
+
+    def serve_forever(self, poll_interval=0.5):
+        for pendengar in self.pendengar:
+            threading.Thread(target=pendengar.serve_forever, args=(poll_interval,), daemon=True).start()
+        super().serve_forever(poll_interval)
+
+    def shutdown(self):
+        for pendengar in self.pendengar:
+            pendengar.shutdown()
+        super().shutdown()
+
+    def server_close(self):
+        for pendengar in self.pendengar:
+            pendengar.server_close()
+        super().server_close()
+
+    def catat(self, status):
+        with self.lock:
+            self.status[status] += 1
+
+    def boleh_lewat(self, host):
+        """False jika host sudah melewati batas_per_detik dalam 1 detik terakhir"""
+        if not self.batas_per_detik:
+            return True
+        sekarang = time.monotonic()
+        with self.lock:
+            jendela = [t for t in self.jendela[host] if sekarang - t < 1.0]
+            lewat = len(jendela) < self.batas_per_detik
+            if lewat:
+                jendela.append(sekarang)
+            self.jendela[host] = jendela
+        return lewat
+
+    def halaman(self, host, path):
+        """Body untuk host (127.0.0.x) dan path, atau None jika tidak ada"""
+        nomor = path.rstrip('/').split('/')[-1].split('?')[0]
+        if self.rekaman:
+            if path.startswith('/rekaman/') and nomor.isdigit() and int(nomor) < len(self.rekaman):
+                return self.rekaman[int(nomor)]
+            return None
+        angka = ''.join(c for c in path if c.isdigit())
+        if not angka:
+            return None
+        return halaman_sintetis(int(host.rsplit('.', 1)[1]) - 1, int(angka[-6:]), self.seed)
+
+    def daftar_url(self, jumlah=None):
+        """URL artikel di server ini, tersebar bergiliran ke jumlah_domain host loopback"""
+        if self.rekaman:
+            jumlah = len(self.rekaman) if jumlah is None else min(jumlah, len(self.rekaman))
+            return [f"http://127.0.0.{(i % self.jumlah_domain) + 1}:{self.port}/rekaman/{i}"
+                    for i in range(jumlah)]
+        urls = []
+        for i in range(jumlah or 100):
+            indeks_media = i % self.jumlah_domain
+            path = MEDIA[indeks_media % len(MEDIA)][2].format(n=100000 + i, h=(i % 9) + 1)
+            urls.append(f"http://127.0.0.{indeks_media + 1}:{self.port}{path}")
+        return urls
+
+    def statistik(self):
+        """Jumlah respons per status (dan 'putus' untuk koneksi yang diputus)"""
+        with self.lock:
+            return dict(self.status)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Server berita lokal untuk benchmark scraping')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latensi', type=float, default=0.05, help='latensi rata-rata (detik)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='variasi latensi +/- (detik)')
+    parser.add_argument('--batas-per-detik', type=int, default=None, help='request/detik per domain sebelum 429')
+    parser.add_argument('--peluang-lambat', type=float, default=0.0, help='peluang body dikirim lambat')
+    parser.add_argument('--jeda-potongan', type=float, default=0.05, help='jeda antar potongan 1 KB body lambat')
+    parser.add_argument('--peluang-gagal', type=float, default=0.0, help='peluang 500/503 atau koneksi diputus')
+    parser.add_argument('--jumlah-domain', type=int, default=len(MEDIA))
+    parser.add_argument('--arsip', default=None, help='direktori arsip HTML untuk halaman rekaman')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--daftar-url', type=int, default=0, help='cetak sejumlah URL contoh lalu jalan')
+    args = parser.parse_args()
+
+    server = ServerBeritaLokal(args.port, args.latensi, args.jitter, args.batas_per_detik, args.peluang_lambat,
+                               args.jeda_potongan, args.peluang_gagal, args.jumlah_domain, args.arsip, args.seed)
+    for url in server.daftar_url(args.daftar_url) if args.daftar_url else []:
+        print(url)
+    print(f"Server berita lokal berjalan di 127.0.0.1-127.0.0.{args.jumlah_domain}:{server.port} "
+          f"(Ctrl+C untuk berhenti)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Status respons: {server.statistik()}")
+
+
+if __name__ == "__main__":
+    main()
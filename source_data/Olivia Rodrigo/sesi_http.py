@@ -0,0 +1,249 @@
+"""
+Lapisan sesi HTTP bersama untuk script scraping.
+
+- Koneksi keep-alive lewat requests.Session dengan pool per host
+- Retry dengan exponential backoff + jitter untuk 429/5xx dan timeout
+- Circuit breaker per host: host yang terus gagal dilewati sementara
+  sehingga satu situs mati tidak menghabiskan waktu seluruh run
+- Statistik percobaan dan kegagalan per host untuk laporan
+- Retry-After dari host dicatat sebagai jeda host, supaya penjadwal
+  di mesin_fetch tidak mengirim request lain ke host itu sebelum waktunya
+- Waktu DNS dan connect (TCP + TLS) tiap koneksi baru dicatat ke rekaman
+  performa yang sedang aktif (performa_scrape.py)
+"""
+
+import random
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+import performa_scrape
+
+STATUS_RETRY = {429, 500, 502, 503, 504}
+
+
+class SirkuitTerbuka(requests.exceptions.RequestException):
+    """Request tidak dikirim karena circuit breaker host sedang terbuka"""
+
+
+def nama_host(url):
+    """Host (huruf kecil) dari URL"""
+    return urlparse(str(url)).netloc.lower()
+
+
+def tunda_retry_after(response):
+    """Nilai header Retry-After dalam detik, atau None"""
+    nilai = response.headers.get('Retry-After') if response is not None else None
+    if not nilai:
+        return None
+    try:
+        return max(0.0, float(nilai))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(nilai).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    def __init__(self, ambang_gagal=3, waktu_buka=60):
+        """Circuit breaker sederhana: tertutup -> terbuka -> setengah terbuka"""
+        self.ambang_gagal = ambang_gagal
+        self.waktu_buka = waktu_buka
+        self.gagal_beruntun = 0
+        self.dibuka_pada = None
+        self.uji_berjalan = False
+
+    def boleh_request(self):
+        """True jika request boleh dikirim ke host ini"""
+        if self.dibuka_pada is None:
+            return True
+        if time.monotonic() - self.dibuka_pada < self.waktu_buka:
+            return False
+        # Setengah terbuka: izinkan satu request uji
+        if self.uji_berjalan:
+            return False
+        self.uji_berjalan = True
+        return True
+
+    def catat_sukses(self):
+        self.gagal_beruntun = 0
+        self.dibuka_pada = None
+        self.uji_berjalan = False
+
+    def lepas_uji(self):
+        """Request uji selesai tanpa hasil (mis. dibatalkan); izinkan uji berikutnya"""
+        self.uji_berjalan = False
+
+    def catat_gagal(self):
+        self.gagal_beruntun += 1
+        self.uji_berjalan = False
+        if self.gagal_beruntun >= self.ambang_gagal:
+            self.dibuka_pada = time.monotonic()
+
+
+class _KoneksiTerukur:
+    """Mixin koneksi urllib3 yang mencatat fase dns dan connect ke rekaman performa aktif"""
+
+    def _new_conn(self):
+        if not performa_scrape.aktif():
+            return super()._new_conn()
+        host = self._dns_host
+        with performa_scrape.ukur('dns'):
+            try:
+                alamat = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+            except OSError:
+                alamat = None
+        if not alamat:
+            return super()._new_conn()      # biarkan urllib3 melaporkan error resolusi seperti biasa
+        # Pakai alamat yang sudah di-resolve supaya waktu connect tidak ikut menghitung DNS lagi
+        self._dns_host = alamat[0][4][0]
+        try:
+            return super()._new_conn()
+        except NewConnectionError:
+            if len(alamat) == 1:
+                raise
+            self._dns_host = host           # coba semua alamat seperti biasa
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+
+    def connect(self):
+        with performa_scrape.ukur('connect'):
+            super().connect()
+
+
+class _KoneksiHTTPTerukur(_KoneksiTerukur, HTTPConnection):
+    pass
+
+
+class _KoneksiHTTPSTerukur(_KoneksiTerukur, HTTPSConnection):
+    pass
+
+
+class _PoolHTTPTerukur(HTTPConnectionPool):
+    ConnectionCls = _KoneksiHTTPTerukur
+
+
+class _PoolHTTPSTerukur(HTTPSConnectionPool):
+    ConnectionCls = _KoneksiHTTPSTerukur
+
+
+class AdapterTerukur(HTTPAdapter):
+    """HTTPAdapter yang memakai koneksi terukur untuk semua pool"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _PoolHTTPTerukur, 'https': _PoolHTTPSTerukur}
+
+
+class SesiHTTP:
+    def __init__(self, maks_percobaan=3, backoff_dasar=0.5, backoff_maks=30,
+                 koneksi_per_host=8, jumlah_host=64, ambang_gagal=3, waktu_buka=60):
+        """Session bersama dengan pool koneksi, retry, dan circuit breaker per host"""
+        self.maks_percobaan = maks_percobaan
+        self.backoff_dasar = backoff_dasar
+        self.backoff_maks = backoff_maks
+        self.ambang_gagal = ambang_gagal
+        self.waktu_buka = waktu_buka
+
+        self.session = requests.Session()
+        adapter = AdapterTerukur(pool_connections=jumlah_host, pool_maxsize=koneksi_per_host, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._breaker = {}
+        self._statistik = {}
+        self._jeda = {}             # host -> time.monotonic() sampai host boleh dihubungi lagi
+
+    def _host(self, host):
+        if host not in self._breaker:
+            self._breaker[host] = CircuitBreaker(self.ambang_gagal, self.waktu_buka)
+            self._statistik[host] = {'percobaan': 0, 'gagal': 0, 'diblokir': 0}
+        return self._breaker[host], self._statistik[host]
+
+    def _tunda(self, percobaan, response=None):
+        """Lama tunggu sebelum percobaan berikutnya (full jitter, hormati Retry-After)"""
+        retry_after = tunda_retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_maks)
+        return random.uniform(0, min(self.backoff_maks, self.backoff_dasar * 2 ** percobaan))
+
+    def get(self, url, **kwargs):
+        """GET dengan retry; melempar SirkuitTerbuka jika host sedang diblokir"""
+        host = nama_host(url)
+        with self._lock:
+            breaker, statistik = self._host(host)
+            if not breaker.boleh_request():
+                statistik['diblokir'] += 1
+                raise SirkuitTerbuka(f"Circuit breaker terbuka untuk {host}")
+
+        for percobaan in range(self.maks_percobaan):
+            terakhir = percobaan == self.maks_percobaan - 1
+            response = None
+            try:
+                response = self.session.get(url, **kwargs)
+                gagal = response.status_code in STATUS_RETRY
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                gagal = True
+                if terakhir:
+                    with self._lock:
+                        statistik['percobaan'] += 1
+                        statistik['gagal'] += 1
+                        breaker.catat_gagal()
+                    raise
+            except requests.exceptions.RequestException:
+                # Galat lain (TooManyRedirects, ChunkedEncodingError, InvalidURL, ...) tidak di-retry,
+                # tetapi tetap dicatat supaya request uji setengah terbuka tidak menggantung
+                with self._lock:
+                    statistik['percobaan'] += 1
+                    statistik['gagal'] += 1
+                    breaker.catat_gagal()
+                raise
+            except BaseException:
+                with self._lock:
+                    breaker.lepas_uji()
+                raise
+
+            retry_after = tunda_retry_after(response) if gagal else None
+            with self._lock:
+                statistik['percobaan'] += 1
+                if gagal:
+                    statistik['gagal'] += 1
+                if retry_after is not None:
+                    self._jeda[host] = max(self._jeda.get(host, 0), time.monotonic() + retry_after)
+                # Circuit breaker dihitung per request (setelah semua retry), bukan per percobaan
+                if not gagal:
+                    breaker.catat_sukses()
+                elif terakhir:
+                    breaker.catat_gagal()
+
+            if not gagal or terakhir:
+                return response
+            if response is not None:
+                response.close()
+            time.sleep(self._tunda(percobaan, response))
+
+    def jeda_sampai(self, url):
+        """Waktu (time.monotonic) sampai host URL boleh dihubungi lagi menurut Retry-After"""
+        with self._lock:
+            return self._jeda.get(nama_host(url), 0.0)
+
+    def statistik_host(self, url_atau_host=None):
+        """Statistik per host; jika diberi URL/host, hanya statistik host tersebut"""
+        with self._lock:
+            if url_atau_host is None:
+                return {h: dict(s) for h, s in self._statistik.items()}
+            host = nama_host(url_atau_host) if '/' in str(url_atau_host) else str(url_atau_host).lower()
+            return dict(self._statistik.get(host, {'percobaan': 0, 'gagal': 0, 'diblokir': 0}))
@@ -0,0 +1,167 @@
+"""
+Pemeringkatan kutipan: top-k kandidat berdasarkan skor relevansi.
+
+Pencarian kutipan lama mengambil dua match pertama per kata kunci dan
+tiga pertama secara keseluruhan, jadi kutipan yang dipilih bergantung
+pada urutan kata kunci dan letak di artikel, bukan pada relevansinya.
+Di sini setiap jendela kalimat yang memuat kata kunci menjadi kandidat
+dan diberi skor dari:
+- kepadatan: jumlah kemunculan kata kunci per jumlah kata di jendela
+- cakupan: bagian dari kata kunci tema yang ditemukan di artikel yang
+  juga muncul di jendela ini
+- ragam: jumlah kata kunci berbeda di jendela (jenuh di RAGAM_JENUH)
+- posisi: jendela di awal artikel (lead) sedikit diutamakan
+
+Jendela yang lebih panjang dari indeks_kalimat.PANJANG_MAKS (teks tanpa
+tanda baca) dipotong +/- KONTEKS karakter di sekitar kemunculan kata
+kunci sebelum dinilai.
+
+Kandidat dibangkitkan satu per satu dari kemunculan kata kunci (urut
+posisi) dan hanya k terbaik yang disimpan di heap berukuran k, jadi
+biayanya linear terhadap panjang teks + O(kandidat log k), tanpa
+menyimpan seluruh kandidat.
+"""
+
+import heapq
+
+from indeks_kalimat import KONTEKS, PANJANG_MAKS, IndeksKalimat
+from otomat_kata_kunci import posisi_kata_kunci
+
+BOBOT = {'kepadatan': 0.35, 'cakupan': 0.3, 'ragam': 0.2, 'posisi': 0.15}
+RAGAM_JENUH = 3
+KATA_PER_KEMUNCULAN = 10     # satu kemunculan per 10 kata = kepadatan penuh
+PANJANG_MIN = 50             # sama dengan batas kutipan lama (> 50 karakter)
+
+
+def kemunculan_terurut(teks, kata_kunci):
+    """
+    Semua kemunculan kata kunci sebagai (posisi, nomor kata) urut posisi.
+    Kemunculan yang seluruhnya berada di dalam kemunculan lain yang lebih
+    panjang ('2000' di dalam '2000s') dilewati agar tidak dihitung dua kali.
+    """
+    kata = [k.lower() for k in kata_kunci]
+    semua = heapq.merge(*([(p, -len(kata[i]), i) for p in posisi]
+                          for i, posisi in enumerate(posisi_kata_kunci(teks, kata_kunci))))
+    hasil, batas = [], 0
+    for posisi, minus_panjang, i in semua:
+        akhir = posisi - minus_panjang
+        if akhir <= batas:
+            continue
+        batas = max(batas, akhir)
+        hasil.append((posisi, i))
+    return hasil
+
+
+def skor_jendela(kepadatan, ragam, ragam_artikel, posisi_relatif, panjang):
+    """Skor 0..1 sebuah jendela kutipan dari fitur-fiturnya (kepadatan sudah 0..1)"""
+    skor = (BOBOT['kepadatan'] * min(1.0, kepadatan) +
+            BOBOT['cakupan'] * ragam / max(1, ragam_artikel) +
+            BOBOT['ragam'] * min(ragam, RAGAM_JENUH) / RAGAM_JENUH +
+            BOBOT['posisi'] * (1.0 - posisi_relatif))
+    if panjang > PANJANG_MAKS:
+        skor *= PANJANG_MAKS / panjang
+    return skor
+
+
+def ambil_teratas(kandidat, k):
+    """
+    k kandidat (skor, urutan, teks) dengan skor tertinggi, tanpa teks ganda;
+    heap min berukuran k, seri diputuskan oleh urutan yang lebih besar
+    (kandidat pemanggil memberi -posisi agar yang lebih awal menang).
+    """
+    heap, isi = [], set()
+    for item in kandidat:
+        if item[2] in isi:
+            continue
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+            isi.add(item[2])
+        elif item[:2] > heap[0][:2]:
+            isi.discard(heapq.heappushpop(heap, item)[2])
+            isi.add(item[2])
+    return [item[2] for item in sorted(heap, reverse=True)]
+
+
+def kandidat_kalimat(teks, kata_kunci, kalimat=1, rapikan=True, konteks=KONTEKS):
+    """Bangkitkan (skor, -posisi, kutipan) untuk setiap jendela kalimat yang memuat kata kunci"""
+    kemunculan = kemunculan_terurut(teks, kata_kunci)
+    if not kemunculan:
+        return
+    kata = [k.lower() for k in kata_kunci]
+    ragam_artikel = len({kata[i] for _, i in kemunculan})
+    indeks = IndeksKalimat(teks)
+
+    # Kemunculan dikelompokkan per kalimat (urut naik karena kemunculan urut posisi)
+    per_kalimat = {}
+    for posisi, i in kemunculan:
+        per_kalimat.setdefault(indeks.kalimat_ke(posisi), []).append((posisi, i))
+
+    sebelumnya = None
+    for nomor in per_kalimat:
+        jangkauan = indeks.jangkauan(nomor, kalimat)
+        if jangkauan == sebelumnya:
+            continue
+        sebelumnya = jangkauan
+        dari, sampai = jangkauan
+        semua = [k for j in range(dari, sampai + 1) for k in per_kalimat.get(j, ())]
+
+        # Jendela biasa: satu kandidat. Jendela terlalu panjang: satu potongan per
+        # kemunculan yang belum tercakup potongan sebelumnya. Awal/akhir potongan
+        # hanya bergerak maju, jadi kemunculan di [awal, akhir) dijaga dengan dua
+        # penunjuk (kiri, kanan) dan hitungan per kata kunci yang berjalan
+        batas, kiri, kanan, hitung = -1, 0, 0, {}
+        for posisi, i in semua:
+            if posisi < batas:
+                continue
+            awal, akhir = indeks.potong(indeks.awal[dari], indeks.akhir[sampai], posisi, posisi + len(kata[i]), konteks)
+            batas = akhir
+            while kanan < len(semua) and semua[kanan][0] < akhir:
+                k = kata[semua[kanan][1]]
+                hitung[k] = hitung.get(k, 0) + 1
+                kanan += 1
+            while kiri < kanan and semua[kiri][0] < awal:
+                k = kata[semua[kiri][1]]
+                hitung[k] -= 1
+                if not hitung[k]:
+                    del hitung[k]
+                kiri += 1
+            kutipan = teks[awal:akhir].strip()
+            bersih = ' '.join(kutipan.split()) if rapikan else kutipan
+            if len(bersih) <= PANJANG_MIN:
+                continue
+            kepadatan = (kanan - kiri) * KATA_PER_KEMUNCULAN / len(bersih.split())
+            skor = skor_jendela(kepadatan, len(hitung), ragam_artikel, awal / len(teks), len(bersih))
+            yield skor, -awal, bersih
+
+
+def peringkat_kutipan(teks, kata_kunci, k=3, kalimat=1, rapikan=True, konteks=KONTEKS):
+    """
+    Top-k kutipan (jendela `kalimat` kalimat) untuk satu tema, urut dari skor tertinggi.
+    konteks: +/- karakter untuk jendela yang lebih panjang dari PANJANG_MAKS.
+    """
+    return ambil_teratas(kandidat_kalimat(teks, kata_kunci, kalimat, rapikan, konteks), k)
+
+
+def frasa_teratas(teks, kata_kunci, panjang=(4, 3, 2), k=1):
+    """
+    Top-k frasa pendek (panjang kata sesuai `panjang`) yang memuat kata kunci,
+    dinilai dengan skor yang sama: frasa padat kata kunci dan memuat
+    beberapa kata kunci berbeda lebih diutamakan daripada sekadar terpendek.
+    Kepadatan frasa = bagian karakter frasa yang berupa kata kunci.
+    """
+    kata_teks = teks.split()
+    teks_kecil = teks.lower()
+    kata = [kk for kk in dict.fromkeys(kk.lower() for kk in kata_kunci) if kk in teks_kecil]
+
+    def kandidat():
+        for n in panjang:
+            for i in range(len(kata_teks) - n + 1):
+                frasa = ' '.join(kata_teks[i:i + n])
+                frasa_kecil = frasa.lower()
+                cocok = [kk for kk in kata if kk in frasa_kecil]
+                if cocok:
+                    skor = skor_jendela(sum(map(len, cocok)) / len(frasa), len(cocok), len(kata),
+                                        i / len(kata_teks), len(frasa))
+                    yield skor, -i, frasa
+
+    return ambil_teratas(kandidat(), k)
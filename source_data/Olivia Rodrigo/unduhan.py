@@ -0,0 +1,130 @@
+"""
+Pembacaan body respons HTTP secara streaming untuk mesin_fetch.
+
+Body tidak lagi dibaca sekaligus lewat response.content, tetapi per chunk:
+- dibatasi ukuran maksimum (halaman dengan aset inline berukuran besar
+  hanya diambil bagian awalnya, tempat isi artikel berada)
+- respons bukan HTML (PDF, gambar, video, ...) dilewati sebelum body dibaca
+- mode henti dini (opsional): berhenti membaca setelah </article> atau
+  setelah cukup banyak paragraf <p> diterima
+
+Body dikembalikan ke pemanggil sebagai Konten: bytes biasa yang membawa
+charset dari header Content-Type, supaya parser_html bisa mendekode
+halaman yang charset-nya hanya disebut di header HTTP.
+"""
+
+import re
+from urllib.parse import urlparse
+
+import requests
+
+BATAS_BYTE_DEFAULT = 5 * 1024 ** 2   # 5 MB
+UKURAN_CHUNK = 64 * 1024
+JUMLAH_P_CUKUP = 40
+
+TIPE_KONTEN_DIIZINKAN = ('text/html', 'application/xhtml+xml', 'text/plain', 'text/xml', 'application/xml')
+EKSTENSI_DILEWATI = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp',
+                     '.mp3', '.mp4', '.webm', '.zip', '.doc', '.docx', '.xls', '.xlsx')
+
+# Header penanda di cache: body yang disimpan tidak lengkap (nilai = alasan)
+HEADER_TERPOTONG = 'X-Unduhan-Terpotong'
+ALASAN_BATAS_BYTE = 'batas-byte'
+ALASAN_HENTI_DINI = 'henti-dini'
+
+_AKHIR_ARTIKEL = b'</article'
+_AKHIR_P = b'</p>'
+_CHARSET = re.compile(r'charset\s*=\s*["\']?([^"\';\s]+)', re.IGNORECASE)
+
+
+class KontenDilewati(requests.exceptions.RequestException):
+    """URL tidak diunduh karena jenis kontennya bukan halaman HTML"""
+
+
+class Konten(bytes):
+    """Body halaman (bytes) beserta charset dari header Content-Type (None jika tidak disebut)"""
+    charset = None
+
+
+def charset_header(headers):
+    """Charset dari header Content-Type (dict apa pun, nama header tanpa membedakan huruf), atau None"""
+    tipe = next((v for k, v in (headers or {}).items() if k.lower() == 'content-type'), '')
+    cocok = _CHARSET.search(tipe)
+    return cocok.group(1) if cocok else None
+
+
+def buat_konten(body, headers):
+    """body sebagai Konten dengan charset dari headers"""
+    konten = Konten(body)
+    konten.charset = charset_header(headers)
+    return konten
+
+
+def periksa_url(url):
+    """Melempar KontenDilewati jika path URL jelas menunjuk file non-HTML"""
+    path = urlparse(str(url)).path.lower()
+    if path.endswith(EKSTENSI_DILEWATI):
+        raise KontenDilewati(f"Dilewati (ekstensi file): {url}")
+
+
+def periksa_tipe_konten(response):
+    """Melempar KontenDilewati jika Content-Type bukan HTML/teks (header kosong dianggap HTML)"""
+    tipe = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if tipe and not tipe.startswith(TIPE_KONTEN_DIIZINKAN):
+        response.close()
+        raise KontenDilewati(f"Dilewati (Content-Type {tipe}): {response.url}")
+
+
+class PendeteksiAkhir:
+    def __init__(self, jumlah_p=JUMLAH_P_CUKUP):
+        """Mendeteksi </article> atau jumlah </p> yang cukup di aliran chunk"""
+        self.jumlah_p = jumlah_p
+        self.p_diterima = 0
+        # Ekor chunk sebelumnya, supaya tag yang terpotong di batas chunk tetap terdeteksi
+        self.ekor = b''
+
+    def cukup(self, chunk):
+        """True jika isi artikel dianggap sudah lengkap setelah chunk ini"""
+        blok = (self.ekor + chunk).lower()
+        if _AKHIR_ARTIKEL in blok:
+            return True
+        # </p> yang seluruhnya berada di ekor sudah dihitung pada chunk sebelumnya
+        self.p_diterima += blok.count(_AKHIR_P) - self.ekor.lower().count(_AKHIR_P)
+        self.ekor = blok[-len(_AKHIR_ARTIKEL):]
+        return self.p_diterima >= self.jumlah_p
+
+
+def baca_body(response, batas_byte=BATAS_BYTE_DEFAULT, henti_dini=False, jumlah_p=JUMLAH_P_CUKUP):
+    """
+    Membaca body respons stream=True per chunk.
+
+    Mengembalikan (body, alasan_terpotong); alasan None jika body lengkap.
+    Koneksi ditutup lebih awal jika batas atau kondisi henti dini tercapai.
+    """
+    potongan = []
+    ukuran = 0
+    alasan = None
+    pendeteksi = PendeteksiAkhir(jumlah_p) if henti_dini else None
+    try:
+        for chunk in response.iter_content(UKURAN_CHUNK):
+            if batas_byte and ukuran + len(chunk) > batas_byte:
+                potongan.append(chunk[:batas_byte - ukuran])
+                alasan = ALASAN_BATAS_BYTE
+                break
+            potongan.append(chunk)
+            ukuran += len(chunk)
+            if pendeteksi and pendeteksi.cukup(chunk):
+                alasan = ALASAN_HENTI_DINI
+                break
+    finally:
+        response.close()
+    return b''.join(potongan), alasan
+
+
+def entri_cukup(entri, batas_byte=BATAS_BYTE_DEFAULT, henti_dini=False):
+    """True jika body di entri cache cukup lengkap untuk mode unduhan saat ini"""
+    alasan = next((v for k, v in entri['headers'].items() if k.lower() == HEADER_TERPOTONG.lower()), None)
+    if alasan == ALASAN_HENTI_DINI:
+        return henti_dini
+    if alasan == ALASAN_BATAS_BYTE:
+        return bool(batas_byte) and len(entri['body']) >= batas_byte
+    return True
@@ -1,21 +1,22 @@
-from docx import Document
 from collections import Counter
+import os
 import re
+import sys
 
-doc = Document('source_data/Olivia Rodrigo/Analisis_Tema_Olivia_Rodrigo_Revisi.docx')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Diseratasi'))
+from baca_docx import iter_baris_tabel
 
 tema1_text = ""
 tema2_text = ""
 
-for table in doc.tables:
-    if len(table.rows) > 0:
-        header = [cell.text.strip() for cell in table.rows[0].cells]
-        if any('Kutipan' in h or 'Tema' in h for h in header):
-            for row in table.rows[1:]:
-                cells = [cell.text.strip() for cell in row.cells]
-                if len(cells) >= 2:
-                    tema1_text += " " + cells[-2]
-                    tema2_text += " " + cells[-1]
+# Baris tabel dibaca langsung dari XML; grid=True sama dengan row.cells
+for baris in iter_baris_tabel('source_data/Olivia Rodrigo/Analisis_Tema_Olivia_Rodrigo_Revisi.docx', grid=True):
+    cells = [teks.strip() for teks in baris.sel]
+    if baris.baris == 0:
+        tabel_tema = any('Kutipan' in h or 'Tema' in h for h in cells)
+    elif tabel_tema and len(cells) >= 2:
+        tema1_text += " " + cells[-2]
+        tema2_text += " " + cells[-1]
 
 def count_words(text, keywords):
     words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())